@@ -0,0 +1,242 @@
+"""
+Benchmark of the public solver functions on generated inputs of growing sizes.
+
+    python -m aoc.bench.benchmark record                      # writes the baseline
+    python -m aoc.bench.benchmark compare --threshold 15      # exits with 1 when a solver got slower
+    python -m aoc.bench.benchmark record --case day22 --repeat 3
+
+Every case times one solver function, `--repeat` times per size, and keeps the median and the 95th percentile.
+The inputs are parsed before the timer starts, and parsed again for every run as some solvers mutate them.
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from aoc.bench.generators import GENERATORS, generate
+from aoc.runner.registry import load_solver
+
+log = logging.getLogger(__name__)
+
+DEFAULT_BASELINE_FILE = ".bench_baseline.json"
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 10.0  # percent
+DEFAULT_MIN_DELTA = 0.0005  # seconds, smaller differences are noise
+
+
+def _parsed(parsed: Any) -> Tuple:
+    return parsed,
+
+
+def _unpacked(parsed: Tuple) -> Tuple:
+    return parsed
+
+
+class BenchmarkCase(NamedTuple):
+    day: int
+    function: str
+    scales: Sequence[float] = (1, 10, 100)
+    arguments: Callable[[Any], Tuple] = _parsed
+    repeat: Optional[int] = None  # overrides the default number of runs, for the slowest cases
+
+    @property
+    def name(self) -> str:
+        return f"day{self.day}.{self.function}"
+
+
+CASES: List[BenchmarkCase] = [
+    BenchmarkCase(1, "count_increases"),
+    BenchmarkCase(1, "count_increases_by_batches", arguments=lambda depths: (depths, 3)),
+    BenchmarkCase(2, "calculate_position"),
+    BenchmarkCase(2, "calculate_position_with_aim"),
+    BenchmarkCase(3, "calculate_rate", arguments=_unpacked),
+    BenchmarkCase(3, "calculate_life_support_rating", arguments=_unpacked),
+    BenchmarkCase(4, "calculate_bingo_score", scales=(1, 10), arguments=lambda bingo: (bingo[1], bingo[0], False)),
+    BenchmarkCase(5, "calculate_overlap", scales=(1, 10), arguments=lambda vents: (vents, 2, True)),
+    BenchmarkCase(6, "count_lanternfish", arguments=lambda fishes: (fishes, 256)),
+    BenchmarkCase(7, "calculate_amount_of_fuel"),
+    BenchmarkCase(7, "calculate_amount_of_fuel_2"),
+    BenchmarkCase(8, "count_digit_part1"),
+    BenchmarkCase(8, "decode_outputs", scales=(1, 10)),
+    BenchmarkCase(9, "count_low_point", scales=(1, 3)),
+    BenchmarkCase(9, "find_largest_basins", scales=(1, 3)),
+    BenchmarkCase(10, "calculate_corrupted_score", scales=(1, 10)),
+    BenchmarkCase(10, "calculate_completion_score", scales=(1, 10)),
+    BenchmarkCase(11, "count_flashes", scales=(1, 3), arguments=lambda matrix: (matrix, 100)),
+    BenchmarkCase(12, "count_paths", scales=(1,), arguments=lambda edges: (edges, True)),
+    BenchmarkCase(13, "part_2", scales=(1, 10)),
+    BenchmarkCase(14, "generate_template", scales=(1, 10), arguments=lambda polymer: (*polymer, 40)),
+    BenchmarkCase(15, "shorted_path", scales=(1, 2)),
+    BenchmarkCase(16, "sum_versions", scales=(1, 10)),
+    BenchmarkCase(16, "evaluate", scales=(1, 10)),
+    BenchmarkCase(17, "launch_probe", scales=(1, 2)),
+    BenchmarkCase(17, "count_number_of_solutions", scales=(1, 2)),
+    BenchmarkCase(18, "do_homework", scales=(1, 2)),
+    BenchmarkCase(19, "find_beacon_coordinates", scales=(0.2, 0.4), repeat=1),
+    BenchmarkCase(20, "enhance_image", scales=(1, 2), arguments=lambda image: image),
+    BenchmarkCase(21, "solution_1", scales=(1,), arguments=_unpacked),
+    BenchmarkCase(21, "solution_2", scales=(1,), arguments=_unpacked, repeat=1),
+    BenchmarkCase(22, "count_cubes", scales=(0.25, 0.5, 1), arguments=lambda instructions: (instructions, None)),
+    BenchmarkCase(23, "organize", scales=(1,), repeat=1),
+]
+
+
+class Timing(NamedTuple):
+    median: float
+    p95: float
+
+
+# {case name: {input size: timing}}
+Results = Dict[str, Dict[str, Timing]]
+
+
+class Regression(NamedTuple):
+    case: str
+    size: str
+    baseline: float
+    current: float
+
+    @property
+    def percent(self) -> float:
+        return (self.current - self.baseline) / self.baseline * 100
+
+
+def percentile(durations: Sequence[float], rank: float) -> float:
+    ordered = sorted(durations)
+    return ordered[max(0, math.ceil(rank / 100 * len(ordered)) - 1)]
+
+
+def _input_size(case: BenchmarkCase, scale: float) -> Optional[int]:
+    puzzle_size = GENERATORS[case.day].puzzle_size
+    return None if puzzle_size is None else max(1, int(puzzle_size * scale))
+
+
+def run_case(case: BenchmarkCase, repeat: int = DEFAULT_REPEAT, seed: int = 0) -> Dict[str, Timing]:
+    solver = load_solver(case.day)
+    function = getattr(solver.module, case.function)
+    timings = {}
+    for scale in case.scales:
+        size = _input_size(case, scale)
+        lines = generate(case.day, seed=seed, size=size)
+        durations = []
+        for _ in range(case.repeat or repeat):
+            arguments = case.arguments(solver.parse(lines))
+            start = time.perf_counter()
+            function(*arguments)
+            durations.append(time.perf_counter() - start)
+
+        timings[str(size or 0)] = Timing(
+            median=statistics.median(durations),
+            p95=percentile(durations, 95)
+        )
+
+    return timings
+
+
+def run_cases(cases: List[BenchmarkCase], repeat: int = DEFAULT_REPEAT, seed: int = 0) -> Results:
+    results = {}
+    for case in cases:
+        results[case.name] = run_case(case, repeat=repeat, seed=seed)
+        for size, timing in results[case.name].items():
+            log.info(f"{case.name:<40} size {size:>7}: "
+                     f"median {timing.median * 1000:10.2f} ms, p95 {timing.p95 * 1000:10.2f} ms")
+
+    return results
+
+
+def find_regressions(baseline: Results,
+                     current: Results,
+                     threshold: float = DEFAULT_THRESHOLD,
+                     min_delta: float = DEFAULT_MIN_DELTA) -> List[Regression]:
+    regressions = []
+    for case, timings in current.items():
+        for size, timing in timings.items():
+            reference = baseline.get(case, {}).get(size)
+            if reference is None:
+                continue
+
+            regression = Regression(case=case, size=size, baseline=reference.median, current=timing.median)
+            if timing.median - reference.median > min_delta and regression.percent > threshold:
+                regressions.append(regression)
+
+    return regressions
+
+
+def save_results(path: str, results: Results):
+    with open(path, "w") as f:
+        json.dump(
+            {
+                case: {size: timing._asdict() for size, timing in timings.items()}
+                for case, timings in results.items()
+            },
+            f,
+            indent=2,
+            sort_keys=True
+        )
+
+
+def load_results(path: str) -> Results:
+    with open(path) as f:
+        raw = json.load(f)
+
+    return {
+        case: {size: Timing(**timing) for size, timing in timings.items()}
+        for case, timings in raw.items()
+    }
+
+
+def select_cases(filters: Optional[List[str]]) -> List[BenchmarkCase]:
+    if not filters:
+        return CASES
+
+    return [
+        case
+        for case in CASES
+        if any(case.name == f or case.name.startswith(f"{f}.") for f in filters)
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="aoc.bench.benchmark", description="Benchmark the solvers.")
+    parser.add_argument("mode", choices=("record", "compare"))
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_FILE, help="(default: %(default)s)")
+    parser.add_argument("--case", action="append", dest="cases",
+                        help="day (day22) or function (day22.count_cubes) to run, can be repeated")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="(default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown of the median, in percent, failing the comparison (default: %(default)s)")
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA,
+                        help="slowdown in seconds below which a case is never failed (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(stream=sys.stdout, level=logging.INFO, format="%(message)s")
+    if args.mode == "compare" and not os.path.exists(args.baseline):
+        log.error(f"no baseline at {args.baseline}, run `record` first")
+        # not a regression, the comparison could not be done
+        return 2
+
+    results = run_cases(select_cases(args.cases), repeat=args.repeat, seed=args.seed)
+    if args.mode == "record":
+        # keep the cases not run this time
+        baseline = load_results(args.baseline) if os.path.exists(args.baseline) else {}
+        baseline.update(results)
+        save_results(args.baseline, baseline)
+        return 0
+
+    regressions = find_regressions(load_results(args.baseline), results, args.threshold, args.min_delta)
+    for regression in regressions:
+        log.error(f"REGRESSION {regression.case} size {regression.size}: "
+                  f"{regression.baseline * 1000:.2f} ms -> {regression.current * 1000:.2f} ms "
+                  f"(+{regression.percent:.1f}%)")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,486 @@
+"""
+Seeded generators of synthetic puzzle inputs, one per day.
+
+Every generator produces the lines of an input file (the same format as `tests/dayN/input.txt`), from a `size`
+(the number of readings, the side of a grid, the number of scanners...) and a `random.Random`. The size at scale 1
+is roughly the size of the real puzzle input, so `generate(15, scale=10)` gives a risk grid 10 times wider and
+10 times higher than the puzzle one.
+
+    python -m aoc.bench.generators --day 22 --scale 100 --seed 3 > cuboids.txt
+"""
+import argparse
+import itertools
+import random
+import string
+import sys
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+
+class InputGenerator(NamedTuple):
+    generate: Callable[[int, random.Random], List[str]]
+    puzzle_size: Optional[int]  # None when the input can not be scaled
+
+
+def _lines(rows: List[str]) -> List[str]:
+    return [f"{row}\n" for row in rows]
+
+
+def _digit_grid(width: int, height: int, rnd: random.Random, low: int = 0, high: int = 9) -> List[str]:
+    return _lines([
+        "".join(str(rnd.randint(low, high)) for _ in range(width))
+        for _ in range(height)
+    ])
+
+
+def _sonar_sweep(size: int, rnd: random.Random) -> List[str]:
+    depth = rnd.randint(100, 200)
+    depths = []
+    for _ in range(size):
+        depth = max(0, depth + rnd.randint(-10, 15))
+        depths.append(str(depth))
+
+    return _lines(depths)
+
+
+def _dive(size: int, rnd: random.Random) -> List[str]:
+    return _lines([
+        f"{rnd.choice(('forward', 'down', 'up'))} {rnd.randint(1, 9)}"
+        for _ in range(size)
+    ])
+
+
+def _binary_diagnostic(size: int, rnd: random.Random) -> List[str]:
+    # all the codes of the width, minus at most one of every pair differing only by the last bit: any group of
+    # codes sharing a prefix keeps both bit values, so both life support ratings are always well defined
+    width = max(1, size.bit_length())
+    numbers = [
+        number
+        for pair in range(1 << (width - 1))
+        for number in rnd.choice(((2 * pair, 2 * pair + 1), (2 * pair,), (2 * pair + 1,)))
+    ]
+    rnd.shuffle(numbers)
+
+    return _lines([format(number, f"0{width}b") for number in numbers])
+
+
+def _giant_squid(size: int, rnd: random.Random) -> List[str]:
+    # the solver marks a number by adding 100 to it, so the numbers must stay below 100
+    draw = list(range(100))
+    rnd.shuffle(draw)
+    rows = [",".join(map(str, draw))]
+    for _ in range(size):
+        numbers = rnd.sample(range(100), 25)
+        rows.append("")
+        for y in range(5):
+            rows.append(" ".join(f"{n:>2}" for n in numbers[y * 5:(y + 1) * 5]))
+
+    return _lines(rows)
+
+
+def _hydrothermal_venture(size: int, rnd: random.Random, extent: int = 1000) -> List[str]:
+    vents = []
+    for _ in range(size):
+        x1, y1 = rnd.randrange(extent), rnd.randrange(extent)
+        kind = rnd.randrange(3)
+        if kind == 0:
+            x2, y2 = x1, rnd.randrange(extent)
+        elif kind == 1:
+            x2, y2 = rnd.randrange(extent), y1
+        else:
+            length = rnd.randrange(min(x1, y1, extent - 1 - x1, extent - 1 - y1) + 1)
+            x2 = x1 + rnd.choice((-1, 1)) * length
+            y2 = y1 + rnd.choice((-1, 1)) * length
+        vents.append(f"{x1},{y1} -> {x2},{y2}")
+
+    return _lines(vents)
+
+
+def _lanternfish(size: int, rnd: random.Random) -> List[str]:
+    return _lines([",".join(str(rnd.randint(1, 5)) for _ in range(size))])
+
+
+def _the_treachery_of_wales(size: int, rnd: random.Random) -> List[str]:
+    return _lines([",".join(str(int(rnd.expovariate(1 / 400))) for _ in range(size))])
+
+
+DIGIT_SEGMENTS = ["abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg", "abcdfg"]
+
+
+def _seven_segment_search(size: int, rnd: random.Random) -> List[str]:
+    entries = []
+    for _ in range(size):
+        wires = dict(zip("abcdefg", rnd.sample("abcdefg", 7)))
+
+        def _scramble(digit: int) -> str:
+            return "".join(rnd.sample([wires[s] for s in DIGIT_SEGMENTS[digit]], len(DIGIT_SEGMENTS[digit])))
+
+        signals = [_scramble(digit) for digit in rnd.sample(range(10), 10)]
+        outputs = [_scramble(rnd.randrange(10)) for _ in range(4)]
+        entries.append(f"{' '.join(signals)} | {' '.join(outputs)}")
+
+    return _lines(entries)
+
+
+def _ridges(length: int, rnd: random.Random) -> Set[int]:
+    ridges = set()
+    position = rnd.randint(0, 4)
+    while position < length:
+        ridges.add(position)
+        position += rnd.randint(3, 10)
+
+    return ridges
+
+
+def _smoke_basin(size: int, rnd: random.Random) -> List[str]:
+    # basins are closed by ridges of 9, so they stay small like in the puzzle, whatever the size of the map
+    rows_of_9 = _ridges(size, rnd)
+    cols_of_9 = _ridges(size, rnd)
+    return _lines([
+        "".join(
+            "9" if y in rows_of_9 or x in cols_of_9 else str(rnd.randint(0, 8))
+            for x in range(size)
+        )
+        for y in range(size)
+    ])
+
+
+CHUNKS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+def _syntax_scoring(size: int, rnd: random.Random) -> List[str]:
+    lines = []
+    for _ in range(size):
+        line = []
+        stack = []
+        for _ in range(rnd.randint(20, 110)):
+            if stack and rnd.random() < 0.45:
+                line.append(CHUNKS[stack.pop()])
+            else:
+                opening = rnd.choice("([{<")
+                stack.append(opening)
+                line.append(opening)
+        if not stack:
+            stack.append("(")
+            line.append("(")
+        if rnd.random() < 0.5:
+            # corrupted line: ends with a closing character not matching the last opened chunk
+            expected = CHUNKS[stack[-1]]
+            line.append(rnd.choice([c for c in CHUNKS.values() if c != expected]))
+        lines.append("".join(line))
+
+    return _lines(lines)
+
+
+def _dumbo_octopus(size: int, rnd: random.Random) -> List[str]:
+    # unlike the puzzle grid, a random grid may never flash all at once: only the first part can be driven by it
+    return _digit_grid(size, size, rnd)
+
+
+def _passage_pathing(size: int, rnd: random.Random) -> List[str]:
+    # the number of paths is exponential in the number of caves, so the sizes must stay close to the puzzle one
+    names = ["".join(letters) for letters in itertools.product(string.ascii_lowercase, repeat=2)]
+    nb_big = max(1, size // 4)
+    if size + nb_big > len(names):
+        raise ValueError(f"{size} small and {nb_big} big caves do not fit in the {len(names)} two-letter names")
+    small = rnd.sample(names, size)
+    big = [name.upper() for name in rnd.sample([n for n in names if n not in small], nb_big)]
+
+    edges = set()
+    for cave in small[1:]:
+        edges.add((rnd.choice(small[:small.index(cave)] + big), cave))
+    for cave in big:
+        for neighbor in rnd.sample(small, min(len(small), rnd.randint(2, 4))):
+            edges.add((cave, neighbor))
+    for terminal in ("start", "end"):
+        for neighbor in rnd.sample(small + big, min(len(small) + len(big), rnd.randint(1, 3))):
+            edges.add((terminal, neighbor))
+
+    return _lines([f"{a}-{b}" for a, b in sorted(edges)])
+
+
+def _transparent_origami(size: int,
+                         rnd: random.Random,
+                         x_folds: int = 5,
+                         y_folds: int = 7) -> List[str]:
+    widths = [40]
+    for _ in range(x_folds):
+        widths.append(2 * widths[-1] + 1)
+    heights = [6]
+    for _ in range(y_folds):
+        heights.append(2 * heights[-1] + 1)
+    width, height = widths[-1], heights[-1]
+
+    # a dot in the bottom right corner gives the full paper size, no dot can be on a fold line
+    folds_x = set(widths[:-1])
+    folds_y = set(heights[:-1])
+    cells = (width - len(folds_x)) * (height - len(folds_y))
+    if size > cells:
+        raise ValueError(f"At most {cells} dots fit outside the fold lines, got {size}")
+    dots = {(width - 1, height - 1)}
+    while len(dots) < size:
+        x, y = rnd.randrange(width), rnd.randrange(height)
+        if x not in folds_x and y not in folds_y:
+            dots.add((x, y))
+
+    instructions = [
+        f"fold along {axis}={value}"
+        for pair in itertools.zip_longest(
+            [("x", w) for w in reversed(widths[:-1])],
+            [("y", h) for h in reversed(heights[:-1])]
+        )
+        for axis, value in filter(None, pair)
+    ]
+
+    return _lines([f"{x},{y}" for x, y in dots] + [""] + instructions)
+
+
+def _extended_polymerization(size: int, rnd: random.Random) -> List[str]:
+    elements = rnd.sample(string.ascii_uppercase, 10)
+    rules = [
+        f"{a}{b} -> {rnd.choice(elements)}"
+        for a in elements
+        for b in elements
+    ]
+
+    return _lines(["".join(rnd.choice(elements) for _ in range(size)), ""] + rules)
+
+
+def _chiton(size: int, rnd: random.Random) -> List[str]:
+    return _digit_grid(size, size, rnd, low=1)
+
+
+OPERATORS = [0, 1, 2, 3, 5, 6, 7]
+COMPARISONS = {5, 6, 7}
+
+
+def _packet_bits(literals: int, rnd: random.Random, packet_type: Optional[int] = None) -> str:
+    version = format(rnd.randrange(8), "03b")
+    if literals == 1:
+        value = format(rnd.randrange(1, 1 << (4 * rnd.randint(1, 4))), "b")
+        value = value.zfill(len(value) + (-len(value) % 4))
+        groups = [value[i:i + 4] for i in range(0, len(value), 4)]
+        return version + "100" + "".join(
+            ("1" if idx < len(groups) - 1 else "0") + group
+            for idx, group in enumerate(groups)
+        )
+
+    packet_type = rnd.choice(OPERATORS) if packet_type is None else packet_type
+    count = 2 if packet_type in COMPARISONS else rnd.randint(2, min(literals, 5))
+    cuts = sorted(rnd.sample(range(1, literals), count - 1))
+    sizes = [end - start for start, end in zip([0] + cuts, cuts + [literals])]
+    sub_packets = "".join(_packet_bits(sub_size, rnd) for sub_size in sizes)
+
+    return version + format(packet_type, "03b") + "1" + format(count, "011b") + sub_packets
+
+
+def _packet_decoder(size: int, rnd: random.Random) -> List[str]:
+    # an outermost sum packet, comparisons nested anywhere would often evaluate the whole transmission to 0
+    bits = _packet_bits(size, rnd, packet_type=0) if size > 1 else _packet_bits(size, rnd)
+    bits += "0" * (-len(bits) % 4)
+    return _lines([format(int(bits, 2), f"0{len(bits) // 4}X")])
+
+
+def _trick_shot(size: int, rnd: random.Random) -> List[str]:
+    size = max(size, 40)
+    x_min = rnd.randint(int(size * 0.85), int(size * 0.95))
+    x_max = x_min + int(size * 0.25)
+    y_min = -rnd.randint(int(size * 0.6), int(size * 0.7))
+    y_max = y_min + int(size * 0.2)
+
+    return _lines([f"target area: x={x_min}..{x_max}, y={y_min}..{y_max}"])
+
+
+def _snailfish_number(depth: int, rnd: random.Random) -> str:
+    if depth == 4 or (depth > 1 and rnd.random() < 0.3):
+        return str(rnd.randint(0, 9))
+
+    return f"[{_snailfish_number(depth + 1, rnd)},{_snailfish_number(depth + 1, rnd)}]"
+
+
+def _snailfish(size: int, rnd: random.Random) -> List[str]:
+    return _lines([_snailfish_number(0, rnd) for _ in range(size)])
+
+
+def _is_even(permutation: Tuple[int, ...]) -> bool:
+    inversions = sum(1 for i, j in itertools.combinations(range(3), 2) if permutation[i] > permutation[j])
+    return inversions % 2 == 0
+
+
+# the 24 rotations are the signed permutation matrices with a determinant of 1
+ROTATIONS = [
+    [[signs[row] if col == permutation[row] else 0 for col in range(3)] for row in range(3)]
+    for permutation in itertools.permutations(range(3))
+    for signs in itertools.product((1, -1), repeat=3)
+    if (signs[0] * signs[1] * signs[2] == 1) == _is_even(permutation)
+]
+
+Point = Tuple[int, int, int]
+
+
+def _beacon_scanner(size: int,
+                    rnd: random.Random,
+                    scanner_range: int = 1000,
+                    beacons_per_scanner: int = 14,
+                    overlapping_beacons: int = 12) -> List[str]:
+    scanners: List[Point] = [(0, 0, 0)]
+    beacons = set()
+
+    def _random_beacon(low: Point, high: Point) -> Point:
+        return rnd.randint(low[0], high[0]), rnd.randint(low[1], high[1]), rnd.randint(low[2], high[2])
+
+    for _ in range(beacons_per_scanner):
+        beacons.add(_random_beacon((-scanner_range,) * 3, (scanner_range,) * 3))
+
+    # every new scanner overlaps a known one, with enough common beacons for the two to be matched
+    while len(scanners) < size:
+        parent = rnd.choice(scanners)
+        offset = tuple(rnd.randint(-scanner_range, scanner_range) for _ in range(3))
+        scanner = (parent[0] + offset[0], parent[1] + offset[1], parent[2] + offset[2])
+        low = tuple(max(p, s) - scanner_range for p, s in zip(parent, scanner))
+        high = tuple(min(p, s) + scanner_range for p, s in zip(parent, scanner))
+        for _ in range(overlapping_beacons):
+            beacons.add(_random_beacon(low, high))
+        for _ in range(beacons_per_scanner):
+            beacons.add(_random_beacon(
+                tuple(c - scanner_range for c in scanner),
+                tuple(c + scanner_range for c in scanner)
+            ))
+        scanners.append(scanner)
+
+    rows = []
+    for idx, scanner in enumerate(scanners):
+        rotation = rnd.choice(ROTATIONS)
+        visible = [
+            tuple(b - s for b, s in zip(beacon, scanner))
+            for beacon in beacons
+            if all(abs(b - s) <= scanner_range for b, s in zip(beacon, scanner))
+        ]
+        rnd.shuffle(visible)
+        if idx:
+            rows.append("")
+        rows.append(f"--- scanner {idx} ---")
+        for relative in visible:
+            # the rotation is applied backward, the solver has to find it to get back the relative position
+            local = [sum(rotation[row][col] * relative[row] for row in range(3)) for col in range(3)]
+            rows.append(",".join(map(str, local)))
+
+    return _lines(rows)
+
+
+def _trench_map(size: int, rnd: random.Random) -> List[str]:
+    algo = [rnd.choice("#.") for _ in range(512)]
+    if algo[0] == "#":
+        # otherwise the infinite image would stay lit forever
+        algo[511] = "."
+
+    return _lines(["".join(algo), ""]) + _lines([
+        "".join(rnd.choice("#.") for _ in range(size))
+        for _ in range(size)
+    ])
+
+
+def _dirac_dice(_size: int, rnd: random.Random) -> List[str]:
+    return _lines([
+        f"Player {player} starting position: {rnd.randint(1, 10)}"
+        for player in (1, 2)
+    ])
+
+
+def _cuboid(rnd: random.Random, extent: int, max_side: int) -> str:
+    ranges = []
+    for axis in "xyz":
+        start = rnd.randint(-extent, extent - 1)
+        end = min(extent, start + rnd.randint(0, max_side))
+        ranges.append(f"{axis}={start}..{end}")
+
+    return ",".join(ranges)
+
+
+def _reactor_reboot(size: int, rnd: random.Random) -> List[str]:
+    # the initialization procedure first, as in the puzzle, then the big cuboids of the reboot
+    instructions = [f"on {_cuboid(rnd, extent=50, max_side=50)}"]
+    for _ in range(max(1, size // 20) - 1):
+        instructions.append(f"{rnd.choice(('on', 'off'))} {_cuboid(rnd, extent=50, max_side=50)}")
+    for _ in range(size):
+        instructions.append(f"{rnd.choice(('on', 'on', 'off'))} {_cuboid(rnd, extent=100000, max_side=40000)}")
+
+    return _lines(instructions)
+
+
+def _amphipod(_size: int, rnd: random.Random) -> List[str]:
+    amphipods = list("AABBCCDD")
+    rnd.shuffle(amphipods)
+    top, bottom = amphipods[:4], amphipods[4:]
+
+    return _lines([
+        "#############",
+        "#...........#",
+        f"###{'#'.join(top)}###",
+        f"  #{'#'.join(bottom)}#",
+        "  #########",
+    ])
+
+
+GENERATORS: Dict[int, InputGenerator] = {
+    1: InputGenerator(_sonar_sweep, 2000),
+    2: InputGenerator(_dive, 1000),
+    3: InputGenerator(_binary_diagnostic, 1000),
+    4: InputGenerator(_giant_squid, 100),
+    5: InputGenerator(_hydrothermal_venture, 500),
+    6: InputGenerator(_lanternfish, 300),
+    7: InputGenerator(_the_treachery_of_wales, 1000),
+    8: InputGenerator(_seven_segment_search, 200),
+    9: InputGenerator(_smoke_basin, 100),
+    10: InputGenerator(_syntax_scoring, 100),
+    11: InputGenerator(_dumbo_octopus, 10),
+    12: InputGenerator(_passage_pathing, 6),
+    13: InputGenerator(_transparent_origami, 800),
+    14: InputGenerator(_extended_polymerization, 20),
+    15: InputGenerator(_chiton, 100),
+    16: InputGenerator(_packet_decoder, 60),
+    17: InputGenerator(_trick_shot, 150),
+    18: InputGenerator(_snailfish, 100),
+    19: InputGenerator(_beacon_scanner, 30),
+    20: InputGenerator(_trench_map, 100),
+    21: InputGenerator(_dirac_dice, None),
+    22: InputGenerator(_reactor_reboot, 400),
+    23: InputGenerator(_amphipod, None),
+}
+
+
+def generate(day: int, scale: float = 1, seed: int = 0, size: Optional[int] = None) -> List[str]:
+    """
+    Lines of a synthetic input for the day, `scale` times the size of the puzzle input, or of the given size.
+    """
+    generator = GENERATORS.get(day)
+    if not generator:
+        raise ValueError(f"No input generator for day {day}")
+    if size is None:
+        if generator.puzzle_size is None:
+            if scale != 1:
+                raise ValueError(f"The input of day {day} can not be scaled")
+            size = 0
+        else:
+            size = max(1, int(generator.puzzle_size * scale))
+
+    return generator.generate(size, random.Random(seed))
+
+
+def write_input(path: str, day: int, scale: float = 1, seed: int = 0, size: Optional[int] = None):
+    with open(path, "w") as f:
+        f.writelines(generate(day, scale=scale, seed=seed, size=size))
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(prog="aoc.bench.generators", description="Generate a synthetic input.")
+    parser.add_argument("--day", type=int, required=True)
+    parser.add_argument("--scale", type=float, default=1, help="multiplier of the puzzle input size")
+    parser.add_argument("--size", type=int, help="explicit size, overrides --scale")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    sys.stdout.writelines(generate(args.day, scale=args.scale, seed=args.seed, size=args.size))
+
+
+if __name__ == "__main__":
+    main()
@@ -86,12 +86,26 @@ Consider sums of a three-measurement sliding window. How many sums are larger th
 
 """
 import sys
-from typing import List
+import warnings
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from operator import gt
+from typing import Any, Dict, List, Iterable, Iterator, NamedTuple, Optional
 
+from aoc.util.backend import get_numpy, is_ndarray, numpy_enabled
 from aoc.util.circular_buffer import CircularBuffer
+from aoc.util.input import line_aligned_ranges, read_range
 
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024  # bytes
+DEFAULT_CHUNK_READINGS = 64 * 1024
+
+
+def count_increases(measurements: Iterable[int]) -> int:
+    if _is_indexable(measurements):
+        return _count_shifted_increases(measurements, 1)
 
-def count_increases(measurements: List[int]) -> int:
     increases = 0
     previous = sys.maxsize
     for measurement in measurements:
@@ -102,12 +116,16 @@ def count_increases(measurements: List[int]) -> int:
     return increases
 
 
-def count_increases_by_batches(measurements: List[int], batch_size: int) -> int:
-    initial = measurements[:batch_size]
+def count_increases_by_batches(measurements: Iterable[int], batch_size: int) -> int:
+    if _is_indexable(measurements):
+        return _count_shifted_increases(measurements, batch_size)
+
+    measurements = iter(measurements)
+    initial = list(islice(measurements, batch_size))
     previous = sum(initial)
     buffer = CircularBuffer(length=batch_size, initial=initial)
     increases = 0
-    for measurement in measurements[batch_size:]:
+    for measurement in measurements:
         prev = buffer.push(measurement)
         new_sum = previous - prev + measurement
 
@@ -116,3 +134,221 @@ def count_increases_by_batches(measurements: List[int], batch_size: int) -> int:
         previous = new_sum
 
     return increases
+
+
+def count_increases_by_window_sizes(measurements: Iterable[int],
+                                    window_sizes: Iterable[int],
+                                    chunk_size: int = DEFAULT_CHUNK_READINGS) -> Dict[int, int]:
+    """
+    `count_increases_by_batches` for several batch sizes, in one pass over the measurements.
+    They are read by chunks, and every chunk is compared for all the sizes while it is at hand, with the last
+    readings of the largest window before it, the only readings kept between chunks.
+    """
+    sizes = sorted(set(window_sizes))
+    if not sizes or sizes[0] <= 0:
+        raise ValueError(f'window sizes must be positive, got {sizes}')
+
+    largest = sizes[-1]
+    increases = dict.fromkeys(sizes, 0)
+    previous = None
+    for chunk in _chunks(measurements, chunk_size):
+        if previous is None:
+            previous = chunk[:0]
+        readings = get_numpy().concatenate((previous, chunk)) if is_ndarray(chunk) else previous + chunk
+        for size in sizes:
+            # only the readings of the chunk are compared, the previous ones were by the previous chunks
+            increases[size] += _count_shifted_increases(readings, size, start=len(previous))
+        previous = readings[-largest:]
+
+    return increases
+
+
+def _chunks(measurements: Iterable[int], chunk_size: int) -> Iterator[Any]:
+    """
+    Slices of a list or an array, lists of the readings of the other iterables.
+    """
+    if isinstance(measurements, (list, array)) or is_ndarray(measurements):
+        for start in range(0, len(measurements), chunk_size):
+            yield measurements[start:start + chunk_size]
+        return
+
+    measurements = iter(measurements)
+    while True:
+        chunk = list(islice(measurements, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class SonarCounter:
+    """
+    Online `count_increases_by_batches` for several batch sizes, fed with the readings as they arrive.
+    Only the last readings of the largest window are kept, in a circular buffer: a window sum increases when
+    the reading entering it is greater than the one leaving it, so each push costs one comparison per window size.
+    """
+    def __init__(self, window_sizes: Iterable[int] = (1, 3)):
+        self._sizes = sorted(set(window_sizes))
+        if not self._sizes or self._sizes[0] <= 0:
+            raise ValueError(f'window sizes must be positive, got {self._sizes}')
+
+        self._buffer = CircularBuffer(length=self._sizes[-1])
+        self._increases = dict.fromkeys(self._sizes, 0)
+        self._readings = 0
+
+    @property
+    def readings(self) -> int:
+        return self._readings
+
+    @property
+    def increases(self) -> Dict[int, int]:
+        return dict(self._increases)
+
+    def push(self, reading: int):
+        peek, increases = self._buffer.peek, self._increases
+        for size in self._sizes:
+            if size > self._readings:
+                # the windows of this size and the larger ones are not all filled yet
+                break
+            if reading > peek(size):
+                increases[size] += 1
+
+        self._buffer.push(reading)
+        self._readings += 1
+
+    def extend(self, readings: Iterable[int]):
+        push = self.push
+        for reading in readings:
+            push(reading)
+
+
+def _is_indexable(measurements: Iterable[int]) -> bool:
+    return isinstance(measurements, Sequence) or is_ndarray(measurements)
+
+
+def _count_shifted_increases(readings: Any, batch_size: int, start: int = 0) -> int:
+    """
+    A window sum increases when the reading entering the window is greater than the one leaving it,
+    `batch_size` readings before: the readings are compared with themselves shifted, without summing the windows.
+    Only the readings from `start` on are compared with the previous ones.
+    """
+    first = max(batch_size, start)
+    if is_ndarray(readings):
+        return int(get_numpy().count_nonzero(
+            readings[first:] > readings[first - batch_size:max(len(readings) - batch_size, 0)]
+        ))
+
+    return sum(map(gt, islice(readings, first, None), islice(readings, first - batch_size, None)))
+
+
+def parse_depths(content: bytes, use_numpy: Optional[bool] = None) -> Any:
+    """
+    Readings of a depth file, as a numpy array parsed in C when numpy is used, as an `array('q')` otherwise.
+    Both refuse a token which is not an int with a ValueError, and a reading outside of int64 with an OverflowError.
+    """
+    if numpy_enabled(use_numpy):
+        return _parse_depths_numpy(content)
+
+    return array("q", map(int, content.split()))
+
+
+def _parse_depths_numpy(content: bytes) -> Any:
+    """
+    `fromstring` only warns on a malformed token, and stops parsing there: the warning is raised instead.
+    It also saturates the readings outside of int64, so the readings at the limits are parsed again by python.
+    """
+    np = get_numpy()
+    if not content or content.isspace():
+        # parsed as a single 0
+        return np.empty(0, dtype=np.int64)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            readings = np.fromstring(content, dtype=np.int64, sep=" ")
+        except DeprecationWarning as e:
+            raise ValueError(f'malformed depths: {e}') from e
+
+    limits = np.iinfo(np.int64)
+    if np.any((readings == limits.min) | (readings == limits.max)):
+        return np.array(array("q", map(int, content.split())), dtype=np.int64)
+
+    return readings
+
+
+def read_depths(path: str, use_numpy: Optional[bool] = None) -> Any:
+    with open(path, "rb") as f:
+        return parse_depths(f.read(), use_numpy)
+
+
+class ChunkSummary(NamedTuple):
+    increases: int  # increases between the readings of the chunk
+    head: List[int]  # first `batch_size` readings, compared with the previous chunks
+    tail: List[int]  # last `batch_size` readings, compared with the next chunks
+
+
+def count_increases_in_file(path: str,
+                            batch_size: int = 1,
+                            max_workers: Optional[int] = None,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Same as `count_increases_by_batches` on the readings of the file, split in chunks of lines counted by a pool of
+    processes.
+    The windows of `batch_size` readings overlap except for their first and last readings, so a window sum increases
+    when the reading entering it is greater than the one leaving it, `batch_size` readings before: a chunk only needs
+    the last `batch_size` readings of the previous ones.
+    """
+    if batch_size <= 0:
+        raise ValueError(f'batch size must be positive, got {batch_size}')
+
+    ranges = line_aligned_ranges(path, chunk_size)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        summaries = executor.map(
+            summarize_chunk,
+            repeat(path),
+            [start for start, _ in ranges],
+            [end for _, end in ranges],
+            repeat(batch_size)
+        )
+        return join_summaries(summaries, batch_size)
+
+
+def summarize_chunk(path: str, start: int, end: int, batch_size: int) -> ChunkSummary:
+    readings = parse_depths(read_range(path, start, end))
+    return ChunkSummary(
+        increases=_count_shifted_increases(readings, batch_size),
+        head=readings[:batch_size].tolist(),
+        tail=readings[-batch_size:].tolist()
+    )
+
+
+def join_summaries(summaries: Iterable[ChunkSummary], batch_size: int) -> int:
+    """
+    The summaries must be in the order of the chunks.
+    """
+    increases = 0
+    previous: List[int] = []  # last `batch_size` readings of the chunks joined so far
+    for summary in summaries:
+        joined = previous + summary.head
+        increases += summary.increases + sum(
+            joined[i] > joined[i - batch_size]
+            for i in range(max(batch_size, len(previous)), len(joined))
+        )
+        previous = (previous + summary.tail)[-batch_size:]
+
+    return increases
+
+
+def parse_input(lines: List[str]) -> List[int]:
+    return list(map(int, lines))
+
+
+def parse_stream(lines: Iterable[str]) -> Iterator[int]:
+    return map(int, lines)
+
+
+def part_1(measurements: Iterable[int]) -> int:
+    return count_increases(measurements)
+
+
+def part_2(measurements: Iterable[int]) -> int:
+    return count_increases_by_batches(measurements, batch_size=3)
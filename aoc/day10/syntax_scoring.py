@@ -108,7 +108,9 @@ middle score?
 
 
 """
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Iterable, Iterator
+
+from aoc.util.instrumentation import INSTRUMENTATION
 
 POINTS = {
     ")": 3,
@@ -132,7 +134,7 @@ PAIR = {
 }
 
 
-def calculate_corrupted_score(lines: List[str]) -> int:
+def calculate_corrupted_score(lines: Iterable[str]) -> int:
     return sum((
         _calculate_corrupted_score_for_line(line)
         for line in lines
@@ -175,12 +177,31 @@ def count_completion_contests(stack: List[str]) -> int:
     return contests
 
 
-def calculate_completion_score(lines: List[str]) -> int:
+def calculate_completion_score(lines: Iterable[str]) -> int:
     scores = []
     for line in lines:
         error, stack = _analyze_line(line)
         if not error:
             scores.append(count_completion_contests(stack))
 
-    print(sorted(scores))
+    INSTRUMENTATION.enabled and INSTRUMENTATION.count("day10.incomplete_lines", len(scores))
     return sorted(scores)[int(len(scores) / 2)]
+
+
+def parse_input(lines: List[str]) -> List[str]:
+    return [
+        line.strip()
+        for line in lines
+    ]
+
+
+def parse_stream(lines: Iterable[str]) -> Iterator[str]:
+    return (line.strip() for line in lines)
+
+
+def part_1(lines: Iterable[str]) -> int:
+    return calculate_corrupted_score(lines)
+
+
+def part_2(lines: Iterable[str]) -> int:
+    return calculate_completion_score(lines)
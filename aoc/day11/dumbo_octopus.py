@@ -308,10 +308,11 @@ Given the starting energy levels of the dumbo octopuses in your cavern, simulate
 there after 100 steps?
 
 """
-from typing import List, NamedTuple, Tuple
+from typing import List, NamedTuple, Optional, Tuple
 
-
-DEBUG = False
+from aoc.util.backend import get_numpy, numpy_enabled
+from aoc.util.instrumentation import INSTRUMENTATION
+from aoc.util.matrix import serialize_matrix
 
 
 class Coordinate(NamedTuple):
@@ -319,11 +320,15 @@ class Coordinate(NamedTuple):
     y: int
 
 
-def count_flashes(matrix: List[List[int]], nb_steps: int) -> int:
+def count_flashes(matrix: List[List[int]], nb_steps: int, use_numpy: Optional[bool] = None) -> int:
+    # a 10x10 grid is too small for numpy to be faster, it is only used when forced
+    if numpy_enabled(use_numpy, auto=False):
+        return _count_flashes_numpy(matrix, nb_steps)
+
     flashes = 0
     for step in range(nb_steps):
         flashes += _count_flashes_for_step(matrix)
-        DEBUG and print_matrix(matrix, step + 1)
+        INSTRUMENTATION.tracing and INSTRUMENTATION.trace("day11.step", step=step + 1, matrix=serialize_matrix(matrix))
 
     return flashes
 
@@ -362,14 +367,10 @@ def _apply_flash(flash: Coordinate,
     return flashes_counter, flashes_stack
 
 
-def print_matrix(matrix: List[List[int]], step: int):
-    print(f'matrix at step {step}: \n')
-    for row in matrix:
-        print("".join(map(str, row)))
-    print('\n')
+def find_all_octopus_flashes(matrix: List[List[int]], use_numpy: Optional[bool] = None) -> int:
+    if numpy_enabled(use_numpy, auto=False):
+        return _find_all_octopus_flashes_numpy(matrix)
 
-
-def find_all_octopus_flashes(matrix: List[List[int]]) -> int:
     size = len(matrix) * len(matrix[0])
     step = 0
     while True:
@@ -377,3 +378,79 @@ def find_all_octopus_flashes(matrix: List[List[int]]) -> int:
         flashes = _count_flashes_for_step(matrix)
         if flashes == size:
             return step
+
+
+def _count_flashes_numpy(matrix: List[List[int]], nb_steps: int) -> int:
+    np = get_numpy()
+    energy = np.array(matrix, dtype=np.int64)
+    flashes = 0
+    for step in range(nb_steps):
+        flashes += _count_flashes_for_step_numpy(energy)
+        INSTRUMENTATION.tracing and INSTRUMENTATION.trace(
+            "day11.step",
+            step=step + 1,
+            matrix=serialize_matrix(energy.tolist())
+        )
+
+    # the energy levels are updated in place, as in the python version
+    matrix[:] = energy.tolist()
+    return flashes
+
+
+def _find_all_octopus_flashes_numpy(matrix: List[List[int]]) -> int:
+    np = get_numpy()
+    energy = np.array(matrix, dtype=np.int64)
+    step = 0
+    while True:
+        step += 1
+        if _count_flashes_for_step_numpy(energy) == energy.size:
+            matrix[:] = energy.tolist()
+            return step
+
+
+def _count_flashes_for_step_numpy(energy) -> int:
+    """
+    The octopuses flashing together are processed as a whole: each wave adds to every octopus the number of its
+    neighbours flashing in that wave.
+    """
+    np = get_numpy()
+    energy += 1
+    flashed = np.zeros(energy.shape, dtype=bool)
+    flashing = energy > 9
+    while flashing.any():
+        flashed |= flashing
+        energy += _count_neighbours(flashing)
+        flashing = (energy > 9) & ~flashed
+
+    energy[flashed] = 0
+    return int(np.count_nonzero(flashed))
+
+
+def _count_neighbours(mask):
+    np = get_numpy()
+    height, width = mask.shape
+    padded = np.pad(mask.astype(np.int64), 1)
+    return sum(
+        padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+        for dy in (-1, 0, 1)
+        for dx in (-1, 0, 1)
+        if dy != 0 or dx != 0
+    )
+
+
+def parse_input(lines: List[str]) -> List[List[int]]:
+    return [
+        [
+            int(c)
+            for c in line.strip()
+        ]
+        for line in lines
+    ]
+
+
+def part_1(matrix: List[List[int]]) -> int:
+    return count_flashes(matrix, nb_steps=100)
+
+
+def part_2(matrix: List[List[int]]) -> int:
+    return find_all_octopus_flashes(matrix)
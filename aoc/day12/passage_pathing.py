@@ -159,10 +159,10 @@ Given these new rules, how many paths through this cave system are there?
 
 """
 from collections import defaultdict
-from typing import Tuple, List, Dict, Set
+from typing import Iterator, Tuple, List, Dict, Set
 
-
-DEBUG = False
+from aoc.util.instrumentation import INSTRUMENTATION
+from aoc.util.search import breadth_first
 
 
 class Path:
@@ -210,13 +210,10 @@ class Path:
 def count_paths(edges: List[Tuple[str, str]], joker: bool = False):
     adjacency_list = _build_adjacency_list(edges)
 
-    paths_queue: List[Path] = [
-        Path.initialize(successor, joker)
-        for successor in adjacency_list["start"]
-    ]
-    paths: List[Path] = []
-    while len(paths_queue) > 0:
-        path = paths_queue.pop(0)
+    def successors(path: Path) -> Iterator[Path]:
+        if path.finished:
+            return
+
         for successor in adjacency_list[path.current]:
             joker_consumed = False
             if successor.islower() and successor in path.seen:
@@ -225,13 +222,19 @@ def count_paths(edges: List[Tuple[str, str]], joker: bool = False):
                 else:
                     continue
 
-            new_path = path.push(successor, joker_consumed)
-            if new_path.finished:
-                paths.append(new_path)
-            else:
-                paths_queue.append(new_path)
+            yield path.push(successor, joker_consumed)
 
-    DEBUG and _print_paths(paths)
+    starts = [
+        Path.initialize(successor, joker)
+        for successor in adjacency_list["start"]
+    ]
+    paths: List[Path] = [
+        path
+        for path in breadth_first(starts, successors)
+        if path.finished
+    ]
+
+    INSTRUMENTATION.tracing and INSTRUMENTATION.trace("day12.paths", paths=sorted(repr(p) for p in paths))
     return len(paths)
 
 
@@ -246,7 +249,21 @@ def _build_adjacency_list(edges: List[Tuple[str, str]]) -> Dict[str, List[str]]:
     return adjacency_list
 
 
-def _print_paths(paths: List[Path]):
-    print(f'\nAll paths found ({len(paths)}): \n')
-    for path in sorted((repr(p) for p in paths)):
-        print(path)
+def parse_input(lines: List[str]) -> List[Tuple[str, str]]:
+    return [
+        _parse_edge(line)
+        for line in lines
+    ]
+
+
+def _parse_edge(line: str) -> Tuple[str, str]:
+    tokens = line.strip().split("-")
+    return tokens[0], tokens[1]
+
+
+def part_1(edges: List[Tuple[str, str]]) -> int:
+    return count_paths(edges)
+
+
+def part_2(edges: List[Tuple[str, str]]) -> int:
+    return count_paths(edges, joker=True)
@@ -123,84 +123,74 @@ What code do you use to activate the infrared thermal imaging camera system?
 
 
 """
-from typing import Tuple, List
+from typing import Iterable, Tuple, List
 
-from aoc.util.binary import get_bit_at
+from aoc.util.binary import BitMatrix
+from aoc.util.text import generate_paragraphs
 
 
 class Paper:
     def __init__(self, dots_coordinates: List[Tuple[int, int]]):
-        width = 0
-        height = 0
-        for x, y in dots_coordinates:
-            width = max(width, x)
-            height = max(height, y)
-
-        self._width = width + 1
-        self._paper = [0] * (height + 1)
-        for x, y in dots_coordinates:
-            self._paper[y] |= 1 << x
+        self._paper = BitMatrix.from_coordinates(dots_coordinates)
 
     def fold(self, instruction: Tuple[str, int]) -> "Paper":
         direction, value = instruction
         if direction == 'x':
-            self._vertical_fold(col=value)
+            self._paper = self._paper.fold_columns(col=value)
         else:
-            self._horizontal_fold(row=value)
+            self._paper = self._paper.fold_rows(row=value)
         return self
 
     def count_dots(self) -> int:
-        dots = 0
-        for line in self._paper:
-            dots += self._count_dots_in_line(line)
-        return dots
+        return self._paper.popcount()
 
-    def _vertical_fold(self, col: int):
-        for idx, line in enumerate(self._paper):
-            for x in range(col):
-                line |= (get_bit_at(line, x) | get_bit_at(line, self._width - 1 - x)) << x
-            self._paper[idx] = line & ((1 << col) - 1)
-        self._width = col
+    def serialize(self, padding: int = 0) -> str:
+        return self._paper.serialize(padding=padding)
 
-    def _horizontal_fold(self, row: int):
-        height = 2 * row
-        if height > len(self._paper):
-            self._paper.extend([0] * (height - len(self._paper) + 1))
+    def equals(self, other: "Paper") -> bool:
+        errors = []
+        width = self._paper.width
+        for y, line in enumerate(self._paper.rows):
+            if other._paper.rows[y] != line:
+                print(f"Line at index {y} are not equals")
+                print("expected: " + format(other._paper.rows[y], f"0{width}b"))
+                print("actual: " + format(line, f"0{width}b"))
+                errors.append(y)
 
-        for idx in range(row):
-            self._paper[idx] |= self._paper[height - idx]
+        return len(errors) == 0
 
-        del self._paper[row:]
 
-    def _count_dots_in_line(self, line: int) -> int:
-        dots = 0
-        for x in range(self._width):
-            dots += (line & 1 << x) >> x
+def parse_input(lines: List[str]) -> Tuple[List[Tuple[int, int]], List[Tuple[str, int]]]:
+    return parse_stream(lines)
 
-        return dots
 
-    def serialize(self, padding: int = 0) -> str:
-        return "\n".join((
-            self._serialize_line(line, padding)
-            for line in self._paper
-        ))
+def parse_stream(lines: Iterable[str]) -> Tuple[List[Tuple[int, int]], List[Tuple[str, int]]]:
+    """
+    The dots and the instructions are parsed paragraph by paragraph, the lines are not buffered.
+    """
+    paragraphs = generate_paragraphs(lines)
+    coordinates = []
+    for line in next(paragraphs, []):
+        x, y = line.split(",")
+        coordinates.append((int(x), int(y)))
 
-    def _serialize_line(self, line, padding: int) -> str:
-        res = ""
-        pad = " " * padding
-        for x in range(self._width):
-            bit = get_bit_at(line, x)
-            res += f"{pad}#" if bit == 1 else f"{pad}."
+    instructions = []
+    for line in next(paragraphs, []):
+        direction, value = line.strip()[11:].split("=")
+        instructions.append((direction, int(value)))
 
-        return res
+    return coordinates, instructions
 
-    def equals(self, other: "Paper") -> bool:
-        errors = []
-        for y, line in enumerate(self._paper):
-            if other._paper[y] != line:
-                print(f"Line at index {y} are not equals")
-                print("expected: " + format(other._paper[y], f"0{self._width}b"))
-                print("actual: " + format(line, f"0{self._width}b"))
-                errors.append(y)
 
-        return len(errors) == 0
+def part_1(manual: Tuple[List[Tuple[int, int]], List[Tuple[str, int]]]) -> int:
+    coordinates, instructions = manual
+    return Paper(coordinates).fold(instructions[0]).count_dots()
+
+
+def part_2(manual: Tuple[List[Tuple[int, int]], List[Tuple[str, int]]]) -> str:
+    coordinates, instructions = manual
+    paper = Paper(coordinates)
+    for instruction in instructions:
+        paper.fold(instruction)
+
+    return paper.serialize(padding=1)
@@ -70,14 +70,17 @@ element?
 
 """
 from collections import defaultdict
-from typing import Dict, Tuple
+from typing import Dict, Tuple, List
+
+from aoc.util.instrumentation import INSTRUMENTATION
+from aoc.util.memoize import BoundedCache
 
 
 def generate_template(initial: str,
                       rules: Dict[str, str],
                       nb_steps: int) -> int:
 
-    known_generation: Dict[str, Tuple[str, str]] = {}
+    known_generation = BoundedCache(name="day14.generated_pairs")
 
     # count the pairs for the initial template
     pairs: Dict[str, int] = defaultdict(int)
@@ -112,20 +115,43 @@ def generate_template(initial: str,
 
     max_occurrence, max_char = values[-1]
     min_occurrence, min_char = values[0]
-    print(f'char {max_char} found {max_occurrence} times')
-    print(f'char {min_char} found {min_occurrence} times')
-    print(f'values {values}')
+    INSTRUMENTATION.tracing and INSTRUMENTATION.trace(
+        "day14.occurrences",
+        most_common=(max_char, max_occurrence),
+        least_common=(min_char, min_occurrence),
+        values=values
+    )
 
     return max_occurrence - min_occurrence
 
 
 def _generate_pairs(pair: str,
-                    known_generations: Dict[str, Tuple[str, str]],
+                    known_generations: BoundedCache,
                     rules: Dict[str, str]) -> Tuple[str, str]:
     generated = known_generations.get(pair)
     if not generated:
         char_to_add = rules[pair]
         generated = (pair[0] + char_to_add, char_to_add + pair[1])
-        known_generations[pair] = generated
+        known_generations.put(pair, generated)
 
     return generated
+
+
+def parse_input(lines: List[str]) -> Tuple[str, Dict[str, str]]:
+    template = lines[0].strip()
+    rules = {}
+    for line in lines[2:]:
+        from_str, add_char = line.strip().split(" -> ")
+        rules[from_str] = add_char
+
+    return template, rules
+
+
+def part_1(polymer: Tuple[str, Dict[str, str]]) -> int:
+    template, rules = polymer
+    return generate_template(template, rules, nb_steps=10)
+
+
+def part_2(polymer: Tuple[str, Dict[str, str]]) -> int:
+    template, rules = polymer
+    return generate_template(template, rules, nb_steps=40)
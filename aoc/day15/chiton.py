@@ -173,10 +173,10 @@ Using the full map, what is the lowest total risk of any path from the top left
 """
 from typing import List, NamedTuple, Tuple
 
-from aoc.util.matrix import serialize_matrix
-from aoc.util.priority_queue import PriorityQueue
-
-DEBUG = False
+from aoc.util.instrumentation import INSTRUMENTATION
+from aoc.util.matrix import Grid
+from aoc.util.priority_queue import BucketQueue
+from aoc.util.search import shortest_path
 
 
 class Coordinate(NamedTuple):
@@ -188,48 +188,21 @@ def shorted_path(matrix: List[List[int]], ratio: int = 1) -> int:
     height = len(matrix) * ratio
     width = len(matrix[0]) * ratio
 
-    costs = [
-        [-1 for _ in range(width)]
-        for _ in range(height)
-    ]
-    costs[0][0] = 0
-
-    target = Coordinate(width - 1, height - 1)
-
-    def _analyze_coordinate(coordinate: Coordinate):
-        new_assignment, cost = _assign_cost(
-            costs=costs,
-            current_coordinate=coordinate,
-            current_weight=get_matrix_weight(coordinate, matrix),
-            from_cost=from_cost
-        )
-        if new_assignment:
-            to_analyze.push(coordinate, priority=cost)
-
-    to_analyze = PriorityQueue()
-    to_analyze.push(Coordinate(0, 0), priority=0)
-    while to_analyze.length() > 0:
-        c = to_analyze.pop()
-        if c == target:
-            # this is our target
-            break
-
-        from_cost = costs[c.y][c.x]
-        if c.y < height - 1:
-            _analyze_coordinate(Coordinate(c.x, c.y + 1))
+    weights = Grid(width, height)
+    for y in range(height):
+        for x in range(width):
+            weights.set(x, y, get_matrix_weight(Coordinate(x, y), matrix))
 
-        if c.y > 0:
-            _analyze_coordinate(Coordinate(c.x, c.y - 1))
+    target = len(weights) - 1
 
-        if c.x < width - 1:
-            _analyze_coordinate(Coordinate(c.x + 1, c.y))
+    def neighbours(index: int) -> List[Tuple[int, int]]:
+        return [(neighbour, weights[neighbour]) for neighbour in weights.neighbours_4(index)]
 
-        if c.x > 0:
-            _analyze_coordinate(Coordinate(c.x - 1, c.y))
+    # risk levels are 1 to 9, and popped in increasing order
+    result = shortest_path(0, target.__eq__, neighbours, frontier=BucketQueue(max_increment=9))
+    INSTRUMENTATION.enabled and INSTRUMENTATION.count("day15.expanded_cells", result.expanded)
 
-    DEBUG and print(f'\n\ncost: \n{serialize_matrix(costs)}\n\n')
-
-    return costs[-1][-1]
+    return result.cost
 
 
 def get_matrix_weight(c: Coordinate, matrix: List[List[int]]) -> int:
@@ -243,15 +216,16 @@ def get_matrix_weight(c: Coordinate, matrix: List[List[int]]) -> int:
     return ((matrix[cell_y][cell_x] - 1 + height_index + width_index) % 9) + 1
 
 
-def _assign_cost(costs: List[List[int]],
-                 current_coordinate: Coordinate,
-                 current_weight: int,
-                 from_cost: int) -> Tuple[bool, int]:
-    existing_cost = costs[current_coordinate.y][current_coordinate.x]
-    current_cost = from_cost + current_weight
-    new_assignment = existing_cost == -1
-    if new_assignment or existing_cost > current_cost:
-        costs[current_coordinate.y][current_coordinate.x] = current_cost
-        return True, current_cost
+def parse_input(lines: List[str]) -> List[List[int]]:
+    return [
+        list(map(int, line.strip()))
+        for line in lines
+    ]
+
+
+def part_1(matrix: List[List[int]]) -> int:
+    return shorted_path(matrix)
+
 
-    return False, -1
+def part_2(matrix: List[List[int]]) -> int:
+    return shorted_path(matrix, ratio=5)
@@ -368,3 +368,15 @@ def _parse_operator(version: int,
         bits_parsed += sub_bits
 
     return packet, bits_parsed
+
+
+def parse_input(lines: List[str]) -> str:
+    return lines[0].strip()
+
+
+def part_1(data_frame: str) -> int:
+    return sum_versions(data_frame)
+
+
+def part_2(data_frame: str) -> int:
+    return evaluate(data_frame)
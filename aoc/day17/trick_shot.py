@@ -245,3 +245,18 @@ def _increase_image_size(x: int, y: int, image: List[List[str]]):
     if missing_rows > 0:
         for _ in range(missing_rows):
             image.append(["."] * width)
+
+
+def parse_input(lines: List[str]) -> Tuple[int, int, int, int]:
+    raw_x, raw_y = lines[0].strip()[13:].split(", ")
+    x_min, x_max = raw_x[2:].split("..")
+    y_min, y_max = raw_y[2:].split("..")
+    return int(x_min), int(x_max), int(y_min), int(y_max)
+
+
+def part_1(target: Tuple[int, int, int, int]) -> int:
+    return launch_probe(target)
+
+
+def part_2(target: Tuple[int, int, int, int]) -> int:
+    return count_number_of_solutions(target)
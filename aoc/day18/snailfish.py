@@ -455,3 +455,22 @@ def _replace_node(node: AbstractNode, new_node: AbstractNode):
         node.parent.left = new_node
     else:
         node.parent.right = new_node
+
+
+def parse_input(lines: List[str]) -> List[str]:
+    return [line.strip() for line in lines]
+
+
+def part_1(numbers: List[str]) -> int:
+    return do_homework(numbers)
+
+
+def part_2(numbers: List[str]) -> int:
+    magnitude = 0
+    for i in range(len(numbers)):
+        for j in range(len(numbers)):
+            if i != j:
+                number = reduce_number(sum_numbers(parse(numbers[i]), parse(numbers[j])))
+                magnitude = max(magnitude, number.magnitude())
+
+    return magnitude
@@ -387,7 +387,10 @@ What is the largest Manhattan distance between any two scanners?
 
 """
 from itertools import combinations
-from typing import NamedTuple, List, Tuple, Set, Optional
+from typing import Iterable, NamedTuple, List, Tuple, Set, Optional
+
+from aoc.util.instrumentation import INSTRUMENTATION
+from aoc.util.text import generate_paragraphs
 
 
 class Coordinate(NamedTuple):
@@ -438,15 +441,21 @@ def find_beacon_coordinates(scanners: List[List[Coordinate]]) -> Tuple[List[Coor
         i = matchers.pop()
         for j in range(len(scanners)):
             if i != j and scanner_coordinates_relatives[i] is not None and scanner_coordinates_relatives[j] is None:
-                print(f"Trying to match scanner {i} with scanner {j}...")
+                INSTRUMENTATION.enabled and INSTRUMENTATION.count("day19.match_attempts")
                 scanner_i = scanners[i]
                 scanner_j = scanners[j]
-                res = find_scanner(scanner_i, scanner_j)
+                with INSTRUMENTATION.timer("day19.find_scanner"):
+                    res = find_scanner(scanner_i, scanner_j)
                 if res:
                     transformation, scanner_coordinate = res
                     scanner_coordinates_relatives[j] = (i, scanner_coordinate)
                     scanners[j] = list(map(lambda b: apply_transformation(b, transformation), scanner_j))
-                    print(f"({i}, {j}), transformation: {transformation}, coord: {scanner_coordinates_relatives[j]}")
+                    INSTRUMENTATION.tracing and INSTRUMENTATION.trace(
+                        "day19.match",
+                        scanners=(i, j),
+                        transformation=transformation,
+                        coordinate=scanner_coordinate
+                    )
                     matchers.append(j)
 
     scanner_coordinates: List[Optional[Coordinate]] = [None] * len(scanners)
@@ -468,7 +477,8 @@ def find_beacon_coordinates(scanners: List[List[Coordinate]]) -> Tuple[List[Coor
     beacons = set()
     for scanner_id, scanner_coordinate in enumerate(scanner_coordinates):
         if scanner_coordinate is None:
-            print(f"WARNING: Unable to get coordinate for scanner {scanner_id}")
+            INSTRUMENTATION.enabled and INSTRUMENTATION.count("day19.unmatched_scanners")
+            INSTRUMENTATION.tracing and INSTRUMENTATION.trace("day19.unmatched_scanner", scanner=scanner_id)
         else:
             for beacon in scanners[scanner_id]:
                 beacons.add(_relativize(beacon, scanner_coordinate))
@@ -549,3 +559,34 @@ def max_manhattan_distance(scanners: List[Coordinate]) -> int:
         _manhattan_distance(s1, s2)
         for s1, s2 in combinations(scanners, 2)
     ))
+
+
+def parse_input(lines: List[str]) -> List[List[Coordinate]]:
+    return parse_stream(lines)
+
+
+def parse_stream(lines: Iterable[str]) -> List[List[Coordinate]]:
+    """
+    The scanners are parsed paragraph by paragraph, the lines are not buffered.
+    """
+    return [_parse_scanner(paragraph) for paragraph in generate_paragraphs(lines)]
+
+
+def _parse_scanner(lines: List[str]) -> List[Coordinate]:
+    scanner = []
+    for line in lines:
+        if not line.startswith("---"):
+            x, y, z = line.split(",")
+            scanner.append(Coordinate(int(x), int(y), int(z)))
+
+    return scanner
+
+
+def part_1(scanners: List[List[Coordinate]]) -> int:
+    beacons, _ = find_beacon_coordinates(scanners)
+    return len(beacons)
+
+
+def part_2(scanners: List[List[Coordinate]]) -> int:
+    _, scanner_coordinates = find_beacon_coordinates(scanners)
+    return max_manhattan_distance(scanner_coordinates)
@@ -62,8 +62,14 @@ would have after following the planned course. What do you get if you multiply y
 final depth?
 
 """
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from typing import Tuple, Iterable
+from itertools import repeat
+from typing import Tuple, Iterable, List, Iterator, NamedTuple, Optional
+
+from aoc.util.input import line_aligned_ranges, read_range
+
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024  # bytes
 
 
 class Direction(Enum):
@@ -87,6 +93,31 @@ def calculate_position(instructions: Iterable[Tuple[Direction, int]]) -> int:
 
 
 def calculate_position_with_aim(instructions: Iterable[Tuple[Direction, int]]) -> int:
+    course = summarize_course(instructions)
+    return course.x * course.y
+
+
+class CourseSummary(NamedTuple):
+    """
+    Move of the submarine over a chunk of instructions, starting with an aim of 0.
+    """
+    x: int
+    y: int
+    aim: int
+
+    def then(self, other: "CourseSummary") -> "CourseSummary":
+        """
+        Each instruction is an affine transform of (x, y, aim), so are their compositions: the instructions of `other`
+        follow the ones of `self`, their forward moves diving by the aim reached by `self` in addition to their own.
+        """
+        return CourseSummary(
+            x=self.x + other.x,
+            y=self.y + other.y + self.aim * other.x,
+            aim=self.aim + other.aim
+        )
+
+
+def summarize_course(instructions: Iterable[Tuple[Direction, int]]) -> CourseSummary:
     x = 0
     y = 0
     aim = 0
@@ -99,4 +130,65 @@ def calculate_position_with_aim(instructions: Iterable[Tuple[Direction, int]]) -
         elif direction == Direction.up:
             aim -= value
 
-    return x * y
+    return CourseSummary(x, y, aim)
+
+
+def calculate_position_in_file(path: str,
+                               with_aim: bool = True,
+                               max_workers: Optional[int] = None,
+                               chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Same as `calculate_position_with_aim`, or `calculate_position` without `with_aim`, on the instructions of the
+    file, split in chunks of lines summarized by a pool of processes and joined in order.
+    Without aim, the depth of `calculate_position` is the aim of the summary.
+    """
+    ranges = line_aligned_ranges(path, chunk_size)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        summaries = executor.map(
+            summarize_chunk,
+            repeat(path),
+            [start for start, _ in ranges],
+            [end for _, end in ranges]
+        )
+        course = join_summaries(summaries)
+
+    return course.x * (course.y if with_aim else course.aim)
+
+
+def summarize_chunk(path: str, start: int, end: int) -> CourseSummary:
+    return summarize_course(parse_stream(read_range(path, start, end).decode().splitlines()))
+
+
+def join_summaries(summaries: Iterable[CourseSummary]) -> CourseSummary:
+    """
+    The summaries must be in the order of the chunks.
+    """
+    course = CourseSummary(0, 0, 0)
+    for summary in summaries:
+        course = course.then(summary)
+
+    return course
+
+
+def parse_input(lines: List[str]) -> List[Tuple[Direction, int]]:
+    return [
+        _parse_instruction(line)
+        for line in lines
+    ]
+
+
+def parse_stream(lines: Iterable[str]) -> Iterator[Tuple[Direction, int]]:
+    return map(_parse_instruction, lines)
+
+
+def _parse_instruction(line: str) -> Tuple[Direction, int]:
+    tokens = line.split()
+    return Direction[tokens[0]], int(tokens[1])
+
+
+def part_1(instructions: Iterable[Tuple[Direction, int]]) -> int:
+    return calculate_position(instructions)
+
+
+def part_2(instructions: Iterable[Tuple[Direction, int]]) -> int:
+    return calculate_position_with_aim(instructions)
@@ -117,7 +117,9 @@ twice, 35 pixels are lit.
 Start with the original input image and apply the image enhancement algorithm twice, being careful to account for the
 infinite size of the images. How many pixels are lit in the resulting image?
 """
-from typing import List, Tuple, Set
+from typing import List, Optional, Tuple, Set
+
+from aoc.util.backend import get_numpy, numpy_enabled
 
 
 def count_pixels(algo: List[bool],
@@ -126,12 +128,47 @@ def count_pixels(algo: List[bool],
                  width: int,
                  y_min: int,
                  height: int,
-                 number_of_steps: int = 2) -> int:
+                 number_of_steps: int = 2,
+                 use_numpy: Optional[bool] = None) -> int:
+    if numpy_enabled(use_numpy):
+        return _count_pixels_numpy(algo, image, x_min, width, y_min, height, number_of_steps)
+
     image, _, __, ___, ____ = enhance_image(algo, image, x_min, width, y_min, height, number_of_steps)
 
     return len(image)
 
 
+def _count_pixels_numpy(algo: List[bool],
+                        image: Set[Tuple[int, int]],
+                        x_min: int,
+                        width: int,
+                        y_min: int,
+                        height: int,
+                        number_of_steps: int) -> int:
+    """
+    The whole image is enhanced at once: the index of every pixel is built from 9 shifted copies of the image,
+    padded with the value of the infinite area around it.
+    """
+    np = get_numpy()
+    enhancement = np.array(algo, dtype=bool)
+    pixels = np.zeros((height, width), dtype=bool)
+    for x, y in image:
+        pixels[y - y_min, x - x_min] = True
+
+    background = False
+    for _ in range(number_of_steps):
+        padded = np.pad(pixels, 2, constant_values=background)
+        new_height, new_width = padded.shape[0] - 2, padded.shape[1] - 2
+        indexes = np.zeros((new_height, new_width), dtype=np.int64)
+        for dy in range(3):
+            for dx in range(3):
+                indexes = (indexes << 1) | padded[dy:dy + new_height, dx:dx + new_width]
+        pixels = enhancement[indexes]
+        background = bool(enhancement[511 if background else 0])
+
+    return int(np.count_nonzero(pixels))
+
+
 def enhance_image(algo: List[bool],
                   image: Set[Tuple[int, int]],
                   x_min: int,
@@ -216,3 +253,34 @@ def draw_image(image: Set[Tuple[int, int]],
         image_str += "\n"
 
     return image_str
+
+
+Image = Tuple[List[bool], Set[Tuple[int, int]], int, int, int, int]
+
+
+def parse_input(lines: List[str]) -> Image:
+    algo_str = ""
+    line_idx = 0
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line:
+            break
+        algo_str += line
+        line_idx += 1
+
+    image = set()
+    rows = [line.strip() for line in lines[line_idx + 1:] if line.strip()]
+    for y, row in enumerate(rows):
+        for x, char in enumerate(row):
+            if char == "#":
+                image.add((x, y))
+
+    return list(map(lambda c: c == "#", algo_str)), image, 0, len(rows[0]), 0, len(rows)
+
+
+def part_1(image: Image) -> int:
+    return count_pixels(*image, number_of_steps=2)
+
+
+def part_2(image: Image) -> int:
+    return count_pixels(*image, number_of_steps=50)
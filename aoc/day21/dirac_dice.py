@@ -64,7 +64,7 @@ how many universes does that player win?
 """
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import Tuple, NamedTuple, Dict, Optional
+from typing import Tuple, NamedTuple, Dict, Optional, List
 
 
 class Dice(ABC):
@@ -186,3 +186,17 @@ def _get_winner_index(game: Game) -> Optional[int]:
         return 1
 
     return None
+
+
+def parse_input(lines: List[str]) -> Tuple[int, int]:
+    return int(lines[0][28:]), int(lines[1][28:])
+
+
+def part_1(positions: Tuple[int, int]) -> int:
+    player_1, player_2 = positions
+    return solution_1(player_1, player_2)
+
+
+def part_2(positions: Tuple[int, int]) -> int:
+    player_1, player_2 = positions
+    return max(solution_2(player_1, player_2))
@@ -187,6 +187,8 @@ Starting again with all cubes off, execute all reboot steps. Afterward, consider
 """
 from typing import NamedTuple, Tuple, List, Optional
 
+from aoc.util.backend import get_numpy, numpy_enabled
+
 
 class Range(NamedTuple):
     start: int
@@ -266,7 +268,12 @@ def _volume(c: Cuboid) -> int:
     return (c.x2 - c.x1) * (c.y2 - c.y1) * (c.z2 - c.z1)
 
 
-def count_cubes(instructions: List[Instruction], zone: Optional[Tuple[Range, Range, Range]]) -> int:
+def count_cubes(instructions: List[Instruction],
+                zone: Optional[Tuple[Range, Range, Range]],
+                use_numpy: Optional[bool] = None) -> int:
+    if numpy_enabled(use_numpy):
+        return _count_cubes_numpy(instructions, zone)
+
     cuboids: List[Cuboid] = []
     for unrestricted_instruction in instructions:
         instruction = _restrict_instruction(unrestricted_instruction, zone)
@@ -280,6 +287,36 @@ def count_cubes(instructions: List[Instruction], zone: Optional[Tuple[Range, Ran
     return sum(map(_volume, cuboids))
 
 
+def _count_cubes_numpy(instructions: List[Instruction], zone: Optional[Tuple[Range, Range, Range]]) -> int:
+    """
+    Inclusion-exclusion over signed cuboids: every step cancels its intersections with the cuboids counted so far,
+    and adds itself when turning cubes on. The intersections with all the cuboids are computed at once.
+    """
+    np = get_numpy()
+    bounds = np.empty((0, 6), dtype=np.int64)  # x1, y1, z1, x2, y2, z2 as in Cuboid
+    signs = np.empty(0, dtype=np.int64)
+    for unrestricted_instruction in instructions:
+        instruction = _restrict_instruction(unrestricted_instruction, zone)
+        if not instruction:
+            continue
+
+        cuboid = np.array(_init_cuboid(instruction), dtype=np.int64)
+        lows = np.maximum(bounds[:, :3], cuboid[:3])
+        highs = np.minimum(bounds[:, 3:], cuboid[3:])
+        overlapping = np.all(lows < highs, axis=1)
+        new_bounds = [bounds, np.concatenate((lows[overlapping], highs[overlapping]), axis=1)]
+        new_signs = [signs, -signs[overlapping]]
+        if instruction.on:
+            new_bounds.append(cuboid[np.newaxis, :])
+            new_signs.append(np.ones(1, dtype=np.int64))
+        bounds = np.concatenate(new_bounds)
+        signs = np.concatenate(new_signs)
+
+    volumes = np.prod(bounds[:, 3:] - bounds[:, :3], axis=1) * signs
+    # the volumes fit in 64 bits, not necessarily their sum
+    return sum(volumes.tolist())
+
+
 def _add_cuboid(cuboid: Cuboid, existing_cuboids: List[Cuboid], index: int = 0):
     for existing_cuboid_idx in range(index, len(existing_cuboids)):
         existing_cuboid = existing_cuboids[existing_cuboid_idx]
@@ -328,3 +365,33 @@ def _restrict_range(r: Range,
         start=max(zone.start, r.start),
         end=min(zone.end, r.end),
     )
+
+
+INITIALIZATION_ZONE = (Range(-50, 50), Range(-50, 50), Range(-50, 50))
+
+
+def parse_input(lines: List[str]) -> List[Instruction]:
+    return [
+        _parse_instruction(line.strip())
+        for line in lines
+    ]
+
+
+def _parse_instruction(line: str) -> Instruction:
+    on_off, ranges = line.split()
+    x, y, z = ranges.split(",")
+
+    return Instruction(on_off == "on", _parse_range(x), _parse_range(y), _parse_range(z))
+
+
+def _parse_range(raw_range: str) -> Range:
+    start, end = raw_range[2:].split("..")
+    return Range(int(start), int(end))
+
+
+def part_1(instructions: List[Instruction]) -> int:
+    return count_cubes(instructions, INITIALIZATION_ZONE)
+
+
+def part_2(instructions: List[Instruction]) -> int:
+    return count_cubes(instructions, None)
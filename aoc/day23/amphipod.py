@@ -114,10 +114,8 @@ What is the least energy required to organize the amphipods?
 """
 from typing import List, Optional, Callable, Tuple, Dict
 
-from aoc.util.priority_queue import PriorityQueue
-
-
-DEBUG = True
+from aoc.util.instrumentation import INSTRUMENTATION
+from aoc.util.search import shortest_path
 
 
 State = Tuple[Optional[str], ...]
@@ -825,49 +823,21 @@ def _sum_distances(state: State) -> int:
 
 
 def organize(state: State, done_state: State = DONE_STATE) -> int:
-    frontier = PriorityQueue()
-    frontier.push(state, 0)
-    came_from: Dict[State, Optional[State]] = {
-        state: None
-    }
-    cost_so_far: Dict[State, int] = {
-        state: 0
-    }
-    while frontier.length() > 0:
-        current: State = frontier.pop()
-
-        if current == done_state:
-            break
-
-        # print(f"\nCurrent is:\n{serialize_state(current)}\n")
-
-        next_states = _possible_next_states(current)
-        for next_state, cost in next_states.items():
-            new_cost = cost_so_far[current] + cost
-            if next_state not in cost_so_far or new_cost < cost_so_far[next_state]:
-                cost_so_far[next_state] = new_cost
-                priority = new_cost + _heuristic(next_state)
-
-                # print(f"\npush in frontier with priority {priority}: \n{serialize_state(next_state)}\n")
-
-                frontier.push(next_state, priority)
-                came_from[next_state] = current
-
-    DEBUG and _print_path(state, done_state, came_from)
-
-    return cost_so_far[done_state]
-
-
-def _print_path(start: State, end: State, came_from: Dict[State, Optional[State]]) -> None:
-    print("\n========Winning path=========")
-    path = [end]
-    current = end
-    while current != start:
-        current = came_from[current]
-        path.append(current)
+    result = shortest_path(
+        state,
+        done_state.__eq__,
+        lambda current: _possible_next_states(current).items(),
+        heuristic=_heuristic,
+        with_path=INSTRUMENTATION.tracing
+    )
+    INSTRUMENTATION.enabled and INSTRUMENTATION.count("day23.expanded_states", result.expanded)
+    INSTRUMENTATION.enabled and INSTRUMENTATION.count("day23.pushed_states", result.pushed)
+    INSTRUMENTATION.tracing and INSTRUMENTATION.trace(
+        "day23.path",
+        states=[serialize_state(segment) for segment in result.path]
+    )
 
-    for segment in reversed(path):
-        print(f"\n{serialize_state(segment)}\n")
+    return result.cost
 
 
 def serialize_state(state: State) -> str:
@@ -881,3 +851,25 @@ def serialize_state(state: State) -> str:
 
 def _ser(val: Optional[str]) -> str:
     return val if val else "."
+
+
+# (line, column) of every cell of the state in the puzzle diagram
+DIAGRAM_POSITIONS = [
+    (1, 1), (1, 2), (2, 3), (3, 3), (1, 4), (2, 5), (3, 5), (1, 6),
+    (2, 7), (3, 7), (1, 8), (2, 9), (3, 9), (1, 10), (1, 11)
+]
+
+
+def parse_input(lines: List[str]) -> State:
+    return tuple(
+        _parse_cell(lines[line][column])
+        for line, column in DIAGRAM_POSITIONS
+    )
+
+
+def _parse_cell(val: str) -> Optional[str]:
+    return None if val == "." else val
+
+
+def part_1(state: State) -> int:
+    return organize(state)
@@ -88,18 +88,14 @@ not binary.)
 """
 from typing import List, Tuple, Literal
 
-from aoc.util.binary import get_bit_at, turn_on_bit_at
+from aoc.util.binary import BitMatrix, get_bit_at, turn_on_bit_at
 
 
 Direction = Literal[1, -1]
 
 
 def calculate_rate(numbers: List[int], length: int) -> int:
-    sums = [0] * length
-    for number in numbers:
-        for position in range(length):
-            sums[position] += get_bit_at(number, position)
-
+    sums = BitMatrix(length, numbers).column_counts()
     threshold = len(numbers) / 2
     gamma_rate = 0
     epsilon_rate = 0
@@ -152,3 +148,17 @@ def _group_by_bit(numbers: List[int], pos: int) -> Tuple[List[int], List[int]]:
         groups[bit].append(number)
 
     return groups
+
+
+def parse_input(lines: List[str]) -> Tuple[List[int], int]:
+    return [int(line, 2) for line in lines], len(lines[0].strip())
+
+
+def part_1(report: Tuple[List[int], int]) -> int:
+    numbers, length = report
+    return calculate_rate(numbers, length)
+
+
+def part_2(report: Tuple[List[int], int]) -> int:
+    numbers, length = report
+    return calculate_life_support_rating(numbers, length)
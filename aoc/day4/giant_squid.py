@@ -78,7 +78,9 @@ Figure out which board will win last. Once it wins, what would its final score b
 
 """
 from collections import defaultdict
-from typing import List, NamedTuple, Dict
+from typing import Iterable, List, NamedTuple, Dict, Tuple
+
+from aoc.util.text import generate_paragraphs
 
 Grid = List[List[int]]
 
@@ -153,3 +155,31 @@ def _calculate_sum_of_unmarked(grid: Grid) -> int:
                 res += val
 
     return res
+
+
+def parse_input(lines: List[str]) -> Tuple[List[int], List[Grid]]:
+    return parse_stream(lines)
+
+
+def parse_stream(lines: Iterable[str]) -> Tuple[List[int], List[Grid]]:
+    """
+    The boards are parsed paragraph by paragraph, the lines are not buffered.
+    """
+    paragraphs = generate_paragraphs(lines)
+    draw = [int(number) for line in next(paragraphs) for number in line.split(",")]
+    grids = [
+        [list(map(int, line.split())) for line in paragraph]
+        for paragraph in paragraphs
+    ]
+
+    return draw, grids
+
+
+def part_1(bingo: Tuple[List[int], List[Grid]]) -> int:
+    draw, grids = bingo
+    return calculate_bingo_score(grids, draw)
+
+
+def part_2(bingo: Tuple[List[int], List[Grid]]) -> int:
+    draw, grids = bingo
+    return calculate_bingo_score(grids, draw, first=False)
@@ -46,9 +46,10 @@ above example, this is anywhere in the diagram with a 2 or larger - a total of 5
 Consider only horizontal and vertical lines. At how many points do at least two lines overlap?
 
 """
-from typing import NamedTuple, Tuple, List
+from typing import NamedTuple, Tuple, List, Optional
 
-from aoc.util.matrix import initialize_matrix, IntMatrix
+from aoc.util.backend import get_numpy, numpy_enabled
+from aoc.util.matrix import Grid
 
 
 class Coordinate(NamedTuple):
@@ -61,65 +62,76 @@ Vent = Tuple[Coordinate, Coordinate]
 
 def calculate_overlap(vents: List[Vent],
                       threshold: int = 2,
-                      include_diagonals: bool = False) -> int:
+                      include_diagonals: bool = False,
+                      use_numpy: Optional[bool] = None) -> int:
     width, height = _get_matrix_size(vents)
-    matrix = initialize_matrix(fill=0, row=height, col=width)
+    if numpy_enabled(use_numpy):
+        return _calculate_overlap_numpy(vents, width, height, threshold, include_diagonals)
+
+    grid = Grid(width, height, typecode='I')
 
     res = 0
     for vent in vents:
-        res += _draw_vent(matrix, vent, threshold, include_diagonals)
+        res += _draw_vent(grid, vent, threshold, include_diagonals)
 
     return res
 
 
-def _draw_vent(matrix: IntMatrix,
+def _draw_vent(grid: Grid,
                vent: Vent,
                threshold: int,
                include_diagonals: bool) -> int:
+    start, end = vent
+    dx = _sign(end.x - start.x)
+    dy = _sign(end.y - start.y)
+    if dx != 0 and dy != 0 and not include_diagonals:
+        return 0
+
+    # horizontal, vertical and diagonal lines are all a constant step in the flat grid
+    step = dy * grid.width + dx
+    length = max(abs(end.x - start.x), abs(end.y - start.y)) + 1
+    cells = grid.cells
+    index = grid.index(start.x, start.y)
     matching_threshold = 0
-    if vent[0].x == vent[1].x:
-        if vent[0].y < vent[1].y:
-            min = vent[0].y
-            max = vent[1].y
-        else:
-            min = vent[1].y
-            max = vent[0].y
-
-        for y in range(min, max + 1):
-            matrix[y][vent[0].x] += 1
-            if matrix[y][vent[0].x] == threshold:
-                matching_threshold += 1
-    elif vent[0].y == vent[1].y:
-        if vent[0].x < vent[1].x:
-            min = vent[0].x
-            max = vent[1].x
-        else:
-            min = vent[1].x
-            max = vent[0].x
-
-        for x in range(min, max + 1):
-            matrix[vent[0].y][x] += 1
-            if matrix[vent[0].y][x] == threshold:
-                matching_threshold += 1
-    elif include_diagonals:
-        if vent[0].x < vent[1].x:
-            start = vent[0]
-            end = vent[1]
-        else:
-            start = vent[1]
-            end = vent[0]
-
-        height_increment = 1 if end.y - start.y > 0 else -1
-        y = start.y
-        for x in range(start.x, end.x + 1):
-            matrix[y][x] += 1
-            if matrix[y][x] == threshold:
-                matching_threshold += 1
-            y += height_increment
+    for _ in range(length):
+        cells[index] += 1
+        if cells[index] == threshold:
+            matching_threshold += 1
+        index += step
 
     return matching_threshold
 
 
+def _calculate_overlap_numpy(vents: List[Vent],
+                             width: int,
+                             height: int,
+                             threshold: int,
+                             include_diagonals: bool) -> int:
+    """
+    The cells of all the vents are counted at once, a cell reaching the threshold when its count does.
+    """
+    np = get_numpy()
+    indexes = []
+    for start, end in vents:
+        dx = _sign(end.x - start.x)
+        dy = _sign(end.y - start.y)
+        if dx != 0 and dy != 0 and not include_diagonals:
+            continue
+
+        steps = np.arange(max(abs(end.x - start.x), abs(end.y - start.y)) + 1)
+        indexes.append((start.y + dy * steps) * width + start.x + dx * steps)
+
+    if not indexes:
+        return 0
+
+    counts = np.bincount(np.concatenate(indexes), minlength=width * height)
+    return int(np.count_nonzero(counts >= threshold))
+
+
+def _sign(value: int) -> int:
+    return (value > 0) - (value < 0)
+
+
 def _get_matrix_size(vents: List[Vent]) -> Tuple[int, int]:
     width = 0
     height = 0
@@ -131,3 +143,28 @@ def _get_matrix_size(vents: List[Vent]) -> Tuple[int, int]:
                 height = vent[idx].y
 
     return width + 1, height + 1
+
+
+def parse_input(lines: List[str]) -> List[Vent]:
+    return [
+        _parse_vent(line)
+        for line in lines
+    ]
+
+
+def _parse_vent(line: str) -> Vent:
+    raw_start, raw_end = line.split(" -> ")
+    return _parse_coordinate(raw_start), _parse_coordinate(raw_end)
+
+
+def _parse_coordinate(raw_coordinate: str) -> Coordinate:
+    tokens = raw_coordinate.split(",")
+    return Coordinate(int(tokens[0]), int(tokens[1]))
+
+
+def part_1(vents: List[Vent]) -> int:
+    return calculate_overlap(vents)
+
+
+def part_2(vents: List[Vent]) -> int:
+    return calculate_overlap(vents, include_diagonals=True)
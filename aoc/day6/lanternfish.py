@@ -66,7 +66,7 @@ How many lanternfish would there be after 256 days?
 
 
 """
-from typing import Iterable
+from typing import Iterable, List
 
 
 def count_lanternfish(fishes: Iterable[int], days: int = 80) -> int:
@@ -86,3 +86,15 @@ def count_lanternfish(fishes: Iterable[int], days: int = 80) -> int:
         number_of_fishes += fishes_to_create
 
     return number_of_fishes
+
+
+def parse_input(lines: List[str]) -> List[int]:
+    return list(map(int, lines[0].split(",")))
+
+
+def part_1(fishes: List[int]) -> int:
+    return count_lanternfish(fishes)
+
+
+def part_2(fishes: List[int]) -> int:
+    return count_lanternfish(fishes, days=256)
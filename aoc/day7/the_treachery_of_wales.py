@@ -64,7 +64,7 @@ escape route! How much fuel must they spend to align to that position?
 """
 import statistics
 from math import ceil
-from typing import Iterable
+from typing import Iterable, List
 
 
 def calculate_amount_of_fuel(positions: Iterable[int]) -> int:
@@ -89,3 +89,15 @@ def calculate_amount_of_fuel_2(positions: Iterable[int]) -> int:
 def _fuel(position: int, pivot: int) -> int:
     distance = abs(position - pivot)
     return int((distance * (distance + 1)) / 2)
+
+
+def parse_input(lines: List[str]) -> List[int]:
+    return list(map(int, lines[0].split(",")))
+
+
+def part_1(positions: List[int]) -> int:
+    return calculate_amount_of_fuel(positions)
+
+
+def part_2(positions: List[int]) -> int:
+    return calculate_amount_of_fuel_2(positions)
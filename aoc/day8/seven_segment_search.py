@@ -131,10 +131,10 @@ if you add up all of the output values?
 
 """
 from collections import defaultdict
-from typing import List, Tuple, Dict, Set, Callable, Optional
+from typing import List, Tuple, Dict, Set, Callable, Optional, Iterable, Iterator
 
 
-def count_digit_part1(signals_and_outputs: List[Tuple[List[str], List[str]]]) -> int:
+def count_digit_part1(signals_and_outputs: Iterable[Tuple[List[str], List[str]]]) -> int:
     interesting_length = {2, 3, 4, 7}
     res = 0
     for _signals, outputs in signals_and_outputs:
@@ -145,7 +145,7 @@ def count_digit_part1(signals_and_outputs: List[Tuple[List[str], List[str]]]) ->
     return res
 
 
-def decode_outputs(signals_and_outputs_list: List[Tuple[List[str], List[str]]]) -> int:
+def decode_outputs(signals_and_outputs_list: Iterable[Tuple[List[str], List[str]]]) -> int:
     return sum((
         _decode_one_sample(signals_and_outputs)
         for signals_and_outputs in signals_and_outputs_list
@@ -220,3 +220,27 @@ def _pop_signal(signals: Set[frozenset[str]],
         return found
 
     raise ValueError(f'Unable to find signal in signals %s' % signals)
+
+
+def parse_input(lines: List[str]) -> List[Tuple[List[str], List[str]]]:
+    return [
+        _parse_entry(line)
+        for line in lines
+    ]
+
+
+def parse_stream(lines: Iterable[str]) -> Iterator[Tuple[List[str], List[str]]]:
+    return map(_parse_entry, lines)
+
+
+def _parse_entry(line: str) -> Tuple[List[str], List[str]]:
+    tokens = line.split(" | ")
+    return tokens[0].split(), tokens[1].split()
+
+
+def part_1(signals_and_outputs: Iterable[Tuple[List[str], List[str]]]) -> int:
+    return count_digit_part1(signals_and_outputs)
+
+
+def part_2(signals_and_outputs: Iterable[Tuple[List[str], List[str]]]) -> int:
+    return decode_outputs(signals_and_outputs)
@@ -72,10 +72,17 @@ What do you get if you multiply together the sizes of the three largest basins?
 
 """
 from math import prod
-from typing import List
+from typing import List, Optional, Tuple
 
+from aoc.util.backend import get_numpy, numpy_enabled
+
+
+def count_low_point(matrix: List[List[int]], use_numpy: Optional[bool] = None) -> int:
+    if numpy_enabled(use_numpy):
+        np = get_numpy()
+        heights = np.array(matrix)
+        return int((heights[_low_points_mask(heights)] + 1).sum())
 
-def count_low_point(matrix: List[List[int]]) -> int:
     count = 0
     for row_idx, row in enumerate(matrix):
         for col_idx, val in enumerate(row):
@@ -102,12 +109,39 @@ def _is_low_point(value: int, matrix: List[List[int]], y, x):
     return True
 
 
-def find_largest_basins(matrix: List[List[int]]) -> int:
-    basins = []
-    for row_idx, row in enumerate(matrix):
-        for col_idx, val in enumerate(row):
-            if _is_low_point(val, matrix, row_idx, col_idx):
-                basins.append(_find_basin(matrix, row_idx, col_idx))
+def _low_points_mask(heights):
+    """
+    The heights are padded with 10, higher than any height, so the borders compare like the other cells.
+    """
+    np = get_numpy()
+    padded = np.pad(heights, 1, constant_values=10)
+    return (
+        (heights < padded[:-2, 1:-1])
+        & (heights < padded[2:, 1:-1])
+        & (heights < padded[1:-1, :-2])
+        & (heights < padded[1:-1, 2:])
+    )
+
+
+def _low_points(matrix: List[List[int]], use_numpy: Optional[bool]) -> List[Tuple[int, int]]:
+    if numpy_enabled(use_numpy):
+        np = get_numpy()
+        rows, cols = np.nonzero(_low_points_mask(np.array(matrix)))
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    return [
+        (row_idx, col_idx)
+        for row_idx, row in enumerate(matrix)
+        for col_idx, val in enumerate(row)
+        if _is_low_point(val, matrix, row_idx, col_idx)
+    ]
+
+
+def find_largest_basins(matrix: List[List[int]], use_numpy: Optional[bool] = None) -> int:
+    basins = [
+        _find_basin(matrix, row_idx, col_idx)
+        for row_idx, col_idx in _low_points(matrix, use_numpy)
+    ]
 
     return prod(sorted(basins)[-3:])
 
@@ -124,3 +158,21 @@ def _find_basin(matrix, y, x):
     size += _find_basin(matrix, y + 1, x)
 
     return size
+
+
+def parse_input(lines: List[str]) -> List[List[int]]:
+    return [
+        [
+            int(c)
+            for c in line.strip()
+        ]
+        for line in lines
+    ]
+
+
+def part_1(matrix: List[List[int]]) -> int:
+    return count_low_point(matrix)
+
+
+def part_2(matrix: List[List[int]]) -> int:
+    return find_largest_basins(matrix)
@@ -1,9 +1,33 @@
 """
-Empty main...
+Run the daily solvers against their input files, and report the time and memory used by each part.
+
+    python -m aoc.main                      # all days, inputs read from tests/dayN/input.txt
+    python -m aoc.main --day 15 --day 22    # only some days
+    python -m aoc.main --day 1 --input /path/to/depths.txt
+    python -m aoc.main --parallel           # one process per core, slowest parts first
+    python -m aoc.main --day 1 --input huge.txt --stream
+    python -m aoc.main --pre-parsed         # parsed inputs stored next to the input files and reused
+    python -m aoc.main --day 12 --memory         # peak of the python allocations, and where they happen
+    python -m aoc.main --day 23 --instrument day23.json --trace
+    python -m aoc.main --cache              # answers already computed for the same code and input are reused
+    python -m aoc.main --backend python     # pure python solvers, even when numpy is installed
 """
+import argparse
+import json
 import logging
+import os
 
 import sys
+from typing import Dict, List, Optional, Tuple
+
+from aoc.runner.cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, ResultCache, file_sha256
+from aoc.runner.history import DEFAULT_HISTORY_FILE, RunHistory
+from aoc.runner.pool import Job, run_job, run_jobs
+from aoc.runner.registry import DaySolver, discover_solvers
+from aoc.runner.runner import (
+    DEFAULT_INPUT_DIR, PartResult, default_input_path, find_cached_part, part_cache_key
+)
+from aoc.util.backend import BACKEND_VARIABLE, BACKENDS, NUMPY, numpy_available
 
 logging.basicConfig(
     stream=sys.stdout,
@@ -15,8 +39,174 @@ logging.basicConfig(
 log = logging.getLogger(__name__)
 
 
-def main():
-    log.info("nothing to run, see sub-modules for problems, and check the tests directory to execute the problems")
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="aoc", description="Run the advent of code solvers.")
+    parser.add_argument("--day", type=int, action="append", dest="days",
+                        help="day to run, can be repeated (default: all days)")
+    parser.add_argument("--input", help="input file, only allowed when running a single day")
+    parser.add_argument("--input-dir", default=DEFAULT_INPUT_DIR,
+                        help="directory containing the dayN/input.txt files (default: %(default)s)")
+    parser.add_argument("--parallel", action="store_true",
+                        help="run every part in a process pool, the slowest known parts first")
+    parser.add_argument("--workers", type=int, help="size of the process pool (default: number of cores)")
+    parser.add_argument("--stream", action="store_true",
+                        help="read the input lazily for the days supporting it, instead of loading it all")
+    parser.add_argument("--pre-parsed", action="store_true",
+                        help="store the parsed inputs in a binary file next to the input, and reuse it")
+    parser.add_argument("--history", default=DEFAULT_HISTORY_FILE,
+                        help="file keeping the last duration of each part (default: %(default)s)")
+    parser.add_argument("--memory", action="store_true",
+                        help="trace the python allocations of every part, and report their peak and top allocation "
+                             "sites (the parts run slower)")
+    parser.add_argument("--instrument", metavar="FILE",
+                        help="collect the counters and timers of the solvers, and write them as json to FILE")
+    parser.add_argument("--trace", action="store_true", help="with --instrument, also collect the trace events")
+    parser.add_argument("--cache", action="store_true",
+                        help="reuse the answers computed by a previous run with the same code and input")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="(default: %(default)s)")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help="size in MiB above which the least recently used answers are evicted "
+                             "(default: %(default)s)")
+    parser.add_argument("--backend", choices=BACKENDS,
+                        help="force the numpy or the pure python version of the solvers having both "
+                             "(default: numpy when installed)")
+
+    args = parser.parse_args(argv)
+    if args.trace and not args.instrument:
+        parser.error("--trace requires --instrument")
+    if args.input and (not args.days or len(args.days) != 1):
+        parser.error("--input requires exactly one --day")
+    if args.backend == NUMPY and not numpy_available():
+        parser.error("--backend numpy requires numpy to be installed")
+
+    return args
+
+
+def _report(result: PartResult):
+    measurement = result.measurement
+    answer = str(result.answer)
+    if "\n" in answer:
+        answer = f"\n{answer}"
+    cached = " (cached)" if result.cached else ""
+    # without a per part peak, the high-water mark of the process so far
+    rss = "max rss" if measurement.rss_per_run else "process max rss"
+    log.info(f"day {result.day:>2} part {result.part}{cached}: "
+             f"wall {measurement.wall_time * 1000:10.2f} ms, "
+             f"cpu {measurement.cpu_time * 1000:10.2f} ms, "
+             f"{rss} {measurement.max_rss / 1024:8.1f} MiB "
+             f"=> {answer}")
+    if result.memory:
+        log.info(f"day {result.day:>2} part {result.part}: "
+                 f"python allocations peak {result.memory.peak / 2 ** 20:.1f} MiB")
+        for site in result.memory.sites:
+            log.info(f"    {site.size / 2 ** 20:8.1f} MiB in {site.count:>9} blocks at {site.location}")
+
+
+def _export_instrumentation(path: str, results: List[PartResult]):
+    with open(path, "w") as f:
+        json.dump(
+            {
+                f"{result.day}:{result.part}": result.instrumentation
+                for result in results
+            },
+            f,
+            indent=2,
+            default=str
+        )
+
+
+def _report_import(solver: DaySolver):
+    log.info(f"day {solver.day:>2} import {solver.name}: {solver.import_time * 1000:.2f} ms")
+
+
+def _find_cached(cache: ResultCache,
+                 solvers: Dict[int, DaySolver],
+                 jobs: List[Job]) -> Tuple[List[PartResult], List[Job]]:
+    input_hashes = {
+        input_path: file_sha256(input_path)
+        for input_path in {job.input_path for job in jobs}
+    }
+    cached, missing = [], []
+    for job in jobs:
+        result = find_cached_part(cache, solvers[job.day], job.part, input_hashes[job.input_path])
+        if result:
+            cached.append(result)
+        else:
+            missing.append(job)
+
+    return cached, missing
+
+
+def _store(cache: ResultCache, solvers: Dict[int, DaySolver], input_paths: Dict[int, str], results: List[PartResult]):
+    input_hashes = {}
+    for result in results:
+        if result.cached:
+            continue
+        input_path = input_paths[result.day]
+        if input_path not in input_hashes:
+            input_hashes[input_path] = file_sha256(input_path)
+        cache.put(part_cache_key(solvers[result.day], result.part, input_hashes[input_path]), result.answer)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = _parse_args(argv)
+    if args.backend:
+        # read by the solvers, in the worker processes too
+        os.environ[BACKEND_VARIABLE] = args.backend
+    solvers = discover_solvers()
+    days = args.days or list(solvers.keys())
+    unknown_days = [day for day in days if day not in solvers]
+    if unknown_days:
+        log.error(f"no solver found for day(s): {unknown_days}")
+        sys.exit(1)
+
+    input_paths = {
+        day: args.input or default_input_path(args.input_dir, day)
+        for day in days
+    }
+    history = RunHistory.load(args.history)
+    cache = ResultCache(args.cache_dir, args.cache_size * 1024 * 1024) if args.cache else None
+    jobs = [
+        Job(
+            day=day,
+            part=part,
+            input_path=input_paths[day],
+            stream=args.stream,
+            pre_parsed=args.pre_parsed,
+            instrument=args.instrument is not None,
+            trace=args.trace,
+            memory=args.memory
+        )
+        for day in days
+        for part in solvers[day].parts
+    ]
+    # only the requested days are imported, by the listing of their parts
+    for day in days:
+        _report_import(solvers[day])
+
+    results = []
+    if cache:
+        results, jobs = _find_cached(cache, solvers, jobs)
+        for result in results:
+            _report(result)
+
+    if args.parallel:
+        computed = run_jobs(jobs, history, max_workers=args.workers)
+        for result in computed:
+            _report(result)
+    else:
+        computed = []
+        for job in jobs:
+            computed.append(run_job(job))
+            _report(computed[-1])
+
+    if cache:
+        _store(cache, solvers, input_paths, computed)
+
+    history.record(computed)
+    history.save(args.history)
+    if args.instrument:
+        _export_instrumentation(args.instrument, computed)
 
 
 if __name__ == "__main__":
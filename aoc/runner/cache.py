@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+import pickle
+import sys
+from types import ModuleType
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from aoc.util.source import hash_sources
+
+DEFAULT_CACHE_DIR = ".aoc_cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+ENTRY_SUFFIX = ".pickle"
+
+
+class CacheKey(NamedTuple):
+    function: str  # qualified name of the solver function
+    source_hash: str
+    input_hash: str
+    parameters: str  # canonical json of the parameters
+
+    @property
+    def digest(self) -> str:
+        return hashlib.sha256("\0".join(self).encode()).hexdigest()
+
+    @property
+    def filename(self) -> str:
+        # the function and source hash are readable, to drop the entries of a previous version of the code
+        return f"{self.function}.{self.source_hash[:16]}.{self.digest[:32]}{ENTRY_SUFFIX}"
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+_source_hashes: Dict[str, str] = {}
+
+
+def source_hash(module: ModuleType) -> str:
+    """
+    Hash of the source of the module, and of the `aoc` modules it uses directly or transitively: a change in a
+    shared utility invalidates the results of the solvers using it.
+    """
+    known = _source_hashes.get(module.__name__)
+    if known:
+        return known
+
+    _source_hashes[module.__name__] = hash_sources(module)
+    return _source_hashes[module.__name__]
+
+
+def function_key(function: Any, input_hash: str, **parameters: Any) -> CacheKey:
+    module = sys.modules[function.__module__]
+    return CacheKey(
+        function=f"{function.__module__}.{function.__qualname__}",
+        source_hash=source_hash(module),
+        input_hash=input_hash,
+        parameters=json.dumps(parameters, sort_keys=True, default=repr)
+    )
+
+
+class ResultCache:
+    """
+    Results stored on disk, one pickle file per entry. The least recently used entries are evicted
+    when the total size goes above `max_bytes`, the access time being the modification time of the file.
+    """
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._directory = directory
+        self._max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, key: CacheKey) -> Tuple[bool, Any]:
+        path = os.path.join(self._directory, key.filename)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return False, None
+
+        os.utime(path)
+        return True, value
+
+    def put(self, key: CacheKey, value: Any):
+        self._drop_previous_versions(key)
+        path = os.path.join(self._directory, key.filename)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def size(self) -> int:
+        return sum(size for _, size, __ in self._entries())
+
+    def clear(self):
+        for path, _, __ in self._entries():
+            os.remove(path)
+
+    def _entries(self) -> List[Tuple[str, int, float]]:
+        entries = []
+        for entry in os.scandir(self._directory):
+            if entry.is_file() and entry.name.endswith(ENTRY_SUFFIX):
+                stat = entry.stat()
+                entries.append((entry.path, stat.st_size, stat.st_mtime))
+
+        return entries
+
+    def _drop_previous_versions(self, key: CacheKey):
+        prefix = f"{key.function}."
+        current = f"{key.function}.{key.source_hash[:16]}."
+        for path, _, __ in self._entries():
+            name = os.path.basename(path)
+            if name.startswith(prefix) and not name.startswith(current):
+                _remove(path)
+
+    def _evict(self, max_bytes: Optional[int] = None):
+        max_bytes = self._max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(size for _, size, __ in entries)
+        for path, size, _ in entries:
+            if total <= max_bytes:
+                break
+            _remove(path)
+            total -= size
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        # evicted by another process
+        pass
@@ -0,0 +1,41 @@
+import json
+import os
+from typing import Dict, Iterable, Optional
+
+from aoc.runner.runner import PartResult
+
+DEFAULT_HISTORY_FILE = ".aoc_history.json"
+
+
+class RunHistory:
+    """
+    Last known wall time of every (day, part), persisted as json between runs.
+    """
+    def __init__(self, durations: Optional[Dict[str, float]] = None):
+        self._durations = durations or {}
+
+    @staticmethod
+    def load(path: str) -> "RunHistory":
+        if not os.path.exists(path):
+            return RunHistory()
+
+        with open(path) as f:
+            return RunHistory(json.load(f))
+
+    def save(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self._durations, f, indent=2, sort_keys=True)
+
+    def duration(self, day: int, part: int) -> Optional[float]:
+        return self._durations.get(RunHistory._key(day, part))
+
+    def record(self, results: Iterable[PartResult]):
+        for result in results:
+            if result.cached or result.memory:
+                # the duration of a cache lookup, or of a part slowed down by tracemalloc, says nothing about the part
+                continue
+            self._durations[RunHistory._key(result.day, result.part)] = result.measurement.wall_time
+
+    @staticmethod
+    def _key(day: int, part: int) -> str:
+        return f"{day}:{part}"
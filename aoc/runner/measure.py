@@ -0,0 +1,130 @@
+import resource
+import threading
+import time
+import tracemalloc
+from typing import Callable, List, NamedTuple, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+_CLEAR_REFS = "/proc/self/clear_refs"
+_RESET_PEAK_RSS = "5"
+
+
+class Measurement(NamedTuple):
+    wall_time: float
+    cpu_time: float
+    max_rss: int  # in kilobytes, peak while `fn` ran when `rss_per_run`, else process high-water mark
+    rss_per_run: bool = False
+
+
+def measure(fn: Callable[[], T]) -> Tuple[T, Measurement]:
+    """
+    The high-water mark of the process is reset before running `fn` where the kernel allows it (linux), so the
+    parts run one after the other in a process do not inherit the peaks of the previous ones.
+    """
+    rss_per_run = _reset_peak_rss()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    res = fn()
+    cpu_time = time.process_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+
+    return res, Measurement(
+        wall_time=wall_time,
+        cpu_time=cpu_time,
+        max_rss=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        rss_per_run=rss_per_run
+    )
+
+
+def _reset_peak_rss() -> bool:
+    try:
+        with open(_CLEAR_REFS, "w") as f:
+            f.write(_RESET_PEAK_RSS)
+    except OSError:
+        return False
+
+    return True
+
+
+DEFAULT_TOP_SITES = 10
+_SAMPLING_INTERVAL = 0.01  # seconds
+_SNAPSHOT_GROWTH = 1.1  # a new snapshot is taken when the traced memory grew by 10% since the last one
+
+
+class AllocationSite(NamedTuple):
+    location: str  # file:line
+    size: int  # bytes
+    count: int  # blocks
+
+
+class MemoryProfile(NamedTuple):
+    peak: int  # bytes allocated by python at the peak
+    sites: List[AllocationSite]  # biggest allocation sites around the peak
+
+
+class _PeakSampler(threading.Thread):
+    """
+    tracemalloc only keeps the peak size, not what was allocated at the peak: the traced memory is sampled
+    from a background thread, and a snapshot is taken every time it reaches a new high.
+    """
+    def __init__(self):
+        super().__init__(daemon=True)
+        self._stopped = threading.Event()
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.snapshot_size = 0
+
+    def run(self):
+        while not self._stopped.wait(_SAMPLING_INTERVAL):
+            self.sample()
+
+    def sample(self):
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.snapshot_size * _SNAPSHOT_GROWTH:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+
+def profile_memory(fn: Callable[[], T], top: int = DEFAULT_TOP_SITES) -> Tuple[T, MemoryProfile]:
+    """
+    The python allocations are traced while `fn` runs, making it several times slower.
+    """
+    sampler = _PeakSampler()
+    tracemalloc.start()
+    try:
+        sampler.start()
+        res = fn()
+        sampler.stop()
+        # what is still allocated at the end, the result included, can be the peak
+        sampler.sample()
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = sampler.snapshot
+    finally:
+        sampler.stop()
+        tracemalloc.stop()
+
+    return res, MemoryProfile(peak=peak, sites=_top_sites(snapshot, top))
+
+
+def _top_sites(snapshot: Optional[tracemalloc.Snapshot], top: int) -> List[AllocationSite]:
+    if snapshot is None:
+        return []
+
+    filtered = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, threading.__file__),
+        tracemalloc.Filter(False, __file__),
+    ])
+    return [
+        AllocationSite(
+            location=f"{statistic.traceback[0].filename}:{statistic.traceback[0].lineno}",
+            size=statistic.size,
+            count=statistic.count
+        )
+        for statistic in filtered.statistics("lineno")[:top]
+    ]
@@ -0,0 +1,69 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple, Optional
+
+from aoc.runner.history import RunHistory
+from aoc.runner.registry import load_solver
+from aoc.runner.runner import PartResult, read_lines, run_part, run_part_pre_parsed, run_part_streaming
+from aoc.util.instrumentation import INSTRUMENTATION
+
+
+class Job(NamedTuple):
+    day: int
+    part: int
+    input_path: str
+    stream: bool = False
+    pre_parsed: bool = False
+    instrument: bool = False
+    trace: bool = False
+    memory: bool = False  # trace the python allocations
+
+
+def schedule(jobs: List[Job], history: RunHistory) -> List[Job]:
+    """
+    Longest processing time first: the jobs known to be the slowest are submitted first, so the whole
+    run lasts about as long as the slowest job. Jobs never measured are considered as the slowest.
+    """
+    def _expected_duration(job: Job) -> float:
+        duration = history.duration(job.day, job.part)
+        return math.inf if duration is None else duration
+
+    return sorted(jobs, key=_expected_duration, reverse=True)
+
+
+def run_jobs(jobs: List[Job],
+             history: RunHistory,
+             max_workers: Optional[int] = None) -> List[PartResult]:
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # the executor hands out the jobs in submission order
+        futures = [
+            executor.submit(run_job, job)
+            for job in schedule(jobs, history)
+        ]
+        results = [future.result() for future in futures]
+
+    return sorted(results, key=lambda r: (r.day, r.part))
+
+
+def run_job(job: Job) -> PartResult:
+    if not job.instrument:
+        return _run_job(job)
+
+    INSTRUMENTATION.reset()
+    INSTRUMENTATION.enable(trace=job.trace)
+    try:
+        result = _run_job(job)
+    finally:
+        INSTRUMENTATION.disable()
+
+    return result._replace(instrumentation=INSTRUMENTATION.snapshot())
+
+
+def _run_job(job: Job) -> PartResult:
+    solver = load_solver(job.day)
+    if job.stream and solver.streams:
+        return run_part_streaming(solver, job.part, job.input_path, memory=job.memory)
+    if job.pre_parsed:
+        return run_part_pre_parsed(solver, job.part, job.input_path, memory=job.memory)
+
+    return run_part(solver, job.part, read_lines(job.input_path), memory=job.memory)
@@ -0,0 +1,123 @@
+import importlib
+import os
+import pkgutil
+import re
+import time
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import aoc
+
+DAY_PACKAGE = re.compile(r"^day(\d+)$")
+PARTS = (1, 2)
+
+
+class DaySolver:
+    """
+    A day module exposing `parse_input(lines)` and `part_1(parsed)` / `part_2(parsed)`.
+    Line oriented days can also expose `parse_stream(lines)`, parsing the lines lazily.
+
+    The module is only imported when first used, and the time taken by the import is kept.
+    It includes the import of the `aoc.util` modules not imported yet.
+    """
+    def __init__(self, day: int, candidates: List[str]):
+        self._day = day
+        self._candidates = candidates
+        self._module: Optional[ModuleType] = None
+        self._import_time: Optional[float] = None
+
+    @property
+    def day(self) -> int:
+        return self._day
+
+    @property
+    def name(self) -> str:
+        return self.module.__name__
+
+    @property
+    def module(self) -> ModuleType:
+        if self._module is None:
+            start = time.perf_counter()
+            self._module = _find_solver_module(self._candidates)
+            self._import_time = time.perf_counter() - start
+            if self._module is None:
+                raise ValueError(f"No solver found for day {self._day} in {self._candidates}")
+
+        return self._module
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    @property
+    def import_time(self) -> Optional[float]:
+        """
+        Seconds spent importing the module, None while not imported.
+        """
+        return self._import_time
+
+    def parse(self, lines: List[str]) -> Any:
+        return self.module.parse_input(lines)
+
+    def parse_stream(self, lines: Iterable[str]) -> Any:
+        return self.module.parse_stream(lines)
+
+    @property
+    def streams(self) -> bool:
+        return hasattr(self.module, "parse_stream")
+
+    def part(self, part: int) -> Optional[Callable[[Any], Any]]:
+        return getattr(self.module, f"part_{part}", None)
+
+    @property
+    def parts(self) -> List[int]:
+        return [
+            part
+            for part in PARTS
+            if self.part(part) is not None
+        ]
+
+    def __repr__(self):
+        return f"DaySolver(day={self._day}, candidates={self._candidates})"
+
+
+def discover_solvers() -> Dict[int, DaySolver]:
+    """
+    Finds the day packages and their modules from the file system, without importing them.
+    """
+    solvers = {}
+    for package in pkgutil.iter_modules(aoc.__path__):
+        match = DAY_PACKAGE.match(package.name)
+        if package.ispkg and match:
+            candidates = _solver_candidates(package.name)
+            if candidates:
+                day = int(match.group(1))
+                solvers[day] = DaySolver(day, candidates)
+
+    return dict(sorted(solvers.items()))
+
+
+def load_solver(day: int) -> DaySolver:
+    candidates = _solver_candidates(f"day{day}")
+    if not candidates:
+        raise ValueError(f"No solver found for day {day}")
+
+    return DaySolver(day, candidates)
+
+
+def _solver_candidates(package_name: str) -> List[str]:
+    paths = [os.path.join(path, package_name) for path in aoc.__path__]
+    return [
+        f"{aoc.__name__}.{package_name}.{module_info.name}"
+        for module_info in pkgutil.iter_modules(paths)
+        if not module_info.ispkg
+    ]
+
+
+def _find_solver_module(candidates: List[str]) -> Optional[ModuleType]:
+    for candidate in candidates:
+        module = importlib.import_module(candidate)
+        if hasattr(module, "parse_input") and hasattr(module, "part_1"):
+            return module
+
+    return None
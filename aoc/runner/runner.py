@@ -0,0 +1,106 @@
+import os
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from aoc.runner.cache import CacheKey, ResultCache, function_key
+from aoc.runner.measure import Measurement, MemoryProfile, measure, profile_memory
+from aoc.runner.registry import DaySolver
+from aoc.util.input import iterate_lines, load_parsed
+
+DEFAULT_INPUT_DIR = "tests"
+INPUT_FILENAME = "input.txt"
+
+
+class PartResult(NamedTuple):
+    day: int
+    part: int
+    answer: Any
+    measurement: Measurement
+    cached: bool = False
+    instrumentation: Optional[Dict[str, Any]] = None  # snapshot of the counters, timers and events of the part
+    memory: Optional[MemoryProfile] = None
+
+
+def default_input_path(input_dir: str, day: int) -> str:
+    return os.path.join(input_dir, f"day{day}", INPUT_FILENAME)
+
+
+def read_lines(input_path: str) -> List[str]:
+    with open(input_path) as f:
+        return f.readlines()
+
+
+def run_part(solver: DaySolver, part: int, lines: List[str], memory: bool = False) -> PartResult:
+    # parse again for every part, some solvers are mutating their input
+    parsed = solver.parse(lines)
+    return _solve(solver, part, lambda: solver.part(part)(parsed), memory)
+
+
+def run_part_streaming(solver: DaySolver, part: int, input_path: str, memory: bool = False) -> PartResult:
+    """
+    The input is read and parsed while the part is solved, so the measure includes the reading of the file.
+    """
+    return _solve(
+        solver,
+        part,
+        lambda: solver.part(part)(solver.parse_stream(iterate_lines(input_path))),
+        memory
+    )
+
+
+def run_part_pre_parsed(solver: DaySolver, part: int, input_path: str, memory: bool = False) -> PartResult:
+    """
+    The parsed input is stored next to the input file by the first run, and read back by the next ones.
+    """
+    parsed = load_parsed(input_path, solver.module.parse_input)
+    return _solve(solver, part, lambda: solver.part(part)(parsed), memory)
+
+
+def _solve(solver: DaySolver, part: int, solve: Callable[[], Any], memory: bool) -> PartResult:
+    """
+    With `memory`, the python allocations are traced, and the times measured are slower than usual.
+    """
+    memory_profile = None
+    if memory:
+        (answer, measurement), memory_profile = profile_memory(lambda: measure(solve))
+    else:
+        answer, measurement = measure(solve)
+
+    return PartResult(
+        day=solver.day,
+        part=part,
+        answer=answer,
+        measurement=measurement,
+        memory=memory_profile
+    )
+
+
+def run_day(solver: DaySolver, input_path: str, stream: bool = False) -> List[PartResult]:
+    if stream and solver.streams:
+        return [
+            run_part_streaming(solver, part, input_path)
+            for part in solver.parts
+        ]
+
+    lines = read_lines(input_path)
+    return [
+        run_part(solver, part, lines)
+        for part in solver.parts
+    ]
+
+
+def part_cache_key(solver: DaySolver, part: int, input_hash: str) -> CacheKey:
+    return function_key(solver.part(part), input_hash)
+
+
+def find_cached_part(cache: ResultCache, solver: DaySolver, part: int, input_hash: str) -> Optional[PartResult]:
+    (found, answer), measurement = measure(lambda: cache.get(part_cache_key(solver, part, input_hash)))
+    if not found:
+        return None
+
+    return PartResult(
+        day=solver.day,
+        part=part,
+        answer=answer,
+        measurement=measurement,
+        cached=True
+    )
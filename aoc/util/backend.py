@@ -0,0 +1,88 @@
+"""
+Optional numpy acceleration of the grid and array heavy solvers.
+
+The solvers taking a `use_numpy` argument run a vectorized version when numpy is installed, and their pure python
+version otherwise, both giving the same answers. `use_numpy=True` or `False` forces one of them, and the
+`AOC_BACKEND` environment variable (`numpy`, `python` or `auto`) forces it for every solver, worker processes
+included.
+
+numpy is only imported once its backend is selected, by `get_numpy`: importing it takes about as long as importing
+every solver, and the solvers only needing the pure python version would pay for it at startup.
+"""
+import os
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
+from importlib.util import find_spec
+from types import ModuleType
+from typing import Any, Iterator, Optional
+
+BACKEND_VARIABLE = "AOC_BACKEND"
+AUTO = "auto"
+NUMPY = "numpy"
+PYTHON = "python"
+BACKENDS = (AUTO, NUMPY, PYTHON)
+
+
+@lru_cache(maxsize=None)
+def numpy_available() -> bool:
+    """
+    Whether numpy is installed, without importing it.
+    """
+    return find_spec("numpy") is not None
+
+
+@lru_cache(maxsize=None)
+def get_numpy() -> ModuleType:
+    if not numpy_available():
+        raise ValueError('numpy is not installed')
+
+    import numpy
+    return numpy
+
+
+def is_ndarray(value: Any) -> bool:
+    """
+    A value can only be a numpy array once numpy was imported, this check never imports it.
+    """
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+def numpy_enabled(use_numpy: Optional[bool] = None, auto: bool = True) -> bool:
+    """
+    `auto` is the choice when nothing is forced and numpy is installed, False for the inputs too small
+    for numpy to pay off. numpy is imported when it is enabled, the caller getting it with `get_numpy`.
+    """
+    if use_numpy is None:
+        backend = os.environ.get(BACKEND_VARIABLE, AUTO)
+        if backend not in BACKENDS:
+            raise ValueError(f'unknown backend {backend}, expected one of {BACKENDS}')
+        if backend == AUTO:
+            use_numpy = auto and numpy_available()
+        else:
+            use_numpy = backend == NUMPY
+
+    if use_numpy:
+        get_numpy()
+
+    return use_numpy
+
+
+@contextmanager
+def forced_backend(backend: str) -> Iterator[None]:
+    """
+    Forces the backend of the solvers called in the block.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f'unknown backend {backend}, expected one of {BACKENDS}')
+
+    previous = os.environ.get(BACKEND_VARIABLE)
+    os.environ[BACKEND_VARIABLE] = backend
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ[BACKEND_VARIABLE]
+        else:
+            os.environ[BACKEND_VARIABLE] = previous
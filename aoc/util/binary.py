@@ -1,6 +1,199 @@
+from typing import Iterable, List, Optional, Tuple
+
+
 def get_bit_at(num: int, pos: int) -> int:
     return 1 if num & (1 << pos) > 0 else 0
 
 
 def turn_on_bit_at(num: int, pos: int) -> int:
     return num | (1 << pos)
+
+
+class BitMatrix:
+    """
+    Matrix of bits stored as one python int per row, the bit x of a row being the column x.
+    The operations are applied to whole rows at once instead of bit by bit.
+    """
+    def __init__(self, width: int, rows: Optional[List[int]] = None, height: int = 0):
+        self._width = width
+        self._rows = list(rows) if rows is not None else [0] * height
+
+    @staticmethod
+    def from_coordinates(coordinates: Iterable[Tuple[int, int]]) -> "BitMatrix":
+        coordinates = list(coordinates)
+        width = max((x for x, _ in coordinates), default=-1) + 1
+        height = max((y for _, y in coordinates), default=-1) + 1
+        matrix = BitMatrix(width, height=height)
+        for x, y in coordinates:
+            matrix._rows[y] |= 1 << x
+
+        return matrix
+
+    @staticmethod
+    def from_strings(lines: Iterable[str], on: str = "#") -> "BitMatrix":
+        """
+        The first character of a line is the column 0.
+        """
+        rows = []
+        width = 0
+        for line in lines:
+            width = max(width, len(line))
+            rows.append(int("".join("1" if char == on else "0" for char in reversed(line)) or "0", 2))
+
+        return BitMatrix(width, rows)
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return len(self._rows)
+
+    @property
+    def rows(self) -> List[int]:
+        return self._rows
+
+    @property
+    def mask(self) -> int:
+        return (1 << self._width) - 1
+
+    def get(self, x: int, y: int) -> int:
+        return (self._rows[y] >> x) & 1
+
+    def set(self, x: int, y: int, bit: int = 1):
+        if bit:
+            self._rows[y] |= 1 << x
+        else:
+            self._rows[y] &= ~(1 << x)
+
+    def popcount(self) -> int:
+        return sum(row.bit_count() for row in self._rows)
+
+    def column_counts(self) -> List[int]:
+        """
+        Number of bits set in each column.
+        """
+        return [row.bit_count() for row in self.transpose().rows]
+
+    def reverse_rows(self) -> "BitMatrix":
+        """
+        Flips the matrix upside down.
+        """
+        return BitMatrix(self._width, self._rows[::-1])
+
+    def reverse_columns(self) -> "BitMatrix":
+        """
+        Mirrors the matrix, the column x becoming the column width - 1 - x.
+        """
+        return BitMatrix(self._width, [reverse_bits(row, self._width) for row in self._rows])
+
+    def fold_rows(self, row: int) -> "BitMatrix":
+        """
+        Folds the bottom part up along the line `row`, the rows below it being OR-ed onto the rows above.
+        The folded matrix is `row` rows high, even when the line is below the last row.
+        """
+        rows = self._rows[:row] + [0] * max(row - len(self._rows), 0)
+        for y in range(row + 1, min(2 * row + 1, len(self._rows))):
+            rows[2 * row - y] |= self._rows[y]
+
+        return BitMatrix(self._width, rows)
+
+    def fold_columns(self, col: int) -> "BitMatrix":
+        """
+        Folds the right part left along the column `col`, the columns right of it being OR-ed onto the left ones.
+        """
+        width = 2 * col + 1
+        mask = (1 << col) - 1
+        return BitMatrix(col, [(row | reverse_bits(row, width)) & mask for row in self._rows])
+
+    def transpose(self) -> "BitMatrix":
+        # the rows are written column 0 first, so the transposed rows are read back reversed
+        lines = [_bits(row, self._width) for row in self._rows]
+        columns = zip(*lines) if lines else [()] * self._width
+        return BitMatrix(len(self._rows), [int("".join(column)[::-1] or "0", 2) for column in columns])
+
+    def shift_left(self, n: int = 1) -> "BitMatrix":
+        """
+        Moves the bits n columns left, towards the column 0. The bits shifted out are dropped.
+        """
+        return BitMatrix(self._width, [row >> n for row in self._rows])
+
+    def shift_right(self, n: int = 1) -> "BitMatrix":
+        mask = self.mask
+        return BitMatrix(self._width, [(row << n) & mask for row in self._rows])
+
+    def shift_up(self, n: int = 1) -> "BitMatrix":
+        return BitMatrix(self._width, self._rows[n:] + [0] * min(n, len(self._rows)))
+
+    def shift_down(self, n: int = 1) -> "BitMatrix":
+        return BitMatrix(self._width, [0] * min(n, len(self._rows)) + self._rows[:max(len(self._rows) - n, 0)])
+
+    def neighbour_counts(self, diagonals: bool = True) -> List["BitMatrix"]:
+        """
+        Number of bits set around each cell, as bit planes: the bit (x, y) of the plane i is the bit i of the count
+        of the cell (x, y). The neighbours are added row by row with bitwise adders.
+        """
+        horizontal = [self.shift_left(), self.shift_right()]
+        neighbours = horizontal + [self.shift_up(), self.shift_down()]
+        if diagonals:
+            neighbours += [matrix.shift_up() for matrix in horizontal] + [matrix.shift_down() for matrix in horizontal]
+
+        planes: List[List[int]] = []
+        for neighbour in neighbours:
+            carries = neighbour.rows
+            for plane in planes:
+                carries, plane[:] = [a & b for a, b in zip(plane, carries)], [a ^ b for a, b in zip(plane, carries)]
+            if any(carries):
+                planes.append(carries)
+
+        return [BitMatrix(self._width, plane) for plane in planes]
+
+    def neighbours_equal_to(self, count: int, diagonals: bool = True) -> "BitMatrix":
+        """
+        Cells having exactly `count` neighbours set.
+        """
+        planes = self.neighbour_counts(diagonals)
+        if count >> len(planes):
+            return BitMatrix(self._width, height=self.height)
+
+        mask = self.mask
+        rows = [mask] * self.height
+        for i, plane in enumerate(planes):
+            bit_set = (count >> i) & 1
+            rows = [row & (plane_row if bit_set else ~plane_row) for row, plane_row in zip(rows, plane.rows)]
+
+        return BitMatrix(self._width, rows)
+
+    def __and__(self, other: "BitMatrix") -> "BitMatrix":
+        return BitMatrix(self._width, [a & b for a, b in zip(self._rows, other._rows)])
+
+    def __or__(self, other: "BitMatrix") -> "BitMatrix":
+        return BitMatrix(max(self._width, other._width), [a | b for a, b in zip(self._rows, other._rows)])
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, BitMatrix) and self._width == other._width and self._rows == other._rows
+
+    def __repr__(self) -> str:
+        return f"BitMatrix({self._width}, {self._rows})"
+
+    def serialize(self, on: str = "#", off: str = ".", padding: int = 0) -> str:
+        pad = " " * padding
+        return "\n".join(
+            "".join(f"{pad}{on}" if bit == "1" else f"{pad}{off}" for bit in _bits(row, self._width))
+            for row in self._rows
+        )
+
+
+def reverse_bits(num: int, length: int) -> int:
+    """
+    Reverses the `length` lowest bits of `num`, the higher ones are dropped.
+    """
+    return int(format(num & ((1 << length) - 1), f"0{length}b")[::-1], 2) if length > 0 else 0
+
+
+def _bits(num: int, length: int) -> str:
+    """
+    The `length` lowest bits of `num`, the bit 0 first.
+    """
+    return format(num, f"0{length}b")[::-1] if length > 0 else ""
@@ -1,4 +1,13 @@
-from typing import Optional, List
+import operator
+from array import array
+from collections import deque
+from itertools import accumulate, islice
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from aoc.util.backend import get_numpy, is_ndarray, numpy_enabled
+
+AGGREGATES = ("sum", "min", "max")
+_INT64_MAX = (1 << 63) - 1
 
 
 class CircularBuffer:
@@ -16,3 +25,138 @@ class CircularBuffer:
         self._buf[self._index] = val
         self._index = (self._index + 1) % self._length
         return prev
+
+    def peek(self, back: int) -> int:
+        """
+        Value pushed `back` pushes ago, between 1 (the last one) and the length (the next one to be replaced).
+        """
+        if not 0 < back <= self._length:
+            raise ValueError(f'can only peek between 1 and {self._length} pushes back, got {back}')
+        return self._buf[(self._index - back) % self._length]
+
+
+class Windows(NamedTuple):
+    """
+    Aggregates of the consecutive windows of one size, None when not requested.
+    numpy arrays when numpy is used, `array('q')` otherwise.
+    """
+    sums: Optional[Any]
+    mins: Optional[Any]
+    maxs: Optional[Any]
+
+
+class WindowAggregator:
+    """
+    Sums, minimums and maximums of the sliding windows of several sizes over a stream of ints, pushed by chunks.
+    Each push returns the aggregates of the windows ending in the chunk, so every window of the stream is returned
+    once; the last values of the previous chunks are kept for the windows overlapping two chunks.
+
+    The sums are differences of cumulative sums, computed by numpy when available. Sums outside of int64 raise an
+    OverflowError with both backends: numpy would wrap them silently, so the chunks whose sums could overflow
+    are summed by the `array('q')` version.
+    """
+    def __init__(self,
+                 window_sizes: Sequence[int],
+                 aggregates: Sequence[str] = ("sum",),
+                 use_numpy: Optional[bool] = None):
+        if not window_sizes or min(window_sizes) < 1:
+            raise ValueError(f'window sizes must be positive, got {window_sizes}')
+        unknown = set(aggregates) - set(AGGREGATES)
+        if unknown:
+            raise ValueError(f'unknown aggregates {sorted(unknown)}, expected some of {AGGREGATES}')
+
+        self._window_sizes = sorted(set(window_sizes))
+        self._aggregates = set(aggregates)
+        self._numpy = numpy_enabled(use_numpy)
+        self._tail = self._empty()
+
+    @property
+    def window_sizes(self) -> List[int]:
+        return self._window_sizes
+
+    def push(self, chunk: Sequence[int]) -> Dict[int, Windows]:
+        if self._numpy:
+            np = get_numpy()
+            data = np.concatenate((self._tail, np.asarray(chunk, dtype=np.int64)))
+        else:
+            data = self._tail + array('q', chunk)
+        carried = len(self._tail)
+        self._tail = data[max(0, len(data) - self._window_sizes[-1] + 1):]
+
+        vectorized = self._numpy and _sums_fit_int64(data)
+        cumulative_sums = self._cumulative_sums(data, vectorized) if "sum" in self._aggregates else None
+        windows = {}
+        for size in self._window_sizes:
+            # first window ending in the chunk
+            start = max(0, carried - size + 1)
+            windows[size] = Windows(
+                sums=self._sums(cumulative_sums, size, start, vectorized) if cumulative_sums is not None else None,
+                mins=self._extremes(data, size, start, min) if "min" in self._aggregates else None,
+                maxs=self._extremes(data, size, start, max) if "max" in self._aggregates else None
+            )
+
+        return windows
+
+    def _empty(self) -> Any:
+        return get_numpy().empty(0, dtype="int64") if self._numpy else array('q')
+
+    @staticmethod
+    def _cumulative_sums(data: Any, vectorized: bool) -> Any:
+        if vectorized:
+            np = get_numpy()
+            return np.concatenate((np.zeros(1, dtype=np.int64), np.cumsum(data)))
+
+        cumulative_sums = array('q', [0])
+        # python ints, the numpy ones would wrap
+        cumulative_sums.extend(accumulate(data.tolist() if is_ndarray(data) else data))
+        return cumulative_sums
+
+    def _sums(self, cumulative_sums: Any, size: int, start: int, vectorized: bool) -> Any:
+        if vectorized:
+            return cumulative_sums[start + size:] - cumulative_sums[start:-size]
+
+        sums = array('q', map(
+            operator.sub,
+            islice(cumulative_sums, start + size, None),
+            islice(cumulative_sums, start, None)
+        ))
+        return get_numpy().asarray(sums, dtype="int64") if self._numpy else sums
+
+    def _extremes(self, data: Any, size: int, start: int, extreme: Any) -> Any:
+        if len(data) < size:
+            return self._empty()
+        if self._numpy:
+            views = get_numpy().lib.stride_tricks.sliding_window_view(data, size)[start:]
+            return views.min(axis=1) if extreme is min else views.max(axis=1)
+
+        return array('q', _sliding_extremes(data, size, start, extreme is min))
+
+
+def _sums_fit_int64(data: Any) -> bool:
+    """
+    Whether no cumulative sum of the data, nor any difference of two of them, can go outside of int64.
+    """
+    if not len(data):
+        return True
+
+    largest = max(int(data.max()), -int(data.min()))
+    return 2 * largest * len(data) <= _INT64_MAX
+
+
+def _sliding_extremes(data: Sequence[int], size: int, start: int, minimum: bool) -> List[int]:
+    """
+    Monotonic queue of the indexes of the candidates, O(n) whatever the window size.
+    """
+    beats = operator.le if minimum else operator.ge
+    candidates = deque()
+    extremes = []
+    for index, value in enumerate(data):
+        while candidates and beats(value, data[candidates[-1]]):
+            candidates.pop()
+        candidates.append(index)
+        if candidates[0] <= index - size:
+            candidates.popleft()
+        if index >= start + size - 1:
+            extremes.append(data[candidates[0]])
+
+    return extremes
@@ -1,4 +1,6 @@
 from functools import reduce
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
 
 
 def compose2(f, g):
@@ -10,3 +12,96 @@ def compose(*fs):
         return reduce(compose2, fs)
 
     return lambda x: x
+
+
+class Pipeline:
+    """
+    Chain of map and filter stages, run as one generated loop over the items instead of one generator per stage:
+
+        Pipeline().map(str.strip).filter(bool).map(int).sum(lines)
+
+    The stages are immutable, each call returns a new pipeline.
+    """
+    def __init__(self, stages: Tuple[Tuple[str, Callable], ...] = ()):
+        self._stages = stages
+        self._loops: Dict[str, Callable] = {}
+
+    def map(self, function: Callable[[Any], Any]) -> "Pipeline":
+        return Pipeline(self._stages + (("map", function),))
+
+    def filter(self, predicate: Callable[[Any], bool]) -> "Pipeline":
+        return Pipeline(self._stages + (("filter", predicate),))
+
+    def __call__(self, iterable: Iterable) -> Iterator:
+        return self._loop("generate")(iterable, *self._functions)
+
+    def reduce(self, function: Callable[[Any, Any], Any], initial: Any, iterable: Iterable) -> Any:
+        return self._loop("reduce")(iterable, function, initial, *self._functions)
+
+    def sum(self, iterable: Iterable, start: Any = 0) -> Any:
+        return self._loop("sum")(iterable, start, *self._functions)
+
+    def batches(self, iterable: Iterable, size: int) -> Iterator[List]:
+        """
+        The items are pulled `size` at a time, and the results of each batch are returned together.
+        """
+        if size <= 0:
+            raise ValueError(f'batch size must be positive, got {size}')
+
+        loop = self._loop("batch")
+        functions = self._functions
+        iterator = iter(iterable)
+        while True:
+            batch = list(islice(iterator, size))
+            if not batch:
+                return
+            yield loop(batch, *functions)
+
+    @property
+    def _functions(self) -> List[Callable]:
+        return [function for _, function in self._stages]
+
+    def _loop(self, mode: str) -> Callable:
+        loop = self._loops.get(mode)
+        if loop is None:
+            loop = self._loops[mode] = _compile_loop(self._stages, mode)
+
+        return loop
+
+
+_LOOP_HEADERS = {
+    "generate": ("def loop(iterable, {stages}):", "for item in iterable:", None),
+    "reduce": ("def loop(iterable, function, accumulator, {stages}):", "for item in iterable:", "return accumulator"),
+    "sum": ("def loop(iterable, accumulator, {stages}):", "for item in iterable:", "return accumulator"),
+    "batch": ("def loop(batch, {stages}):\n    results = []\n    append = results.append", "for item in batch:",
+              "return results"),
+}
+
+_LOOP_TAILS = {
+    "generate": "yield item",
+    "reduce": "accumulator = function(accumulator, item)",
+    "sum": "accumulator += item",
+    "batch": "append(item)",
+}
+
+
+def _compile_loop(stages: Tuple[Tuple[str, Callable], ...], mode: str) -> Callable:
+    """
+    The stage functions are passed as arguments of the generated loop, so they are looked up as fast locals.
+    """
+    names = [f"stage{i}" for i in range(len(stages))]
+    header, loop, footer = _LOOP_HEADERS[mode]
+    lines = [header.format(stages=", ".join(names)), f"    {loop}"]
+    for name, (kind, _) in zip(names, stages):
+        if kind == "map":
+            lines.append(f"        item = {name}(item)")
+        else:
+            lines.append(f"        if not {name}(item):")
+            lines.append("            continue")
+    lines.append(f"        {_LOOP_TAILS[mode]}")
+    if footer:
+        lines.append(f"    {footer}")
+
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(lines), f"<pipeline {mode}>", "exec"), namespace)
+    return namespace["loop"]
@@ -1,11 +1,198 @@
+import hashlib
+import mmap
 import os
-from typing import Any, Callable, List, TypeVar
+import re
+import sys
+from contextlib import closing
+from functools import lru_cache
+from typing import Any, Callable, Iterator, List, Tuple, TypeVar
+
+from aoc.util.packed import FORMAT_VERSION, pack, unpack
+from aoc.util.source import hash_sources
+from aoc.util.text import generate_paragraph_views
 
 T = TypeVar('T')
 
+PARSED_SUFFIX = ".parsed"
+_PARSED_MAGIC = b"AOCP1" + sys.byteorder[0].encode()
+_UNSAFE_CHARACTERS = re.compile(r"[^\w.-]")
+
 
 def parse_input_file(origin: str,
                      filename: str,
                      callback: Callable[[List[str]], T]) -> T:
     with open(os.path.join(os.path.dirname(origin), filename)) as f:
         return callback(f.readlines())
+
+
+def stream_input_file(origin: str,
+                      filename: str,
+                      callback: Callable[[Iterator[str]], T]) -> T:
+    """
+    Same as `parse_input_file`, but the callback gets the lines lazily, read one by one from a memory map.
+    """
+    return callback(iterate_lines(os.path.join(os.path.dirname(origin), filename)))
+
+
+def parse_cached_input_file(origin: str,
+                            filename: str,
+                            callback: Callable[[List[str]], T]) -> T:
+    """
+    Same as `parse_input_file`, but the parsed value is stored next to the input the first time,
+    and read back from a memory map by the next calls, as long as neither the input nor the callback changed.
+    """
+    return load_parsed(os.path.join(os.path.dirname(origin), filename), callback)
+
+
+def load_parsed(path: str, parse: Callable[[List[str]], T]) -> T:
+    parsed_path = parsed_input_path(path, parse)
+    with open(path, "rb") as f:
+        content = f.read()
+    header = _PARSED_MAGIC + hashlib.sha256(content).digest()
+
+    if os.path.exists(parsed_path):
+        with _map_file(parsed_path) as mapped:
+            if len(mapped) > len(header) and mapped[:len(header)] == header:
+                # the views on the map must be released before it is closed
+                with memoryview(mapped) as view:
+                    return unpack(view[len(header):])
+
+    parsed = parse(content.decode().splitlines(keepends=True))
+    _drop_previous_versions(parsed_path)
+    tmp_path = f"{parsed_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(pack(parsed))
+    os.replace(tmp_path, parsed_path)
+
+    return parsed
+
+
+def parsed_input_path(path: str, parse: Callable) -> str:
+    """
+    `input.txt.<parser name>.<parser source hash>.parsed`, next to the input.
+    """
+    name = _UNSAFE_CHARACTERS.sub("_", f"{parse.__module__}.{parse.__qualname__}")
+    return f"{path}.{name}.{_parser_hash(parse)}{PARSED_SUFFIX}"
+
+
+@lru_cache(maxsize=None)
+def _parser_hash(parse: Callable) -> str:
+    """
+    Hash of the module of the parser and of its dependencies, the helpers it calls included, and of the packed format.
+    """
+    digest = hashlib.sha256(f"{FORMAT_VERSION}".encode())
+    module = sys.modules.get(parse.__module__)
+    try:
+        if module is None:
+            raise OSError(f'module {parse.__module__} of the parser is not loaded')
+        digest.update(hash_sources(module).encode())
+    except (OSError, TypeError):
+        # defined interactively, without source
+        digest.update(parse.__code__.co_code)
+
+    return digest.hexdigest()[:16]
+
+
+def _drop_previous_versions(parsed_path: str):
+    directory, name = os.path.split(parsed_path)
+    prefix = name[:-len(PARSED_SUFFIX)].rsplit(".", 1)[0] + "."
+    for entry in os.scandir(directory or "."):
+        if entry.name.startswith(prefix) and entry.name.endswith(PARSED_SUFFIX) and entry.name != name:
+            os.remove(entry.path)
+
+
+def iterate_lines(path: str) -> Iterator[str]:
+    """
+    Lines of the file, with their line ending like `readlines`, without loading the whole file in memory.
+    """
+    with _map_file(path) as mapped:
+        for line in iter(mapped.readline, b""):
+            yield line.decode()
+
+
+def iterate_records(path: str, record_size: int) -> Iterator[bytes]:
+    """
+    Fixed size records of the file, the last one being shorter if the file size is not a multiple of the record size.
+    """
+    if record_size <= 0:
+        raise ValueError(f'record size must be positive, got {record_size}')
+
+    with _map_file(path) as mapped:
+        for offset in range(0, len(mapped), record_size):
+            yield mapped[offset:offset + record_size]
+
+
+def line_aligned_ranges(path: str, chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    (start, end) byte ranges of about `chunk_size` bytes covering the file, each ending after a line ending, so every
+    line is in exactly one range.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f'chunk size must be positive, got {chunk_size}')
+
+    ranges = []
+    with _map_file(path) as mapped:
+        start = 0
+        while start < len(mapped):
+            newline = mapped.find(b"\n", min(start + chunk_size, len(mapped)) - 1)
+            end = len(mapped) if newline == -1 else newline + 1
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+def read_range(path: str, start: int, end: int) -> bytes:
+    with _map_file(path) as mapped:
+        return mapped[start:end]
+
+
+def iterate_paragraphs(path: str) -> Iterator[memoryview]:
+    """
+    Paragraphs of the file, as views on a memory map of the file.
+    A view is released when the next paragraph is requested, it must be copied to be kept.
+    """
+    with _map_file(path) as mapped:
+        if not len(mapped):
+            return
+
+        # the views on the map must be released before it is closed, even when the iteration is stopped early
+        with closing(generate_paragraph_views(mapped)) as paragraphs:
+            for paragraph in paragraphs:
+                with paragraph:
+                    yield paragraph
+
+
+class _EmptyMap:
+    """
+    An empty file can not be memory mapped.
+    """
+    def __enter__(self) -> "_EmptyMap":
+        return self
+
+    def __exit__(self, *_: Any):
+        pass
+
+    def __len__(self) -> int:
+        return 0
+
+    def __getitem__(self, index: Any) -> bytes:
+        return b""[index]
+
+    @staticmethod
+    def readline() -> bytes:
+        return b""
+
+    @staticmethod
+    def find(*_: Any) -> int:
+        return -1
+
+
+def _map_file(path: str):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return _EmptyMap()
+
+        # the map keeps its own handle on the file, it stays valid after the file is closed
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
@@ -0,0 +1,97 @@
+"""
+Counters, timers and trace events for the solvers, replacing debug flags and prints.
+
+Disabled by default. The call sites guard on the flags, the same way `DEBUG and print(...)` did,
+so a disabled instrumentation costs one attribute lookup:
+
+    INSTRUMENTATION.enabled and INSTRUMENTATION.count("day23.expanded_states")
+    INSTRUMENTATION.tracing and INSTRUMENTATION.trace("day23.path", states=[...])
+"""
+import json
+import time
+from collections import defaultdict
+from typing import Any, Dict, List
+
+
+class _Timer:
+    def __init__(self, instrumentation: "Instrumentation", name: str):
+        self._instrumentation = instrumentation
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_: Any):
+        self._instrumentation.add_time(self._name, time.perf_counter() - self._start)
+
+
+class _NoTimer:
+    def __enter__(self) -> "_NoTimer":
+        return self
+
+    def __exit__(self, *_: Any):
+        pass
+
+
+_NO_TIMER = _NoTimer()
+
+
+class Instrumentation:
+    def __init__(self):
+        self.enabled = False
+        self.tracing = False
+        self._counters: Dict[str, int] = defaultdict(int)
+        self._timers: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])  # [count, total seconds]
+        self._events: List[Dict[str, Any]] = []
+
+    def enable(self, trace: bool = False):
+        self.enabled = True
+        self.tracing = trace
+
+    def disable(self):
+        self.enabled = False
+        self.tracing = False
+
+    def reset(self):
+        self._counters.clear()
+        self._timers.clear()
+        self._events.clear()
+
+    def count(self, name: str, increment: int = 1):
+        if self.enabled:
+            self._counters[name] += increment
+
+    def add_time(self, name: str, seconds: float):
+        if self.enabled:
+            timer = self._timers[name]
+            timer[0] += 1
+            timer[1] += seconds
+
+    def timer(self, name: str):
+        """
+        Context manager adding the time spent in the block to the timer `name`.
+        """
+        return _Timer(self, name) if self.enabled else _NO_TIMER
+
+    def trace(self, name: str, **fields: Any):
+        if self.tracing:
+            self._events.append({"name": name, "time": time.perf_counter(), **fields})
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "counters": dict(self._counters),
+            "timers": {
+                name: {"count": count, "total": total}
+                for name, (count, total) in self._timers.items()
+            },
+            "events": list(self._events),
+        }
+
+    def export(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.snapshot(), f, indent=2, default=str)
+
+
+INSTRUMENTATION = Instrumentation()
@@ -1,6 +1,7 @@
 from functools import reduce
+from itertools import chain
 from operator import add
-from typing import TypeVar, Iterable, List
+from typing import TypeVar, Iterable, Iterator, List
 
 T = TypeVar("T")
 
@@ -13,6 +14,13 @@ def flat_map(iterable: Iterable[Iterable[T]]) -> List[T]:
     ]
 
 
+def iterate_flat_map(iterable: Iterable[Iterable[T]]) -> Iterator[T]:
+    """
+    Lazy version of `flat_map`, the inner iterables are consumed one at a time.
+    """
+    return chain.from_iterable(iterable)
+
+
 def last(iterable: Iterable[T],
          default_value: T) -> T:
     _last = default_value
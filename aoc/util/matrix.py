@@ -1,4 +1,5 @@
-from typing import List, TypeVar, ClassVar
+from array import array
+from typing import List, TypeVar, ClassVar, Tuple
 
 T = TypeVar('T')
 
@@ -21,3 +22,125 @@ def serialize_matrix(matrix: List[List[int]]) -> str:
         " ".join(map(str, row))
         for row in matrix
     ))
+
+
+class Grid:
+    """
+    Row-major grid of ints in a flat array, one machine int per cell instead of a list per row and a python int
+    per cell. A cell is addressed by its index `y * width + x`, its neighbours by adding the offsets of
+    `offsets_4` / `offsets_8`, once checked they stay inside the grid with `neighbours_4` / `neighbours_8`.
+
+    The typecode is the one of `array`: 'b' / 'B' for values fitting a byte, 'i' / 'l' / 'q' for bigger ones.
+    """
+    def __init__(self, width: int, height: int, fill: int = 0, typecode: str = 'B'):
+        self._width = width
+        self._height = height
+        self._cells = array(typecode, [fill]) * (width * height)
+        # (index offset, x offset)
+        self._offsets_4 = [(-width, 0), (-1, -1), (1, 1), (width, 0)]
+        self._offsets_8 = [
+            (dy * width + dx, dx)
+            for dy in (-1, 0, 1)
+            for dx in (-1, 0, 1)
+            if dx != 0 or dy != 0
+        ]
+
+    @staticmethod
+    def from_rows(rows: List[List[int]], typecode: str = 'B') -> "Grid":
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError(f'all the rows must have the same length, got {sorted({len(row) for row in rows})}')
+
+        grid = Grid(width, len(rows), typecode=typecode)
+        grid._cells = array(typecode, (cell for row in rows for cell in row))
+        return grid
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def cells(self) -> array:
+        return self._cells
+
+    @property
+    def offsets_4(self) -> List[Tuple[int, int]]:
+        return self._offsets_4
+
+    @property
+    def offsets_8(self) -> List[Tuple[int, int]]:
+        return self._offsets_8
+
+    def index(self, x: int, y: int) -> int:
+        return y * self._width + x
+
+    def coordinates(self, index: int) -> Tuple[int, int]:
+        y, x = divmod(index, self._width)
+        return x, y
+
+    def __getitem__(self, index: int) -> int:
+        return self._cells[index]
+
+    def __setitem__(self, index: int, value: int):
+        self._cells[index] = value
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def get(self, x: int, y: int) -> int:
+        return self._cells[y * self._width + x]
+
+    def set(self, x: int, y: int, value: int):
+        self._cells[y * self._width + x] = value
+
+    def neighbours_4(self, index: int) -> List[int]:
+        return self._neighbours(index, self._offsets_4)
+
+    def neighbours_8(self, index: int) -> List[int]:
+        return self._neighbours(index, self._offsets_8)
+
+    def _neighbours(self, index: int, offsets: List[Tuple[int, int]]) -> List[int]:
+        x = index % self._width
+        size = len(self._cells)
+        return [
+            index + offset
+            for offset, dx in offsets
+            if 0 <= x + dx < self._width and 0 <= index + offset < size
+        ]
+
+    def fill(self, value: int):
+        self._cells[:] = array(self._cells.typecode, [value]) * len(self._cells)
+
+    def copy(self) -> "Grid":
+        grid = Grid(0, 0, typecode=self._cells.typecode)
+        grid._width = self._width
+        grid._height = self._height
+        grid._cells = array(self._cells.typecode, self._cells)
+        grid._offsets_4 = self._offsets_4
+        grid._offsets_8 = self._offsets_8
+        return grid
+
+    def rows(self) -> List[List[int]]:
+        if self._width == 0:
+            return [[] for _ in range(self._height)]
+
+        return [
+            self._cells[start:start + self._width].tolist()
+            for start in range(0, len(self._cells), self._width)
+        ]
+
+    def serialize(self) -> str:
+        """
+        Same format as `serialize_matrix`.
+        """
+        return serialize_matrix(self.rows())
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Grid) and self._width == other._width and self._cells == other._cells
+
+    def __repr__(self) -> str:
+        return f"Grid(width={self._width}, height={self._height}, typecode={self._cells.typecode!r})"
@@ -0,0 +1,186 @@
+"""
+Caches bounded by a number of entries or an estimated size in bytes, evicting the least recently (LRU)
+or the least frequently (LFU) used entries.
+
+With a name, the hits, misses and evictions are also counted by the instrumentation, as `<name>.hits`,
+`<name>.misses` and `<name>.evictions`.
+"""
+import sys
+from collections import OrderedDict, defaultdict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, TypeVar
+
+from aoc.util.instrumentation import INSTRUMENTATION
+
+T = TypeVar("T")
+
+LRU = "lru"
+LFU = "lfu"
+
+_MISSING = object()
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int  # estimated bytes
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def estimate_size(key: Any, value: Any) -> int:
+    """
+    Shallow size of the key and the value: the objects they reference are not counted.
+    """
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+class BoundedCache:
+    def __init__(self,
+                 max_entries: Optional[int] = None,
+                 max_bytes: Optional[int] = None,
+                 policy: str = LRU,
+                 name: Optional[str] = None,
+                 sizeof: Callable[[Any, Any], int] = estimate_size):
+        if policy not in (LRU, LFU):
+            raise ValueError(f'unknown eviction policy {policy}, expected {LRU} or {LFU}')
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError(f'max entries must be positive, got {max_entries}')
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._lfu = policy == LFU
+        self._name = name
+        self._sizeof = sizeof
+        self._entries: Dict[Hashable, list] = {}  # key -> [value, size, frequency]
+        # keys by frequency for LFU, a single bucket kept in recency order for LRU
+        self._buckets: Dict[int, OrderedDict] = defaultdict(OrderedDict)
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            self._count("misses")
+            return default
+
+        self._hits += 1
+        self._count("hits")
+        self._touch(key, entry)
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any):
+        size = self._sizeof(key, value)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._size += size - entry[1]
+            entry[0] = value
+            entry[1] = size
+            self._touch(key, entry)
+        else:
+            self._entries[key] = [value, size, 1]
+            self._buckets[1 if self._lfu else 0][key] = None
+            self._size += size
+
+        self._evict(protected=key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+        self._buckets.clear()
+        self._size = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self._hits, self._misses, self._evictions, len(self._entries), self._size)
+
+    def _touch(self, key: Hashable, entry: list):
+        if not self._lfu:
+            self._buckets[0].move_to_end(key)
+            return
+
+        frequency = entry[2]
+        self._unlink(key, frequency)
+        entry[2] = frequency + 1
+        self._buckets[frequency + 1][key] = None
+
+    def _evict(self, protected: Hashable):
+        """
+        The entry just stored is only evicted when it does not fit alone.
+        """
+        while self._over_limits():
+            victim = self._victim(protected)
+            self._remove(victim)
+            self._evictions += 1
+            self._count("evictions")
+
+    def _over_limits(self) -> bool:
+        return (
+            (self._max_entries is not None and len(self._entries) > self._max_entries)
+            or (self._max_bytes is not None and self._size > self._max_bytes)
+        )
+
+    def _victim(self, protected: Hashable) -> Hashable:
+        """
+        The first key of the lowest frequency bucket, LRU entries being all in one bucket in recency order.
+        """
+        for frequency in sorted(self._buckets):
+            for key in self._buckets[frequency]:
+                if key != protected:
+                    return key
+
+        return protected
+
+    def _remove(self, key: Hashable):
+        _, size, frequency = self._entries.pop(key)
+        self._unlink(key, frequency)
+        self._size -= size
+
+    def _unlink(self, key: Hashable, frequency: int):
+        bucket_key = frequency if self._lfu else 0
+        bucket = self._buckets[bucket_key]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[bucket_key]
+
+    def _count(self, event: str):
+        self._name and INSTRUMENTATION.enabled and INSTRUMENTATION.count(f"{self._name}.{event}")
+
+
+def memoize(max_entries: Optional[int] = None,
+            max_bytes: Optional[int] = None,
+            policy: str = LRU,
+            name: Optional[str] = None) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Same as `functools.lru_cache`, with the bounds and the statistics of `BoundedCache`.
+    The cache of a decorated function is its `cache` attribute.
+    """
+    def decorator(fn: Callable[..., T]) -> Callable[..., T]:
+        cache = BoundedCache(max_entries, max_bytes, policy, name)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = fn(*args, **kwargs)
+                cache.put(key, value)
+
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,267 @@
+"""
+Compact binary encoding of parsed inputs.
+
+Lists of ints, grids (lists of int lists) and lists of int tuples or named tuples such as coordinates are stored as
+typed arrays, with the narrowest item size holding their values: they are read back from a memory map in one slice.
+Containers holding such arrays are encoded item by item, and everything else is pickled, as unpickling is faster
+than decoding small values one by one in python.
+"""
+import importlib
+import pickle
+import struct
+import sys
+from array import array
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+# changed with the encoding, to stop reading the files of a previous one
+FORMAT_VERSION = 2
+
+_NAMED_TUPLE = b"n"
+_LIST = b"l"
+_TUPLE = b"t"
+_DICT = b"d"
+_INT_LIST = b"A"
+_INT_TUPLE = b"T"
+_GRID = b"G"
+_RECORDS = b"R"
+_PICKLE = b"p"
+
+_COUNT = struct.Struct("<I")
+# the arrays are stored little-endian like the counts, swapped on the way in and out on big-endian hosts
+_BIG_ENDIAN = sys.byteorder == "big"
+
+# narrowest first
+_TYPECODES = [
+    (typecode, -(1 << (8 * array(typecode).itemsize - 1)), (1 << (8 * array(typecode).itemsize - 1)) - 1)
+    for typecode in ("b", "h", "i", "q")
+]
+
+
+def pack(value: Any) -> bytes:
+    chunks: List[bytes] = []
+    _pack(value, chunks)
+    return b"".join(chunks)
+
+
+def unpack(buffer: Any) -> Any:
+    """
+    `buffer` is anything exposing the buffer protocol, a memory map included.
+    """
+    view = memoryview(buffer)
+    value, offset = _unpack(view, 0)
+    if offset != len(view):
+        raise ValueError(f"{len(view) - offset} trailing bytes after the packed value")
+
+    return value
+
+
+def _is_int(value: Any) -> bool:
+    return type(value) is int and _TYPECODES[-1][1] <= value <= _TYPECODES[-1][2]
+
+
+def _is_named_tuple(value: Any) -> bool:
+    return isinstance(value, tuple) and hasattr(value, "_fields") and "<locals>" not in type(value).__qualname__
+
+
+def _is_int_sequence(value: Any) -> bool:
+    return type(value) in (list, tuple) and len(value) > 0 and all(_is_int(item) for item in value)
+
+
+def _is_grid(value: Any) -> bool:
+    return (
+        type(value) is list
+        and len(value) > 0
+        and all(type(row) is list for row in value)
+        and any(row for row in value)
+        and all(_is_int(item) for row in value for item in row)
+    )
+
+
+def _are_int_records(value: Any) -> bool:
+    if type(value) is not list or not value or not (type(value[0]) is tuple or _is_named_tuple(value[0])):
+        return False
+
+    cls = type(value[0])
+    width = len(value[0])
+    return width > 0 and all(
+        type(record) is cls and len(record) == width and all(_is_int(field) for field in record)
+        for record in value
+    )
+
+
+def _is_array(value: Any) -> bool:
+    return _is_int_sequence(value) or _is_grid(value) or _are_int_records(value)
+
+
+def _holds_array(value: Any) -> bool:
+    if _is_array(value):
+        return True
+    if type(value) is dict:
+        return any(_holds_array(item) for item in value.values())
+    if type(value) in (list, tuple) or _is_named_tuple(value):
+        return any(_holds_array(item) for item in value)
+
+    return False
+
+
+def _pack_array(values: Iterable[int], chunks: List[bytes]):
+    values = array("q", values)
+    low, high = (min(values), max(values)) if values else (0, 0)
+    typecode = next(code for code, minimum, maximum in _TYPECODES if minimum <= low and high <= maximum)
+    packed = array(typecode, values)
+    if _BIG_ENDIAN:
+        packed.byteswap()
+    chunks += [typecode.encode(), _COUNT.pack(len(values)), packed.tobytes()]
+
+
+def _pack_str(value: str, chunks: List[bytes]):
+    encoded = value.encode()
+    chunks += [_COUNT.pack(len(encoded)), encoded]
+
+
+def _pack_class(cls: type, chunks: List[bytes]):
+    _pack_str(cls.__module__, chunks)
+    _pack_str(cls.__qualname__, chunks)
+
+
+def _pack(value: Any, chunks: List[bytes]):
+    if _is_int_sequence(value):
+        chunks.append(_INT_LIST if type(value) is list else _INT_TUPLE)
+        _pack_array(value, chunks)
+    elif _is_grid(value):
+        chunks.append(_GRID)
+        _pack_array((len(row) for row in value), chunks)
+        _pack_array((item for row in value for item in row), chunks)
+    elif _are_int_records(value):
+        chunks.append(_RECORDS)
+        _pack_class(type(value[0]), chunks)
+        chunks.append(_COUNT.pack(len(value[0])))
+        _pack_array((field for record in value for field in record), chunks)
+    elif not _holds_array(value):
+        pickled = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        chunks += [_PICKLE, _COUNT.pack(len(pickled)), pickled]
+    elif type(value) is dict:
+        chunks += [_DICT, _COUNT.pack(len(value))]
+        for key, item in value.items():
+            _pack(key, chunks)
+            _pack(item, chunks)
+    else:
+        if _is_named_tuple(value):
+            chunks.append(_NAMED_TUPLE)
+            _pack_class(type(value), chunks)
+        else:
+            chunks.append(_LIST if type(value) is list else _TUPLE)
+        chunks.append(_COUNT.pack(len(value)))
+        for item in value:
+            _pack(item, chunks)
+
+
+def _read_count(view: memoryview, offset: int) -> Tuple[int, int]:
+    return _COUNT.unpack_from(view, offset)[0], offset + _COUNT.size
+
+
+def _read_array(view: memoryview, offset: int) -> Tuple[List[int], int]:
+    typecode = chr(view[offset])
+    count, offset = _read_count(view, offset + 1)
+    end = offset + count * array(typecode).itemsize
+    if not _BIG_ENDIAN:
+        return view[offset:end].cast(typecode).tolist(), end
+
+    values = array(typecode, view[offset:end].tobytes())
+    values.byteswap()
+    return values.tolist(), end
+
+
+def _read_str(view: memoryview, offset: int) -> Tuple[str, int]:
+    length, offset = _read_count(view, offset)
+    return str(view[offset:offset + length], "utf-8"), offset + length
+
+
+def _read_class(view: memoryview, offset: int) -> Tuple[type, int]:
+    module_name, offset = _read_str(view, offset)
+    qualname, offset = _read_str(view, offset)
+    resolved: Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        resolved = getattr(resolved, name)
+
+    return resolved, offset
+
+
+def _unpack(view: memoryview, offset: int) -> Tuple[Any, int]:
+    return _UNPACKERS[bytes(view[offset:offset + 1])](view, offset + 1)
+
+
+def _unpack_items(view: memoryview, offset: int) -> Tuple[List, int]:
+    count, offset = _read_count(view, offset)
+    items = []
+    for _ in range(count):
+        item, offset = _unpack(view, offset)
+        items.append(item)
+
+    return items, offset
+
+
+def _unpack_tuple(view: memoryview, offset: int) -> Tuple[Tuple, int]:
+    items, offset = _unpack_items(view, offset)
+    return tuple(items), offset
+
+
+def _unpack_named_tuple(view: memoryview, offset: int) -> Tuple[Tuple, int]:
+    cls, offset = _read_class(view, offset)
+    items, offset = _unpack_items(view, offset)
+    return cls._make(items), offset
+
+
+def _unpack_dict(view: memoryview, offset: int) -> Tuple[Dict, int]:
+    count, offset = _read_count(view, offset)
+    result = {}
+    for _ in range(count):
+        key, offset = _unpack(view, offset)
+        result[key], offset = _unpack(view, offset)
+
+    return result, offset
+
+
+def _unpack_int_tuple(view: memoryview, offset: int) -> Tuple[Tuple, int]:
+    values, offset = _read_array(view, offset)
+    return tuple(values), offset
+
+
+def _unpack_grid(view: memoryview, offset: int) -> Tuple[List[List[int]], int]:
+    lengths, offset = _read_array(view, offset)
+    cells, offset = _read_array(view, offset)
+    rows = []
+    start = 0
+    for length in lengths:
+        rows.append(cells[start:start + length])
+        start += length
+
+    return rows, offset
+
+
+def _unpack_records(view: memoryview, offset: int) -> Tuple[List[Tuple], int]:
+    cls, offset = _read_class(view, offset)
+    width, offset = _read_count(view, offset)
+    fields, offset = _read_array(view, offset)
+    records = zip(*[iter(fields)] * width)
+    # skips the python level __new__ of the named tuples
+    return list(records) if cls is tuple else list(map(partial(tuple.__new__, cls), records)), offset
+
+
+def _unpack_pickle(view: memoryview, offset: int) -> Tuple[Any, int]:
+    length, offset = _read_count(view, offset)
+    return pickle.loads(view[offset:offset + length]), offset + length
+
+
+_UNPACKERS: Dict[bytes, Callable[[memoryview, int], Tuple[Any, int]]] = {
+    _NAMED_TUPLE: _unpack_named_tuple,
+    _LIST: _unpack_items,
+    _TUPLE: _unpack_tuple,
+    _DICT: _unpack_dict,
+    _INT_LIST: _read_array,
+    _INT_TUPLE: _unpack_int_tuple,
+    _GRID: _unpack_grid,
+    _RECORDS: _unpack_records,
+    _PICKLE: _unpack_pickle,
+}
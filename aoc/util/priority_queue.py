@@ -38,3 +38,135 @@ class PriorityQueue:
 
     def length(self) -> int:
         return len(self._entry_finder)
+
+
+class IndexedPriorityQueue:
+    """
+    Same API as `PriorityQueue`, on a d-ary heap with the position of every value: a priority update moves
+    the entry in place instead of leaving a removed one behind, so the heap holds only the live entries.
+    Values with the same priority are popped in the order they were pushed.
+    """
+    def __init__(self, arity: int = 4):
+        if arity < 2:
+            raise ValueError(f'arity must be at least 2, got {arity}')
+
+        self._arity = arity
+        self._heap = []  # [priority, count, value], the count breaking the ties before the values are compared
+        self._positions = {}
+        self._counter = itertools.count()
+
+    def push(self, value: Any, priority=0):
+        count = next(self._counter)
+        position = self._positions.get(value)
+        if position is None:
+            self._heap.append([priority, count, value])
+            self._sift_up(len(self._heap) - 1)
+            return
+
+        entry = self._heap[position]
+        increased = [priority, count] > entry[:2]
+        entry[0] = priority
+        entry[1] = count
+        if increased:
+            self._sift_down(position)
+        else:
+            self._sift_up(position)
+
+    def pop(self) -> Any:
+        if not self._heap:
+            raise KeyError('pop from an empty priority queue')
+
+        _, __, value = self._heap[0]
+        del self._positions[value]
+        last = self._heap.pop()
+        if self._heap:
+            self._heap[0] = last
+            self._sift_down(0)
+
+        return value
+
+    def length(self) -> int:
+        return len(self._heap)
+
+    def _sift_up(self, index: int):
+        heap = self._heap
+        positions = self._positions
+        entry = heap[index]
+        while index > 0:
+            parent = (index - 1) // self._arity
+            parent_entry = heap[parent]
+            if not entry < parent_entry:
+                break
+            heap[index] = parent_entry
+            positions[parent_entry[2]] = index
+            index = parent
+
+        heap[index] = entry
+        positions[entry[2]] = index
+
+    def _sift_down(self, index: int):
+        heap = self._heap
+        positions = self._positions
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            first_child = self._arity * index + 1
+            if first_child >= size:
+                break
+            best = first_child
+            best_entry = heap[first_child]
+            for child in range(first_child + 1, min(first_child + self._arity, size)):
+                if heap[child] < best_entry:
+                    best = child
+                    best_entry = heap[child]
+            if not best_entry < entry:
+                break
+            heap[index] = best_entry
+            positions[best_entry[2]] = index
+            index = best
+
+        heap[index] = entry
+        positions[entry[2]] = index
+
+
+class BucketQueue:
+    """
+    Dial's bucket queue, for integer priorities never lower than the last popped one, and at most `max_increment`
+    above it: the case of a shortest path with small integer weights. Every priority of that window has its own
+    bucket in a circular array, a value is moved between buckets when its priority changes, so nothing is left behind.
+    """
+    def __init__(self, max_increment: int, start: int = 0):
+        if max_increment < 0:
+            raise ValueError(f'max increment must not be negative, got {max_increment}')
+
+        self._buckets = [{} for _ in range(max_increment + 1)]
+        self._priorities = {}
+        self._current = start  # lowest priority allowed, the last popped one
+        self._max_increment = max_increment
+
+    def push(self, value: Any, priority: int = 0):
+        if not self._current <= priority <= self._current + self._max_increment:
+            raise ValueError(f'priority {priority} out of [{self._current}, {self._current + self._max_increment}]')
+
+        previous = self._priorities.get(value)
+        if previous is not None:
+            del self._buckets[previous % len(self._buckets)][value]
+
+        self._priorities[value] = priority
+        self._buckets[priority % len(self._buckets)][value] = None
+
+    def pop(self) -> Any:
+        if not self._priorities:
+            raise KeyError('pop from an empty priority queue')
+
+        bucket = self._buckets[self._current % len(self._buckets)]
+        while not bucket:
+            self._current += 1
+            bucket = self._buckets[self._current % len(self._buckets)]
+
+        value, _ = bucket.popitem()
+        del self._priorities[value]
+        return value
+
+    def length(self) -> int:
+        return len(self._priorities)
@@ -0,0 +1,89 @@
+"""
+Graph searches shared by the solvers, driven by callbacks giving the neighbours of a node.
+
+The frontier of `shortest_path` is any queue with the `push(value, priority)`, `pop()` and `length()` methods of
+`aoc.util.priority_queue`: a `BucketQueue` is the fastest when the edge costs are small integers.
+"""
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, TypeVar
+
+from aoc.util.priority_queue import PriorityQueue
+
+T = TypeVar("T")
+
+
+class SearchResult(NamedTuple):
+    cost: Optional[int]  # None when no target was reached
+    target: Any
+    path: Optional[List[Any]]  # start to target, only when requested
+    expanded: int  # nodes popped from the frontier
+    pushed: int  # neighbours pushed in the frontier, updates of their priority included
+
+
+def shortest_path(start: T,
+                  is_target: Callable[[T], bool],
+                  neighbours: Callable[[T], Iterable[Tuple[T, int]]],
+                  heuristic: Optional[Callable[[T], int]] = None,
+                  frontier=None,
+                  with_path: bool = False) -> SearchResult:
+    """
+    Dijkstra, or A* with a `heuristic` never overestimating the remaining cost.
+    `neighbours` gives the (node, cost) pairs reachable from a node, the costs being non-negative.
+    """
+    if frontier is None:
+        frontier = PriorityQueue()
+
+    frontier.push(start, 0)
+    cost_so_far: Dict[T, int] = {start: 0}
+    came_from: Optional[Dict[T, Optional[T]]] = {start: None} if with_path else None
+    expanded = 0
+    pushed = 0
+    # bound once, the loop runs for every node of the graph
+    push, pop, length, known_cost = frontier.push, frontier.pop, frontier.length, cost_so_far.get
+    while length() > 0:
+        current = pop()
+        expanded += 1
+        if is_target(current):
+            path = _reconstruct_path(came_from, current) if with_path else None
+            return SearchResult(cost_so_far[current], current, path, expanded, pushed)
+
+        current_cost = cost_so_far[current]
+        for neighbour, cost in neighbours(current):
+            new_cost = current_cost + cost
+            existing_cost = known_cost(neighbour)
+            if existing_cost is None or new_cost < existing_cost:
+                cost_so_far[neighbour] = new_cost
+                push(neighbour, new_cost + heuristic(neighbour) if heuristic else new_cost)
+                pushed += 1
+                if with_path:
+                    came_from[neighbour] = current
+
+    return SearchResult(None, None, None, expanded, pushed)
+
+
+def _reconstruct_path(came_from: Dict[T, Optional[T]], target: T) -> List[T]:
+    path = [target]
+    current = came_from[target]
+    while current is not None:
+        path.append(current)
+        current = came_from[current]
+
+    return path[::-1]
+
+
+def breadth_first(starts: Iterable[T], successors: Callable[[T], Iterable[T]], unique: bool = False) -> Iterator[T]:
+    """
+    Every node reachable from the starts, in breadth first order.
+    Without `unique`, a node is visited again each time it is reached, as when enumerating the paths of a graph.
+    """
+    queue = deque(starts)
+    seen = set(queue) if unique else None
+    while queue:
+        node = queue.popleft()
+        yield node
+        for successor in successors(node):
+            if unique:
+                if successor in seen:
+                    continue
+                seen.add(successor)
+            queue.append(successor)
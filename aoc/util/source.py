@@ -0,0 +1,47 @@
+"""
+Hashes of the source code of a module and of the modules it depends on, to invalidate what was computed
+by a previous version of the code.
+"""
+import hashlib
+import inspect
+import sys
+from types import ModuleType
+from typing import List, Set
+
+PACKAGE = "aoc"
+
+
+def module_dependencies(module: ModuleType) -> List[ModuleType]:
+    """
+    The module and the modules of its package or of `aoc` it uses, directly or through the other ones,
+    sorted by name. A module is used when it is imported, or when one of its classes or functions is.
+    """
+    packages = {PACKAGE, module.__name__.split(".")[0]}
+    seen: Set[str] = {module.__name__}
+    pending = [module]
+    while pending:
+        for value in vars(pending.pop()).values():
+            name = value.__name__ if isinstance(value, ModuleType) else getattr(value, "__module__", None)
+            if (
+                isinstance(name, str)
+                and name not in seen
+                and name.split(".")[0] in packages
+                and name in sys.modules
+            ):
+                seen.add(name)
+                pending.append(sys.modules[name])
+
+    return [sys.modules[name] for name in sorted(seen)]
+
+
+def hash_sources(module: ModuleType) -> str:
+    """
+    Hash of the source of the module and of its dependencies: a change in a shared utility, even one only used
+    through another utility, changes the hash of every module using it.
+    """
+    digest = hashlib.sha256()
+    for dependency in module_dependencies(module):
+        digest.update(dependency.__name__.encode())
+        digest.update(inspect.getsource(dependency).encode())
+
+    return digest.hexdigest()
@@ -1,4 +1,8 @@
-from typing import Iterator, List, Iterable
+import re
+from typing import Any, Iterator, List, Iterable
+
+# a paragraph starts with a non blank character, and goes on until a blank line or the end of the buffer
+_PARAGRAPH = re.compile(rb"\S(?:[^\n]|\n(?![ \t\r]*(?:\n|\Z)))*")
 
 
 def generate_paragraphs(raw_entries: Iterable[str]) -> Iterator[List[str]]:
@@ -14,3 +18,13 @@ def generate_paragraphs(raw_entries: Iterable[str]) -> Iterator[List[str]]:
 
     if buf:
         yield buf
+
+
+def generate_paragraph_views(buffer: Any) -> Iterator[memoryview]:
+    """
+    Paragraphs of a bytes-like buffer, a memory map included, as views on the buffer: nothing is copied.
+    The views keep their inner line endings, `str(view, "utf-8").splitlines()` gives the lines of a paragraph.
+    """
+    view = memoryview(buffer)
+    for match in _PARAGRAPH.finditer(buffer):
+        yield view[match.start():match.end()]
@@ -0,0 +1,91 @@
+from hamcrest import assert_that, equal_to, has_length, contains_exactly, close_to
+
+from aoc.bench.benchmark import BenchmarkCase, Timing, main, percentile, find_regressions, run_case, select_cases, \
+    save_results, load_results
+
+
+class TestBenchmark:
+    def test_should_compute_percentile(self):
+        # GIVEN
+        durations = [float(d) for d in range(1, 21)]
+
+        # WHEN
+        p95 = percentile(durations, 95)
+        p50 = percentile(durations, 50)
+
+        # THEN
+        assert_that(p95, equal_to(19.0))
+        assert_that(p50, equal_to(10.0))
+
+    def test_should_time_case_for_every_scale(self):
+        # GIVEN
+        case = BenchmarkCase(1, "count_increases", scales=(1, 2))
+
+        # WHEN
+        timings = run_case(case, repeat=3)
+
+        # THEN
+        assert_that(list(timings.keys()), equal_to(["2000", "4000"]))
+
+    def test_should_find_regressions_above_threshold(self):
+        # GIVEN
+        baseline = {
+            "day1.count_increases": {"100": Timing(0.010, 0.012), "1000": Timing(0.100, 0.120)},
+            "day2.calculate_position": {"100": Timing(0.010, 0.012)},
+        }
+        current = {
+            "day1.count_increases": {"100": Timing(0.0105, 0.012), "1000": Timing(0.150, 0.160)},
+            "day2.calculate_position": {"100": Timing(0.005, 0.006)},
+            "day3.calculate_rate": {"100": Timing(1.0, 1.0)},
+        }
+
+        # WHEN
+        regressions = find_regressions(baseline, current, threshold=10)
+
+        # THEN
+        assert_that(regressions, has_length(1))
+        assert_that(regressions[0].size, equal_to("1000"))
+        assert_that(regressions[0].percent, close_to(50, 0.001))
+
+    def test_should_ignore_regressions_below_min_delta(self):
+        # GIVEN
+        baseline = {"day1.count_increases": {"100": Timing(0.0001, 0.0001)}}
+        current = {"day1.count_increases": {"100": Timing(0.0003, 0.0003)}}
+
+        # WHEN
+        regressions = find_regressions(baseline, current, threshold=10, min_delta=0.001)
+
+        # THEN
+        assert_that(regressions, has_length(0))
+
+    def test_should_select_cases_by_day_or_function(self):
+        # WHEN
+        cases = select_cases(["day7", "day22.count_cubes"])
+
+        # THEN
+        assert_that([c.name for c in cases], contains_exactly(
+            "day7.calculate_amount_of_fuel",
+            "day7.calculate_amount_of_fuel_2",
+            "day22.count_cubes"
+        ))
+
+    def test_should_save_and_load_results(self, tmp_path):
+        # GIVEN
+        results = {"day1.count_increases": {"100": Timing(0.1, 0.2)}}
+        path = str(tmp_path / "baseline.json")
+
+        # WHEN
+        save_results(path, results)
+
+        # THEN
+        assert_that(load_results(path), equal_to(results))
+
+    def test_should_fail_to_compare_without_baseline(self, tmp_path):
+        # GIVEN
+        path = str(tmp_path / "missing.json")
+
+        # WHEN
+        exit_code = main(["compare", "--baseline", path, "--case", "day1"])
+
+        # THEN
+        assert_that(exit_code, equal_to(2))
@@ -0,0 +1,97 @@
+import pytest
+from hamcrest import assert_that, equal_to, has_length, not_, greater_than, has_item
+
+from aoc.bench.generators import GENERATORS, generate, write_input
+from aoc.day19.beacon_scanner import find_beacon_coordinates
+from aoc.day3.binary_diagnostic import calculate_life_support_rating
+from aoc.runner.registry import load_solver
+
+
+class TestGenerators:
+    def test_should_have_a_generator_for_every_day(self):
+        # THEN
+        assert_that(sorted(GENERATORS.keys()), equal_to(list(range(1, 24))))
+
+    @pytest.mark.parametrize("day", range(1, 24))
+    def test_should_generate_the_same_input_for_the_same_seed(self, day):
+        # WHEN
+        first = generate(day, seed=7, size=None if GENERATORS[day].puzzle_size is None else 12)
+        second = generate(day, seed=7, size=None if GENERATORS[day].puzzle_size is None else 12)
+
+        # THEN
+        assert_that(first, equal_to(second))
+
+    @pytest.mark.parametrize("day", range(1, 24))
+    def test_should_generate_input_parsed_by_the_day_solver(self, day):
+        # GIVEN
+        lines = generate(day, seed=1)
+
+        # WHEN
+        parsed = load_solver(day).parse(lines)
+
+        # THEN
+        assert_that(parsed, not_(equal_to(None)))
+
+    def test_should_scale_input(self):
+        # WHEN
+        lines = generate(1, scale=10)
+
+        # THEN
+        assert_that(lines, has_length(10 * GENERATORS[1].puzzle_size))
+
+    def test_should_refuse_to_scale_fixed_size_input(self):
+        # WHEN / THEN
+        with pytest.raises(ValueError):
+            generate(21, scale=2)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_should_generate_diagnostic_with_life_support_rating(self, seed):
+        # GIVEN
+        lines = generate(3, seed=seed, size=50)
+        numbers = [int(line, 2) for line in lines]
+
+        # WHEN
+        rating = calculate_life_support_rating(numbers, len(lines[0].strip()))
+
+        # THEN
+        assert_that(rating, greater_than(0))
+
+    @pytest.mark.parametrize("day", [2, 4, 5, 8, 10, 13, 14, 16, 17, 22])
+    def test_should_generate_solvable_input(self, day):
+        # GIVEN
+        solver = load_solver(day)
+        lines = generate(day, seed=3)
+
+        # WHEN
+        answers = [solver.part(part)(solver.parse(lines)) for part in solver.parts]
+
+        # THEN
+        assert_that(answers, has_length(2))
+
+    def test_should_generate_matching_scanners(self):
+        # GIVEN
+        scanners = load_solver(19).parse(generate(19, seed=2, size=4))
+
+        # WHEN
+        beacons, scanner_coordinates = find_beacon_coordinates(scanners)
+
+        # THEN
+        assert_that(scanner_coordinates, not_(has_item(None)))
+        assert_that(len(beacons), greater_than(12))
+
+    @pytest.mark.parametrize("day,size", [(12, 542), (13, 2_000_000)])
+    def test_should_refuse_sizes_not_fitting_the_input(self, day, size):
+        # WHEN / THEN
+        with pytest.raises(ValueError):
+            generate(day, size=size)
+
+    def test_should_write_input_file(self, tmp_path):
+        # GIVEN
+        path = str(tmp_path / "input.txt")
+
+        # WHEN
+        write_input(path, 15, size=4, seed=1)
+
+        # THEN
+        with open(path) as f:
+            assert_that(f.readlines(), equal_to(generate(15, size=4, seed=1)))
@@ -0,0 +1,33 @@
+import sys
+
+import pytest
+
+from aoc.util.backend import numpy_available
+
+
+@pytest.fixture
+def source_package(tmp_path, monkeypatch):
+    """
+    `sourcepkg.solver` using `sourcepkg.helper`, itself using `sourcepkg.heap`.
+    """
+    root = tmp_path / "sourcepkg"
+    root.mkdir()
+    (root / "__init__.py").write_text("")
+    (root / "solver.py").write_text("from sourcepkg.helper import helper\n\n\ndef solve():\n    return helper()\n")
+    (root / "helper.py").write_text("from sourcepkg.heap import push\n\n\ndef helper():\n    return push()\n")
+    (root / "heap.py").write_text("def push():\n    return 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield root
+    for name in [name for name in sys.modules if name.split(".")[0] == "sourcepkg"]:
+        del sys.modules[name]
+
+
+@pytest.fixture(params=[
+    pytest.param(False, id="python"),
+    pytest.param(True, id="numpy", marks=pytest.mark.skipif(not numpy_available(), reason="numpy is not installed")),
+])
+def use_numpy(request) -> bool:
+    """
+    Runs a test with the pure python and the numpy versions of the solvers.
+    """
+    return request.param
@@ -1,9 +1,14 @@
+import os
 from typing import List, Iterable
 
+import pytest
 from hamcrest import equal_to, assert_that
 
-from aoc.day1.sonar_sweep import count_increases, count_increases_by_batches
-from aoc.util.input import parse_input_file
+from aoc.day1.sonar_sweep import ChunkSummary, SonarCounter, count_increases, count_increases_by_batches, \
+    count_increases_by_window_sizes, count_increases_in_file, join_summaries, parse_depths, parse_stream, \
+    read_depths
+from aoc.util.backend import NUMPY, PYTHON, forced_backend
+from aoc.util.input import parse_input_file, stream_input_file
 
 
 class TestCountIncreases:
@@ -80,3 +85,183 @@ class TestCountIncreases:
 
         # THEN
         assert_that(res, equal_to(1805))
+
+    def test_should_validate_streamed_input_for_part2(self):
+        # GIVEN
+        measurements = stream_input_file(
+            origin=__file__,
+            filename='input.txt',
+            callback=parse_stream
+        )
+
+        # WHEN
+        res = count_increases_by_batches(measurements, batch_size=3)
+
+        # THEN
+        assert_that(res, equal_to(1805))
+
+
+class TestReadDepths:
+    def test_should_count_increases_of_typed_readings(self, use_numpy):
+        # GIVEN
+        depths = read_depths(os.path.join(os.path.dirname(__file__), "input.txt"), use_numpy=use_numpy)
+
+        # WHEN
+        increases = count_increases(depths)
+        window_increases = count_increases_by_batches(depths, batch_size=3)
+
+        # THEN
+        assert_that(len(depths), equal_to(2000))
+        assert_that(increases, equal_to(1759))
+        assert_that(window_increases, equal_to(1805))
+
+    @pytest.mark.parametrize("content", [b"199\n200\nx208\n210\n", b"199\n2-00\n", b"199\n20.5\n"])
+    def test_should_refuse_malformed_readings(self, use_numpy, content):
+        # WHEN / THEN
+        with pytest.raises(ValueError):
+            parse_depths(content, use_numpy=use_numpy)
+
+    def test_should_refuse_readings_outside_int64(self, use_numpy):
+        # WHEN / THEN
+        with pytest.raises(OverflowError):
+            parse_depths(b"199\n99999999999999999999\n", use_numpy=use_numpy)
+
+    def test_should_parse_readings_at_int64_limits_and_blank_content(self, use_numpy):
+        # WHEN
+        limits = parse_depths(b"-9223372036854775808\n9223372036854775807\n", use_numpy=use_numpy)
+        blank = parse_depths(b" \n\n", use_numpy=use_numpy)
+
+        # THEN
+        assert_that(list(limits), equal_to([-(1 << 63), (1 << 63) - 1]))
+        assert_that(len(blank), equal_to(0))
+
+    def test_should_count_no_increase_when_readings_are_shorter_than_window(self, use_numpy, tmp_path):
+        # GIVEN
+        path = tmp_path / "depths.txt"
+        path.write_text("1\n2\n3\n4\n")
+        depths = read_depths(str(path), use_numpy=use_numpy)
+
+        # WHEN
+        window_increases = count_increases_by_batches(depths, batch_size=5)
+        by_window_sizes = count_increases_by_window_sizes(depths, [1, 5])
+
+        # THEN
+        assert_that(window_increases, equal_to(0))
+        assert_that(by_window_sizes, equal_to({1: 3, 5: 0}))
+
+
+class TestCountIncreasesInFile:
+    @pytest.mark.parametrize("batch_size,expected", [(1, 1759), (3, 1805)])
+    @pytest.mark.parametrize("chunk_size", [1, 50, 1024 * 1024])
+    def test_should_count_input_by_chunks(self, batch_size, expected, chunk_size):
+        # GIVEN
+        path = os.path.join(os.path.dirname(__file__), "input.txt")
+
+        # WHEN
+        res = count_increases_in_file(path, batch_size=batch_size, max_workers=2, chunk_size=chunk_size)
+
+        # THEN
+        assert_that(res, equal_to(expected))
+
+    def test_should_count_chunks_shorter_than_batch(self, use_numpy, tmp_path):
+        # GIVEN
+        measurements = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
+        path = tmp_path / "depths.txt"
+        path.write_text("".join(f"{measurement}\n" for measurement in measurements))
+
+        # WHEN
+        with forced_backend(NUMPY if use_numpy else PYTHON):
+            res = count_increases_in_file(str(path), batch_size=5, max_workers=2, chunk_size=8)
+
+        # THEN
+        assert_that(res, equal_to(count_increases_by_batches(measurements, batch_size=5)))
+
+    def test_should_join_chunks_shorter_than_batch(self):
+        # GIVEN
+        measurements = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
+        chunks = [measurements[:1], measurements[1:3], [], measurements[3:8], measurements[8:]]
+        summaries = [
+            ChunkSummary(increases=sum(map(int.__gt__, chunk[3:], chunk)), head=chunk[:3], tail=chunk[-3:])
+            for chunk in chunks
+        ]
+
+        # WHEN
+        res = join_summaries(summaries, batch_size=3)
+
+        # THEN
+        assert_that(res, equal_to(count_increases_by_batches(measurements, batch_size=3)))
+
+
+class TestCountIncreasesByWindowSizes:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 4, 100])
+    def test_should_count_every_window_size_of_a_stream(self, chunk_size):
+        # GIVEN
+        measurements = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
+
+        # WHEN
+        res = count_increases_by_window_sizes(iter(measurements), [3, 1, 2, 20], chunk_size=chunk_size)
+
+        # THEN
+        assert_that(res, equal_to({1: 7, 2: 5, 3: 5, 20: 0}))
+
+    def test_should_count_every_window_size_of_typed_readings(self, use_numpy):
+        # GIVEN
+        depths = read_depths(os.path.join(os.path.dirname(__file__), "input.txt"), use_numpy=use_numpy)
+
+        # WHEN
+        res = count_increases_by_window_sizes(depths, [1, 3, 3000], chunk_size=100)
+
+        # THEN
+        assert_that(res, equal_to({1: 1759, 3: 1805, 3000: 0}))
+
+    def test_should_count_every_window_size_of_a_range(self):
+        # WHEN
+        res = count_increases_by_window_sizes(range(10), [1, 4], chunk_size=3)
+
+        # THEN
+        assert_that(res, equal_to({1: 9, 4: 6}))
+
+    def test_should_count_input_in_one_pass(self):
+        # GIVEN
+        measurements = stream_input_file(
+            origin=__file__,
+            filename='input.txt',
+            callback=parse_stream
+        )
+
+        # WHEN
+        res = count_increases_by_window_sizes(measurements, [1, 3])
+
+        # THEN
+        assert_that(res, equal_to({1: 1759, 3: 1805}))
+
+
+class TestSonarCounter:
+    def test_should_count_readings_pushed_one_at_a_time_or_by_batches(self):
+        # GIVEN
+        counter = SonarCounter([1, 3, 20])
+
+        # WHEN
+        for reading in [199, 200, 208, 210]:
+            counter.push(reading)
+        counter.extend([200, 207, 240])
+        counter.extend([269, 260, 263])
+
+        # THEN
+        assert_that(counter.readings, equal_to(10))
+        assert_that(counter.increases, equal_to({1: 7, 3: 5, 20: 0}))
+
+    def test_should_count_input_online(self):
+        # GIVEN
+        counter = SonarCounter()
+
+        # WHEN
+        counter.extend(stream_input_file(origin=__file__, filename='input.txt', callback=parse_stream))
+
+        # THEN
+        assert_that(counter.increases, equal_to({1: 1759, 3: 1805}))
+
+    def test_should_refuse_invalid_window_sizes(self):
+        # WHEN / THEN
+        with pytest.raises(ValueError):
+            SonarCounter([0, 3])
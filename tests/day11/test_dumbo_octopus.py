@@ -2,7 +2,7 @@ from typing import Iterable, List
 
 from hamcrest import assert_that, equal_to
 
-from aoc.day11.dumbo_octopus import count_flashes, print_matrix, find_all_octopus_flashes
+from aoc.day11.dumbo_octopus import count_flashes, find_all_octopus_flashes
 from aoc.util.input import parse_input_file
 
 
@@ -78,8 +78,9 @@ class TestDumboOctopus:
         res = count_flashes(matrix, nb_steps=10)
 
         # THEN
-        print_matrix(matrix, 10)
         assert_that(res, equal_to(204))
+        assert_that(matrix[0], equal_to([0, 4, 8, 1, 1, 1, 2, 9, 7, 6]))
+        assert_that(matrix[9], equal_to([0, 0, 3, 2, 2, 4, 0, 0, 0, 0]))
 
     def test_should_count_flashes_for_given_sample(self):
         # GIVEN
@@ -118,7 +119,7 @@ class TestDumboOctopus:
         # THEN
         assert_that(res, equal_to(9))
 
-    def test_should_count_flashes_for_input(self):
+    def test_should_count_flashes_for_input(self, use_numpy):
         # GIVEN
         matrix = parse_input_file(
             origin=__file__,
@@ -127,7 +128,7 @@ class TestDumboOctopus:
         )
 
         # WHEN
-        res = count_flashes(matrix, nb_steps=100)
+        res = count_flashes(matrix, nb_steps=100, use_numpy=use_numpy)
 
         # THEN
         assert_that(res, equal_to(1749))
@@ -153,7 +154,7 @@ class TestDumboOctopus:
         # THEN
         assert_that(res, equal_to(195))
 
-    def test_should_find_all_octopus_flashes_for_input(self):
+    def test_should_find_all_octopus_flashes_for_input(self, use_numpy):
         # GIVEN
         matrix = parse_input_file(
             origin=__file__,
@@ -162,7 +163,7 @@ class TestDumboOctopus:
         )
 
         # WHEN
-        res = find_all_octopus_flashes(matrix)
+        res = find_all_octopus_flashes(matrix, use_numpy=use_numpy)
 
         # THEN
         assert_that(res, equal_to(285))
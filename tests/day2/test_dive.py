@@ -1,9 +1,12 @@
+import os
 from collections.abc import Iterable
 from typing import Tuple
 
+import pytest
 from hamcrest import assert_that, equal_to
 
-from aoc.day2.dive import Direction, calculate_position, calculate_position_with_aim
+from aoc.day2.dive import CourseSummary, Direction, calculate_position, calculate_position_in_file, \
+    calculate_position_with_aim, join_summaries, summarize_course
 from aoc.util.input import parse_input_file
 
 
@@ -81,3 +84,31 @@ forward 2""".splitlines(keepends=True)
 
         # THEN
         assert_that(res, equal_to(1727785422))
+
+
+class TestCalculatePositionInFile:
+    @pytest.mark.parametrize("with_aim,expected", [(False, 1840243), (True, 1727785422)])
+    @pytest.mark.parametrize("chunk_size", [1, 4096, 1024 * 1024])
+    def test_should_calculate_position_for_input_by_chunks(self, with_aim, expected, chunk_size):
+        # GIVEN
+        path = os.path.join(os.path.dirname(__file__), "input.txt")
+
+        # WHEN
+        res = calculate_position_in_file(path, with_aim=with_aim, max_workers=2, chunk_size=chunk_size)
+
+        # THEN
+        assert_that(res, equal_to(expected))
+
+    def test_should_join_summaries_in_order(self):
+        # GIVEN
+        instructions = [
+            (Direction.forward, 5), (Direction.down, 5), (Direction.forward, 8),
+            (Direction.up, 3), (Direction.down, 8), (Direction.forward, 2)
+        ]
+        chunks = [instructions[:1], instructions[1:3], [], instructions[3:5], instructions[5:]]
+
+        # WHEN
+        course = join_summaries(summarize_course(chunk) for chunk in chunks)
+
+        # THEN
+        assert_that(course, equal_to(CourseSummary(x=15, y=60, aim=10)))
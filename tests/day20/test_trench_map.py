@@ -131,7 +131,7 @@ class TestTrenchMap:
         # THEN
         assert_that(res, equal_to(3351))
 
-    def test_should_count_light_pixel_for_given_input(self):
+    def test_should_count_light_pixel_for_given_input(self, use_numpy):
         # GIVEN
         algo, image, x_min, width, y_min, height = parse_input_file(
             origin=__file__,
@@ -140,7 +140,7 @@ class TestTrenchMap:
         )
 
         # WHEN
-        res = count_pixels(algo, image, x_min, width, y_min, height, number_of_steps=2)
+        res = count_pixels(algo, image, x_min, width, y_min, height, number_of_steps=2, use_numpy=use_numpy)
 
         # THEN
         assert_that(res, equal_to(5765))
@@ -91,7 +91,7 @@ on x=10..10,y=10..10,z=10..10
         # THEN
         assert_that(res, equal_to(590784))
 
-    def test_should_compute_count_cubes_for_given_input(self):
+    def test_should_compute_count_cubes_for_given_input(self, use_numpy):
         # GIVEN
         instructions = parse_input_file(
             origin=__file__,
@@ -100,7 +100,7 @@ on x=10..10,y=10..10,z=10..10
         )
 
         # WHEN
-        res = count_cubes(instructions, TestReactorReboot._solution_1_zone())
+        res = count_cubes(instructions, TestReactorReboot._solution_1_zone(), use_numpy=use_numpy)
 
         # THEN
         assert_that(res, equal_to(650099))
@@ -133,7 +133,7 @@ on x=10..10,y=10..10,z=10..10
             )
         )
 
-    def test_should_count_cubes_for_part2_example(self):
+    def test_should_count_cubes_for_part2_example(self, use_numpy):
         # GIVEN
         instructions = TestReactorReboot._parse_input(
             lines="""on x=-5..47,y=-31..22,z=-19..33
@@ -200,7 +200,7 @@ off x=-93533..-4276,y=-16170..68771,z=-104985..-24507
         )
 
         # WHEN
-        res = count_cubes(instructions, None)
+        res = count_cubes(instructions, None, use_numpy=use_numpy)
 
         # THEN
         assert_that(res, equal_to(2758514936282235))
@@ -84,7 +84,7 @@ class TestCalculateOverlap:
         # THEN
         assert_that(res, equal_to(12))
 
-    def test_should_calculate_overlap_for_input_part2(self):
+    def test_should_calculate_overlap_for_input_part2(self, use_numpy):
         # GIVEN
         vents = parse_input_file(
             origin=__file__,
@@ -93,7 +93,7 @@ class TestCalculateOverlap:
         )
 
         # WHEN
-        res = calculate_overlap(vents, threshold=2, include_diagonals=True)
+        res = calculate_overlap(vents, threshold=2, include_diagonals=True, use_numpy=use_numpy)
 
         # THEN
         assert_that(res, equal_to(20196))
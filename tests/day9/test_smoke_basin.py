@@ -34,7 +34,7 @@ class TestSmokeBasin:
         # THEN
         assert_that(res, equal_to(15))
 
-    def test_should_count_low_points_for_input(self):
+    def test_should_count_low_points_for_input(self, use_numpy):
         # GIVEN
         matrix = parse_input_file(
             origin=__file__,
@@ -43,7 +43,7 @@ class TestSmokeBasin:
         )
 
         # WHEN
-        res = count_low_point(matrix)
+        res = count_low_point(matrix, use_numpy=use_numpy)
 
         # THEN
         assert_that(res, equal_to(570))
@@ -65,7 +65,7 @@ class TestSmokeBasin:
         # THEN
         assert_that(res, equal_to(1134))
 
-    def test_should_find_basins_for_input(self):
+    def test_should_find_basins_for_input(self, use_numpy):
         # GIVEN
         matrix = parse_input_file(
             origin=__file__,
@@ -74,7 +74,7 @@ class TestSmokeBasin:
         )
 
         # WHEN
-        res = find_largest_basins(matrix)
+        res = find_largest_basins(matrix, use_numpy=use_numpy)
 
         # THEN
         assert_that(res, equal_to(899392))
@@ -0,0 +1,135 @@
+import importlib
+import os
+import time
+
+from hamcrest import assert_that, equal_to, has_length, is_not, less_than_or_equal_to
+
+from aoc.runner import cache as cache_module
+from aoc.runner.cache import CacheKey, ResultCache, file_sha256, function_key, source_hash
+from aoc.runner.registry import load_solver
+from aoc.runner.runner import default_input_path, find_cached_part, part_cache_key, run_part, read_lines
+
+TESTS_DIR = os.path.dirname(os.path.dirname(__file__))
+
+
+def _key(function: str = "aoc.day1.sonar_sweep.part_1", source: str = "s1", input_hash: str = "i1") -> CacheKey:
+    return CacheKey(function=function, source_hash=source, input_hash=input_hash, parameters="{}")
+
+
+def _age(cache_dir: str, seconds: float):
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        os.utime(path, (time.time() - seconds, time.time() - seconds))
+
+
+class TestResultCache:
+    def test_should_return_stored_value(self, tmp_path):
+        # GIVEN
+        cache = ResultCache(str(tmp_path))
+        cache.put(_key(), 1759)
+
+        # WHEN
+        found, value = ResultCache(str(tmp_path)).get(_key())
+
+        # THEN
+        assert_that(found, equal_to(True))
+        assert_that(value, equal_to(1759))
+
+    def test_should_miss_on_other_input(self, tmp_path):
+        # GIVEN
+        cache = ResultCache(str(tmp_path))
+        cache.put(_key(input_hash="i1"), 1759)
+
+        # WHEN
+        found, _ = cache.get(_key(input_hash="i2"))
+
+        # THEN
+        assert_that(found, equal_to(False))
+
+    def test_should_drop_entries_of_previous_source(self, tmp_path):
+        # GIVEN
+        cache = ResultCache(str(tmp_path))
+        cache.put(_key(source="s1", input_hash="i1"), 1)
+        cache.put(_key(function="aoc.day2.dive.part_1", source="s1"), 2)
+
+        # WHEN
+        cache.put(_key(source="s2", input_hash="i2"), 3)
+
+        # THEN
+        assert_that(cache.get(_key(source="s1", input_hash="i1")), equal_to((False, None)))
+        assert_that(cache.get(_key(function="aoc.day2.dive.part_1", source="s1")), equal_to((True, 2)))
+        assert_that(os.listdir(tmp_path), has_length(2))
+
+    def test_should_evict_least_recently_used(self, tmp_path):
+        # GIVEN
+        value = "x" * 1000
+        cache = ResultCache(str(tmp_path), max_bytes=2500)
+        cache.put(_key(input_hash="i1"), value)
+        cache.put(_key(input_hash="i2"), value)
+        _age(str(tmp_path), 10)
+        cache.get(_key(input_hash="i1"))
+
+        # WHEN
+        cache.put(_key(input_hash="i3"), value)
+
+        # THEN
+        assert_that(cache.get(_key(input_hash="i2"))[0], equal_to(False))
+        assert_that(cache.get(_key(input_hash="i1"))[0], equal_to(True))
+        assert_that(cache.get(_key(input_hash="i3"))[0], equal_to(True))
+        assert_that(cache.size(), less_than_or_equal_to(2500))
+
+    def test_should_key_on_parameters(self):
+        # GIVEN
+        solver = load_solver(22)
+
+        # WHEN
+        without_zone = function_key(solver.module.count_cubes, "i1", zone=None)
+        with_zone = function_key(solver.module.count_cubes, "i1", zone=solver.module.INITIALIZATION_ZONE)
+
+        # THEN
+        assert_that(without_zone.function, equal_to("aoc.day22.reactor_reboot.count_cubes"))
+        assert_that(without_zone.digest, is_not(equal_to(with_zone.digest)))
+
+    def test_should_hash_source_of_aoc_dependencies(self):
+        # GIVEN
+        solver = load_solver(15)
+
+        # WHEN
+        module_hash = source_hash(solver.module)
+
+        # THEN
+        assert_that(module_hash, is_not(equal_to(source_hash(load_solver(1).module))))
+        assert_that(module_hash, has_length(64))
+
+    def test_should_miss_when_second_level_dependency_changes(self, tmp_path, source_package, monkeypatch):
+        # GIVEN
+        cache = ResultCache(str(tmp_path / "cache"))
+        solve = importlib.import_module("sourcepkg.solver").solve
+        cache.put(function_key(solve, "i1"), 1)
+        (source_package / "heap.py").write_text("def push():\n    return 2\n")
+        # the source hashes are kept for the life of the process, as the code does not change while it runs
+        monkeypatch.setattr(cache_module, "_source_hashes", {})
+
+        # WHEN
+        found, _ = cache.get(function_key(solve, "i1"))
+
+        # THEN
+        assert_that(found, equal_to(False))
+
+    def test_should_find_cached_part(self, tmp_path):
+        # GIVEN
+        cache = ResultCache(str(tmp_path))
+        solver = load_solver(1)
+        input_path = default_input_path(TESTS_DIR, 1)
+        input_hash = file_sha256(input_path)
+        result = run_part(solver, 1, read_lines(input_path))
+        cache.put(part_cache_key(solver, 1, input_hash), result.answer)
+
+        # WHEN
+        cached = find_cached_part(cache, solver, 1, input_hash)
+        missing = find_cached_part(cache, solver, 2, input_hash)
+
+        # THEN
+        assert_that(cached.answer, equal_to(1759))
+        assert_that(cached.cached, equal_to(True))
+        assert_that(missing, equal_to(None))
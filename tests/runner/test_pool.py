@@ -0,0 +1,80 @@
+import os
+
+from hamcrest import assert_that, equal_to
+
+from aoc.runner.history import RunHistory
+from aoc.runner.pool import Job, schedule, run_job, run_jobs
+from aoc.runner.runner import default_input_path
+
+TESTS_DIR = os.path.dirname(os.path.dirname(__file__))
+
+
+class TestPool:
+    def test_should_schedule_longest_jobs_first(self):
+        # GIVEN
+        history = RunHistory({"1:1": 0.1, "1:2": 3.0, "2:1": 1.0})
+        jobs = [
+            Job(day=1, part=1, input_path="a"),
+            Job(day=1, part=2, input_path="a"),
+            Job(day=2, part=1, input_path="b"),
+        ]
+
+        # WHEN
+        scheduled = schedule(jobs, history)
+
+        # THEN
+        assert_that([(j.day, j.part) for j in scheduled], equal_to([(1, 2), (2, 1), (1, 1)]))
+
+    def test_should_schedule_unknown_jobs_first(self):
+        # GIVEN
+        history = RunHistory({"1:1": 10.0})
+        jobs = [
+            Job(day=1, part=1, input_path="a"),
+            Job(day=3, part=1, input_path="c"),
+        ]
+
+        # WHEN
+        scheduled = schedule(jobs, history)
+
+        # THEN
+        assert_that([j.day for j in scheduled], equal_to([3, 1]))
+
+    def test_should_run_jobs_in_pool(self):
+        # GIVEN
+        jobs = [
+            Job(day=day, part=part, input_path=default_input_path(TESTS_DIR, day))
+            for day in (1, 2)
+            for part in (1, 2)
+        ]
+
+        # WHEN
+        results = run_jobs(jobs, RunHistory(), max_workers=2)
+
+        # THEN
+        assert_that([r.answer for r in results], equal_to([1759, 1805, 1840243, 1727785422]))
+
+    def test_should_record_durations_in_history(self, tmp_path):
+        # GIVEN
+        jobs = [Job(day=1, part=1, input_path=default_input_path(TESTS_DIR, 1))]
+        history = RunHistory()
+        path = str(tmp_path / "history.json")
+
+        # WHEN
+        history.record(run_jobs(jobs, history, max_workers=1))
+        history.save(path)
+
+        # THEN
+        reloaded = RunHistory.load(path)
+        assert_that(reloaded.duration(1, 1) is not None, equal_to(True))
+        assert_that(reloaded.duration(1, 2), equal_to(None))
+
+    def test_should_attach_instrumentation_to_instrumented_jobs(self):
+        # GIVEN
+        job = Job(day=10, part=2, input_path=default_input_path(TESTS_DIR, 10), instrument=True)
+
+        # WHEN
+        result = run_job(job)
+
+        # THEN
+        assert_that(result.instrumentation["counters"], equal_to({"day10.incomplete_lines": 47}))
+        assert_that(run_job(job._replace(instrument=False)).instrumentation, equal_to(None))
@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+from hamcrest import assert_that, equal_to, greater_than, has_length
+
+from aoc.runner.registry import discover_solvers, load_solver
+
+
+class TestRegistry:
+    def test_should_discover_all_days(self):
+        # WHEN
+        solvers = discover_solvers()
+
+        # THEN
+        assert_that(list(solvers.keys()), equal_to(list(range(1, 24))))
+
+    def test_should_expose_both_parts_when_available(self):
+        # GIVEN
+        solvers = discover_solvers()
+
+        # WHEN
+        day_1_parts = solvers[1].parts
+        day_23_parts = solvers[23].parts
+
+        # THEN
+        assert_that(day_1_parts, equal_to([1, 2]))
+        assert_that(day_23_parts, equal_to([1]))
+
+    def test_should_parse_input_with_day_module(self):
+        # GIVEN
+        solver = discover_solvers()[1]
+
+        # WHEN
+        parsed = solver.parse(["199\n", "200\n", "208\n"])
+
+        # THEN
+        assert_that(parsed, has_length(3))
+        assert_that(solver.name, equal_to("aoc.day1.sonar_sweep"))
+
+    def test_should_not_import_day_modules_when_discovering(self):
+        # WHEN
+        imported = subprocess.run(
+            [
+                sys.executable, "-c",
+                "import sys; from aoc.runner.registry import discover_solvers; discover_solvers(); "
+                "print(sorted(m for m in sys.modules if m.startswith('aoc.day')))"
+            ],
+            check=True,
+            capture_output=True,
+            text=True
+        ).stdout
+
+        # THEN
+        assert_that(imported.strip(), equal_to("[]"))
+
+    def test_should_import_module_on_first_use(self):
+        # GIVEN
+        solver = load_solver(12)
+        loaded_before = solver.loaded
+
+        # WHEN
+        parts = solver.parts
+
+        # THEN
+        assert_that(loaded_before, equal_to(False))
+        assert_that(parts, equal_to([1, 2]))
+        assert_that(solver.loaded, equal_to(True))
+        assert_that(solver.import_time, greater_than(0))
@@ -0,0 +1,93 @@
+import os
+
+import pytest
+from hamcrest import assert_that, equal_to, greater_than, greater_than_or_equal_to, has_item, has_length, \
+    less_than
+
+from aoc.runner.measure import measure
+from aoc.runner.registry import discover_solvers
+from aoc.runner.runner import run_day, run_part, default_input_path
+
+TESTS_DIR = os.path.dirname(os.path.dirname(__file__))
+
+
+class TestRunner:
+    def test_should_run_all_parts_of_a_day_on_its_input(self):
+        # GIVEN
+        solver = discover_solvers()[1]
+
+        # WHEN
+        results = run_day(solver, default_input_path(TESTS_DIR, 1))
+
+        # THEN
+        assert_that([r.answer for r in results], equal_to([1759, 1805]))
+        assert_that([r.part for r in results], equal_to([1, 2]))
+
+    def test_should_measure_part(self):
+        # GIVEN
+        solver = discover_solvers()[6]
+
+        # WHEN
+        result = run_part(solver, 2, ["3,4,3,1,2\n"])
+
+        # THEN
+        assert_that(result.answer, equal_to(26984457539))
+        assert_that(result.measurement.wall_time, greater_than_or_equal_to(0))
+        assert_that(result.measurement.cpu_time, greater_than_or_equal_to(0))
+        assert_that(result.measurement.max_rss, greater_than_or_equal_to(1))
+        assert_that(result.memory, equal_to(None))
+
+    def test_should_not_inherit_peak_memory_of_previous_part(self):
+        # GIVEN
+        _, previous = measure(lambda: len(bytearray(256 * 2 ** 20)))
+        if not previous.rss_per_run:
+            pytest.skip("the peak memory of the process can not be reset")
+
+        # WHEN
+        _, measurement = measure(lambda: 0)
+
+        # THEN
+        assert_that(measurement.max_rss, less_than(previous.max_rss - 128 * 1024))
+
+    def test_should_profile_memory_of_part(self):
+        # GIVEN
+        solver = discover_solvers()[12]
+        lines = ["start-A\n", "start-b\n", "A-c\n", "A-b\n", "b-d\n", "A-end\n", "b-end\n"]
+
+        # WHEN
+        result = run_part(solver, 2, lines, memory=True)
+
+        # THEN
+        assert_that(result.answer, equal_to(36))
+        assert_that(result.memory.peak, greater_than(0))
+        assert_that(result.memory.sites, has_length(greater_than(0)))
+        assert_that([site.location.rsplit(":", 1)[0] for site in result.memory.sites], has_item(solver.module.__file__))
+
+    def test_should_parse_input_again_for_each_part(self):
+        # GIVEN
+        solver = discover_solvers()[9]
+        input_path = default_input_path(TESTS_DIR, 9)
+
+        # WHEN
+        results = run_day(solver, input_path)
+
+        # THEN
+        assert_that([r.answer for r in results], equal_to([570, 899392]))
+
+    def test_should_stream_input_for_line_oriented_days(self):
+        # GIVEN
+        solvers = discover_solvers()
+
+        # WHEN
+        results = {
+            day: [r.answer for r in run_day(solvers[day], default_input_path(TESTS_DIR, day), stream=True)]
+            for day in (1, 2, 8, 10)
+        }
+
+        # THEN
+        assert_that(results, equal_to({
+            1: [1759, 1805],
+            2: [1840243, 1727785422],
+            8: [534, 1070188],
+            10: [413733, 3354640192],
+        }))
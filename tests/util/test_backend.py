@@ -0,0 +1,59 @@
+import subprocess
+import sys
+
+import pytest
+from hamcrest import assert_that, equal_to
+
+from aoc.util.backend import PYTHON, forced_backend, numpy_available, numpy_enabled
+
+
+class TestNumpyEnabled:
+    def test_should_use_numpy_when_installed(self):
+        # WHEN
+        enabled = numpy_enabled()
+        not_automatic = numpy_enabled(auto=False)
+
+        # THEN
+        assert_that(enabled, equal_to(numpy_available()))
+        assert_that(not_automatic, equal_to(False))
+
+    def test_should_force_python(self):
+        # GIVEN
+        with forced_backend(PYTHON):
+            # WHEN
+            enabled = numpy_enabled()
+
+        # THEN
+        assert_that(enabled, equal_to(False))
+        assert_that(numpy_enabled(use_numpy=False), equal_to(False))
+
+    @pytest.mark.skipif(numpy_available(), reason="numpy is installed")
+    def test_should_fail_to_force_missing_numpy(self):
+        # WHEN / THEN
+        with pytest.raises(ValueError):
+            numpy_enabled(use_numpy=True)
+
+    def test_should_reject_unknown_backend(self):
+        # WHEN / THEN
+        with pytest.raises(ValueError):
+            with forced_backend("fortran"):
+                pass
+
+
+class TestLazyImport:
+    def test_should_not_import_numpy_until_selected(self):
+        # GIVEN
+        script = (
+            "import sys, os\n"
+            "import aoc.main, aoc.day1.sonar_sweep, aoc.day5.hydrothermal_venture, aoc.day9.smoke_basin\n"
+            "import aoc.day11.dumbo_octopus, aoc.day20.trench_map, aoc.day22.reactor_reboot\n"
+            "os.environ['AOC_BACKEND'] = 'python'\n"
+            "aoc.day9.smoke_basin.count_low_point([[2, 1], [3, 4]])\n"
+            "print('numpy' in sys.modules)\n"
+        )
+
+        # WHEN
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+
+        # THEN
+        assert_that(output.strip(), equal_to("False"))
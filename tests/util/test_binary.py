@@ -1,6 +1,6 @@
 from hamcrest import assert_that, equal_to
 
-from aoc.util.binary import get_bit_at, turn_on_bit_at
+from aoc.util.binary import BitMatrix, get_bit_at, reverse_bits, turn_on_bit_at
 
 
 class TestGetBitAt:
@@ -33,3 +33,121 @@ class TestTurnOnBitAt:
 
         # THEN
         assert_that(num, equal_to(11))
+
+
+class TestReverseBits:
+    def test_should_reverse_the_lowest_bits(self):
+        # GIVEN
+        num = int('110001', 2)
+
+        # WHEN
+        res = reverse_bits(num, 4)
+
+        # THEN
+        assert_that(res, equal_to(int('1000', 2)))
+
+
+class TestBitMatrix:
+    def test_should_build_the_matrix_from_coordinates(self):
+        # GIVEN
+        coordinates = [(0, 0), (2, 0), (1, 2)]
+
+        # WHEN
+        matrix = BitMatrix.from_coordinates(coordinates)
+
+        # THEN
+        assert_that(matrix.serialize(), equal_to("#.#\n...\n.#."))
+        assert_that(matrix.popcount(), equal_to(3))
+        assert_that(matrix, equal_to(BitMatrix.from_strings(["#.#", "...", ".#."])))
+
+    def test_should_reverse_rows_and_columns(self):
+        # GIVEN
+        matrix = BitMatrix.from_strings(["##..", "...#"])
+
+        # WHEN
+        rows_reversed = matrix.reverse_rows()
+        columns_reversed = matrix.reverse_columns()
+
+        # THEN
+        assert_that(rows_reversed.serialize(), equal_to("...#\n##.."))
+        assert_that(columns_reversed.serialize(), equal_to("..##\n#..."))
+
+    def test_should_fold_rows_and_columns(self):
+        # GIVEN
+        matrix = BitMatrix.from_strings([
+            "#....",
+            ".....",
+            "..#..",
+            "....#",
+            ".#...",
+        ])
+
+        # WHEN
+        folded_rows = matrix.fold_rows(2)
+        folded_columns = matrix.fold_columns(2)
+
+        # THEN
+        assert_that(folded_rows.serialize(), equal_to("##...\n....#"))
+        assert_that(folded_columns.serialize(), equal_to("#.\n..\n..\n#.\n.#"))
+
+    def test_should_fold_rows_along_line_below_last_dot(self):
+        # GIVEN
+        matrix = BitMatrix.from_coordinates([(0, 0), (1, 1)])
+
+        # WHEN
+        folded = matrix.fold_rows(4)
+
+        # THEN
+        assert_that(folded.height, equal_to(4))
+        assert_that(folded.serialize(), equal_to("#.\n.#\n..\n.."))
+
+    def test_should_transpose_and_count_columns(self):
+        # GIVEN
+        matrix = BitMatrix.from_strings(["##.", "#.."])
+
+        # WHEN
+        transposed = matrix.transpose()
+
+        # THEN
+        assert_that(transposed.serialize(), equal_to("##\n#.\n.."))
+        assert_that(matrix.column_counts(), equal_to([2, 1, 0]))
+
+    def test_should_shift_bits(self):
+        # GIVEN
+        matrix = BitMatrix.from_strings(["#..#", ".##."])
+
+        # WHEN
+        left = matrix.shift_left()
+        right = matrix.shift_right()
+        up = matrix.shift_up()
+        down = matrix.shift_down()
+
+        # THEN
+        assert_that(left.serialize(), equal_to("..#.\n##.."))
+        assert_that(right.serialize(), equal_to(".#..\n..##"))
+        assert_that(up.serialize(), equal_to(".##.\n...."))
+        assert_that(down.serialize(), equal_to("....\n#..#"))
+
+    def test_should_count_neighbours(self):
+        # GIVEN
+        matrix = BitMatrix.from_strings([
+            "###",
+            "#.#",
+            "##.",
+        ])
+
+        # WHEN
+        planes = matrix.neighbour_counts()
+        counts = [
+            [sum(plane.get(x, y) << i for i, plane in enumerate(planes)) for x in range(matrix.width)]
+            for y in range(matrix.height)
+        ]
+
+        # THEN
+        assert_that(counts, equal_to([
+            [2, 4, 2],
+            [4, 7, 3],
+            [2, 3, 2],
+        ]))
+        assert_that(matrix.neighbours_equal_to(2).serialize(), equal_to("#.#\n...\n#.#"))
+        assert_that(matrix.neighbours_equal_to(4, diagonals=False).serialize(), equal_to("...\n.#.\n..."))
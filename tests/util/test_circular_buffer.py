@@ -1,6 +1,7 @@
+import pytest
 from hamcrest import assert_that, equal_to
 
-from aoc.util.circular_buffer import CircularBuffer
+from aoc.util.circular_buffer import CircularBuffer, WindowAggregator
 
 
 class TestCircularBuffer:
@@ -21,3 +22,65 @@ class TestCircularBuffer:
         assert_that(push5, equal_to(2))
         assert_that(push6, equal_to(3))
         assert_that(push7, equal_to(4))
+
+    def test_should_peek_previous_pushes(self):
+        # GIVEN
+        buffer = CircularBuffer(length=3, initial=[0, 1, 2])
+
+        # WHEN
+        buffer.push(3)
+
+        # THEN
+        assert_that([buffer.peek(back) for back in (1, 2, 3)], equal_to([3, 2, 1]))
+        with pytest.raises(ValueError):
+            buffer.peek(4)
+
+
+class TestWindowAggregator:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 100])
+    def test_should_aggregate_windows_across_chunks(self, use_numpy, chunk_size):
+        # GIVEN
+        depths = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
+        aggregator = WindowAggregator([1, 3, 4], aggregates=("sum", "min", "max"), use_numpy=use_numpy)
+        sums, mins, maxs = {1: [], 3: [], 4: []}, {1: [], 3: [], 4: []}, {1: [], 3: [], 4: []}
+
+        # WHEN
+        for start in range(0, len(depths), chunk_size):
+            for size, windows in aggregator.push(depths[start:start + chunk_size]).items():
+                sums[size].extend(int(s) for s in windows.sums)
+                mins[size].extend(int(m) for m in windows.mins)
+                maxs[size].extend(int(m) for m in windows.maxs)
+
+        # THEN
+        assert_that(sums[1], equal_to(depths))
+        assert_that(sums[3], equal_to([607, 618, 618, 617, 647, 716, 769, 792]))
+        assert_that(mins[3], equal_to([199, 200, 200, 200, 200, 207, 240, 260]))
+        assert_that(maxs[4], equal_to([210, 210, 210, 240, 269, 269, 269]))
+
+    def test_should_only_compute_requested_aggregates(self):
+        # GIVEN
+        aggregator = WindowAggregator([2], use_numpy=False)
+
+        # WHEN
+        windows = aggregator.push([1, 2, 3])[2]
+
+        # THEN
+        assert_that(list(windows.sums), equal_to([3, 5]))
+        assert_that(windows.mins, equal_to(None))
+
+    def test_should_raise_on_sums_overflowing_int64(self, use_numpy):
+        # GIVEN
+        aggregator = WindowAggregator([1, 2], use_numpy=use_numpy)
+        large = (1 << 62) + 1
+
+        # WHEN / THEN
+        assert_that(list(aggregator.push([large, -large])[2].sums), equal_to([0]))
+        with pytest.raises(OverflowError):
+            aggregator.push([large, large])
+
+    def test_should_refuse_invalid_window_sizes(self):
+        # WHEN / THEN
+        with pytest.raises(ValueError):
+            WindowAggregator([0, 3])
+        with pytest.raises(ValueError):
+            WindowAggregator([3], aggregates=("mean",))
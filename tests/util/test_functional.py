@@ -0,0 +1,69 @@
+import pytest
+from hamcrest import assert_that, equal_to
+
+from aoc.util.functional import Pipeline, compose
+
+
+class TestCompose:
+    def test_should_apply_functions_right_to_left(self):
+        # GIVEN
+        fn = compose(str, abs, int)
+
+        # WHEN
+        res = fn("-3")
+
+        # THEN
+        assert_that(res, equal_to("3"))
+
+
+class TestPipeline:
+    def test_should_map_and_filter_items(self):
+        # GIVEN
+        pipeline = Pipeline().map(str.strip).filter(bool).map(int)
+
+        # WHEN
+        res = list(pipeline(["1\n", " 2", "", "3 "]))
+
+        # THEN
+        assert_that(res, equal_to([1, 2, 3]))
+
+    def test_should_reduce_and_sum_items(self):
+        # GIVEN
+        pipeline = Pipeline().map(int).filter(lambda value: value % 2 == 1)
+
+        # WHEN
+        total = pipeline.sum(["1", "2", "3", "5"])
+        product = pipeline.reduce(lambda accumulator, value: accumulator * value, 1, ["1", "2", "3", "5"])
+
+        # THEN
+        assert_that(total, equal_to(9))
+        assert_that(product, equal_to(15))
+
+    def test_should_keep_previous_pipeline_unchanged(self):
+        # GIVEN
+        pipeline = Pipeline().map(int)
+
+        # WHEN
+        doubled = pipeline.map(lambda value: 2 * value)
+
+        # THEN
+        assert_that(list(pipeline(["1", "2"])), equal_to([1, 2]))
+        assert_that(list(doubled(["1", "2"])), equal_to([2, 4]))
+
+    def test_should_process_items_by_batches(self):
+        # GIVEN
+        pipeline = Pipeline().filter(lambda value: value != 3).map(lambda value: value * 10)
+
+        # WHEN
+        res = list(pipeline.batches(iter(range(6)), 2))
+
+        # THEN
+        assert_that(res, equal_to([[0, 10], [20], [40, 50]]))
+
+    def test_should_reject_empty_batches(self):
+        # GIVEN
+        pipeline = Pipeline()
+
+        # WHEN / THEN
+        with pytest.raises(ValueError):
+            list(pipeline.batches([1], 0))
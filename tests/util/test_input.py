@@ -0,0 +1,150 @@
+import importlib
+import os
+from typing import List
+
+from hamcrest import assert_that, equal_to, has_length, is_not
+
+# noinspection PyProtectedMember
+from aoc.util.input import iterate_lines, iterate_paragraphs, iterate_records, line_aligned_ranges, load_parsed, \
+    parse_input_file, parsed_input_path, read_range, stream_input_file, _parser_hash
+
+
+def _parse_ints(lines: List[str]) -> List[int]:
+    return [int(line) for line in lines]
+
+
+class TestInput:
+    def test_should_iterate_lines_like_readlines(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "input.txt"
+        path.write_text("199\n200\n\n208")
+
+        # WHEN
+        lines = list(iterate_lines(str(path)))
+
+        # THEN
+        assert_that(lines, equal_to(["199\n", "200\n", "\n", "208"]))
+
+    def test_should_iterate_nothing_for_empty_file(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "input.txt"
+        path.write_text("")
+
+        # WHEN
+        lines = list(iterate_lines(str(path)))
+        records = list(iterate_records(str(path), 4))
+        ranges = line_aligned_ranges(str(path), 4)
+
+        # THEN
+        assert_that(lines, equal_to([]))
+        assert_that(records, equal_to([]))
+        assert_that(ranges, equal_to([]))
+        assert_that(read_range(str(path), 0, 0), equal_to(b""))
+
+    def test_should_iterate_fixed_size_records(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "input.bin"
+        path.write_bytes(b"abcdefghij")
+
+        # WHEN
+        records = list(iterate_records(str(path), 4))
+
+        # THEN
+        assert_that(records, equal_to([b"abcd", b"efgh", b"ij"]))
+
+    def test_should_split_file_on_line_endings(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "input.txt"
+        path.write_text("12\n3\n456\n7")
+
+        # WHEN
+        ranges = line_aligned_ranges(str(path), 3)
+
+        # THEN
+        assert_that(ranges, equal_to([(0, 3), (3, 9), (9, 10)]))
+        chunks = [read_range(str(path), start, end) for start, end in ranges]
+        assert_that(chunks, equal_to([b"12\n", b"3\n456\n", b"7"]))
+
+    def test_should_iterate_paragraphs(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "input.txt"
+        path.write_text("7,4,9\n\n22 13\n 8  2\n\n\n3 15\n")
+
+        # WHEN
+        paragraphs = [bytes(paragraph) for paragraph in iterate_paragraphs(str(path))]
+
+        # THEN
+        assert_that(paragraphs, equal_to([b"7,4,9", b"22 13\n 8  2", b"3 15"]))
+
+    def test_should_stop_iterating_paragraphs_early(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "input.txt"
+        path.write_text("a\n\nb\n")
+        paragraphs = iterate_paragraphs(str(path))
+
+        # WHEN
+        first = bytes(next(paragraphs))
+        paragraphs.close()
+
+        # THEN
+        assert_that(first, equal_to(b"a"))
+
+    def test_should_stream_the_same_lines_as_parse(self):
+        # WHEN
+        streamed = stream_input_file(origin=__file__, filename="../day1/input.txt", callback=list)
+        parsed = parse_input_file(origin=__file__, filename="../day1/input.txt", callback=list)
+
+        # THEN
+        assert_that(streamed, equal_to(parsed))
+
+    def test_should_read_back_parsed_input(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "input.txt"
+        path.write_text("199\n200\n208\n")
+        calls = []
+
+        def _parse(lines: List[str]) -> List[int]:
+            calls.append(lines)
+            return _parse_ints(lines)
+
+        # WHEN
+        first = load_parsed(str(path), _parse)
+        second = load_parsed(str(path), _parse)
+
+        # THEN
+        assert_that(first, equal_to([199, 200, 208]))
+        assert_that(second, equal_to(first))
+        assert_that(calls, has_length(1))
+        assert_that(os.path.exists(parsed_input_path(str(path), _parse)), equal_to(True))
+
+    def test_should_parse_again_when_parser_helper_changes(self, tmp_path, source_package):
+        # GIVEN
+        (source_package / "parser.py").write_text(
+            "from sourcepkg.heap import push\n\n\ndef parse(lines):\n    return [int(line) + push() for line in lines]\n"
+        )
+        parse = importlib.import_module("sourcepkg.parser").parse
+        path = tmp_path / "input.txt"
+        path.write_text("199\n200\n")
+        load_parsed(str(path), parse)
+        previous_path = parsed_input_path(str(path), parse)
+
+        # WHEN
+        (source_package / "heap.py").write_text("def push():\n    return 2\n")
+        _parser_hash.cache_clear()
+
+        # THEN
+        assert_that(parsed_input_path(str(path), parse), is_not(equal_to(previous_path)))
+
+    def test_should_parse_again_when_input_changes(self, tmp_path):
+        # GIVEN
+        path = tmp_path / "input.txt"
+        path.write_text("199\n200\n")
+        load_parsed(str(path), _parse_ints)
+        path.write_text("199\n300\n")
+
+        # WHEN
+        parsed = load_parsed(str(path), _parse_ints)
+
+        # THEN
+        assert_that(parsed, equal_to([199, 300]))
+        assert_that([name for name in os.listdir(tmp_path) if name.endswith(".parsed")], has_length(1))
@@ -0,0 +1,72 @@
+import json
+
+from hamcrest import assert_that, equal_to, has_length
+
+from aoc.day12.passage_pathing import count_paths
+from aoc.util.instrumentation import INSTRUMENTATION, Instrumentation
+
+
+class TestInstrumentation:
+    def test_should_record_nothing_when_disabled(self):
+        # GIVEN
+        instrumentation = Instrumentation()
+
+        # WHEN
+        instrumentation.count("calls")
+        with instrumentation.timer("block"):
+            pass
+        instrumentation.trace("event", value=1)
+
+        # THEN
+        assert_that(instrumentation.snapshot(), equal_to({"counters": {}, "timers": {}, "events": []}))
+
+    def test_should_record_counters_and_timers_when_enabled(self):
+        # GIVEN
+        instrumentation = Instrumentation()
+        instrumentation.enable()
+
+        # WHEN
+        instrumentation.count("calls")
+        instrumentation.count("calls", 2)
+        for _ in range(3):
+            with instrumentation.timer("block"):
+                pass
+        instrumentation.trace("event", value=1)
+
+        # THEN
+        snapshot = instrumentation.snapshot()
+        assert_that(snapshot["counters"], equal_to({"calls": 3}))
+        assert_that(snapshot["timers"]["block"]["count"], equal_to(3))
+        assert_that(snapshot["events"], equal_to([]))
+
+    def test_should_export_trace_events_as_json(self, tmp_path):
+        # GIVEN
+        instrumentation = Instrumentation()
+        instrumentation.enable(trace=True)
+        instrumentation.trace("match", scanners=(0, 1))
+        path = tmp_path / "instrumentation.json"
+
+        # WHEN
+        instrumentation.export(str(path))
+
+        # THEN
+        events = json.loads(path.read_text())["events"]
+        assert_that(events, has_length(1))
+        assert_that(events[0]["scanners"], equal_to([0, 1]))
+
+    def test_should_trace_solver_events(self):
+        # GIVEN
+        INSTRUMENTATION.reset()
+        INSTRUMENTATION.enable(trace=True)
+
+        # WHEN
+        try:
+            count_paths([("start", "A"), ("start", "b"), ("A", "b"), ("A", "end"), ("b", "end")])
+        finally:
+            INSTRUMENTATION.disable()
+
+        # THEN
+        events = INSTRUMENTATION.snapshot()["events"]
+        INSTRUMENTATION.reset()
+        assert_that([event["name"] for event in events], equal_to(["day12.paths"]))
+        assert_that(events[0]["paths"], has_length(5))
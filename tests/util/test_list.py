@@ -1,6 +1,6 @@
 from hamcrest import assert_that, equal_to
 
-from aoc.util.list import flat_map
+from aoc.util.list import flat_map, iterate_flat_map
 
 
 class TestFlatMap:
@@ -13,3 +13,23 @@ class TestFlatMap:
 
         # THEN
         assert_that(res, equal_to([1, 2, 3, 4, 5]))
+
+
+class TestIterateFlatMap:
+    def test_should_flatten_lazily(self):
+        # GIVEN
+        consumed = []
+
+        def rows():
+            for row in [[1, 2], [3]]:
+                consumed.append(row)
+                yield row
+
+        # WHEN
+        res = iterate_flat_map(rows())
+        first = next(res)
+
+        # THEN
+        assert_that(first, equal_to(1))
+        assert_that(consumed, equal_to([[1, 2]]))
+        assert_that(list(res), equal_to([2, 3]))
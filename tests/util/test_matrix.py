@@ -1,6 +1,7 @@
-from hamcrest import assert_that, equal_to
+import pytest
+from hamcrest import assert_that, equal_to, has_length
 
-from aoc.util.matrix import initialize_matrix
+from aoc.util.matrix import Grid, initialize_matrix, serialize_matrix
 
 
 class TestInitializeMatrix:
@@ -43,3 +44,74 @@ class TestInitializeMatrix:
                 [0, 0, 0, 0]
             ])
         )
+
+
+class TestGrid:
+    def test_should_read_and_write_cells(self):
+        # GIVEN
+        grid = Grid.from_rows([[1, 2, 3], [4, 5, 6]])
+
+        # WHEN
+        grid.set(2, 1, 9)
+        grid[0] = 7
+
+        # THEN
+        assert_that((grid.width, grid.height), equal_to((3, 2)))
+        assert_that(grid.get(1, 1), equal_to(5))
+        assert_that(grid.rows(), equal_to([[7, 2, 3], [4, 5, 9]]))
+        assert_that(grid.coordinates(grid.index(2, 1)), equal_to((2, 1)))
+
+    def test_should_find_neighbours_inside_the_grid(self):
+        # GIVEN
+        grid = Grid(4, 3)
+
+        # WHEN
+        corner_4 = grid.neighbours_4(grid.index(0, 0))
+        edge_4 = grid.neighbours_4(grid.index(3, 1))
+        center_8 = grid.neighbours_8(grid.index(1, 1))
+        corner_8 = grid.neighbours_8(grid.index(3, 2))
+
+        # THEN
+        assert_that(sorted(corner_4), equal_to([grid.index(1, 0), grid.index(0, 1)]))
+        assert_that(sorted(edge_4), equal_to([grid.index(3, 0), grid.index(2, 1), grid.index(3, 2)]))
+        assert_that(center_8, has_length(8))
+        assert_that(sorted(corner_8), equal_to([grid.index(2, 1), grid.index(3, 1), grid.index(2, 2)]))
+
+    def test_should_fill_copy_and_serialize(self):
+        # GIVEN
+        grid = Grid(3, 2, fill=-1, typecode='i')
+        copy = grid.copy()
+
+        # WHEN
+        grid.fill(4)
+
+        # THEN
+        assert_that(grid.serialize(), equal_to(serialize_matrix([[4, 4, 4], [4, 4, 4]])))
+        assert_that(copy.rows(), equal_to([[-1, -1, -1], [-1, -1, -1]]))
+        assert_that(copy == grid, equal_to(False))
+        assert_that(copy.neighbours_4(0), equal_to(grid.neighbours_4(0)))
+
+    def test_should_store_a_byte_per_cell(self):
+        # GIVEN
+        rows = initialize_matrix(9, 100)
+
+        # WHEN
+        grid = Grid.from_rows(rows)
+
+        # THEN
+        assert_that(grid.cells.itemsize * len(grid), equal_to(100 * 100))
+
+    def test_should_refuse_ragged_rows(self):
+        # WHEN / THEN
+        with pytest.raises(ValueError):
+            Grid.from_rows([[1, 2, 3], [4, 5]])
+
+    def test_should_list_rows_of_empty_width_grid(self):
+        # GIVEN
+        grid = Grid.from_rows([[], []])
+
+        # WHEN
+        rows = grid.rows()
+
+        # THEN
+        assert_that(rows, equal_to([[], []]))
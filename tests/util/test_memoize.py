@@ -0,0 +1,99 @@
+import pytest
+from hamcrest import assert_that, equal_to
+
+from aoc.util.instrumentation import INSTRUMENTATION
+from aoc.util.memoize import LFU, BoundedCache, memoize
+
+
+class TestBoundedCache:
+    def test_should_evict_least_recently_used_entry(self):
+        # GIVEN
+        cache = BoundedCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+
+        # WHEN
+        cache.put("c", 3)
+
+        # THEN
+        assert_that("a" in cache, equal_to(True))
+        assert_that("b" in cache, equal_to(False))
+        assert_that("c" in cache, equal_to(True))
+        assert_that(cache.stats().evictions, equal_to(1))
+
+    def test_should_evict_least_frequently_used_entry(self):
+        # GIVEN
+        cache = BoundedCache(max_entries=2, policy=LFU)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.get("b")
+        cache.get("b")
+
+        # WHEN
+        cache.put("c", 3)
+        cache.put("d", 4)
+
+        # THEN
+        assert_that(sorted(key for key in "abcd" if key in cache), equal_to(["b", "d"]))
+
+    def test_should_evict_until_estimated_size_fits(self):
+        # GIVEN
+        cache = BoundedCache(max_bytes=25, sizeof=lambda key, value: value)
+        cache.put("a", 10)
+        cache.put("b", 10)
+
+        # WHEN
+        cache.put("c", 20)
+        cache.put("d", 30)
+
+        # THEN
+        assert_that(len(cache), equal_to(0))
+        assert_that(cache.stats().evictions, equal_to(4))
+
+    def test_should_count_hits_and_misses(self):
+        # GIVEN
+        cache = BoundedCache()
+        cache.put("a", 1)
+
+        # WHEN
+        values = [cache.get("a"), cache.get("b", 0), cache.get("a")]
+
+        # THEN
+        assert_that(values, equal_to([1, 0, 1]))
+        assert_that(cache.stats().hits, equal_to(2))
+        assert_that(cache.stats().misses, equal_to(1))
+        assert_that(cache.stats().hit_rate, equal_to(2 / 3))
+
+    def test_should_reject_unknown_policy(self):
+        # WHEN / THEN
+        with pytest.raises(ValueError):
+            BoundedCache(policy="fifo")
+
+
+class TestMemoize:
+    def test_should_call_function_once_per_arguments(self):
+        # GIVEN
+        calls = []
+
+        @memoize(max_entries=10, name="square")
+        def square(value: int) -> int:
+            calls.append(value)
+            return value * value
+
+        # WHEN
+        INSTRUMENTATION.reset()
+        INSTRUMENTATION.enable()
+        try:
+            res = [square(2), square(3), square(2), square(value=2)]
+        finally:
+            INSTRUMENTATION.disable()
+
+        # THEN
+        counters = INSTRUMENTATION.snapshot()["counters"]
+        INSTRUMENTATION.reset()
+        assert_that(res, equal_to([4, 9, 4, 4]))
+        assert_that(calls, equal_to([2, 3, 2]))
+        assert_that(square.cache.stats().entries, equal_to(3))
+        assert_that(counters, equal_to({"square.misses": 3, "square.hits": 1}))
@@ -0,0 +1,76 @@
+from typing import NamedTuple
+
+import pytest
+from hamcrest import assert_that, equal_to, instance_of, less_than
+
+from aoc.day19.beacon_scanner import Coordinate
+from aoc.util import packed as packed_module
+from aoc.util.packed import pack, unpack
+
+
+class _Instruction(NamedTuple):
+    on: bool
+    x: int
+
+
+class TestPacked:
+    @pytest.mark.parametrize("value", [
+        [199, 200, 208, -1 << 40],
+        (1, 2),
+        [[1, 2, 3], [], [4]],
+        [(309, 320), (32, 761)],
+        [[Coordinate(404, -588, -901), Coordinate(528, -643, 409)], [Coordinate(-1, 2, 3)]],
+        ([(1, 2)], [("x", 655), ("y", 447)]),
+        {"CH": [1, 2], "HH": "N"},
+        [_Instruction(True, 3), _Instruction(False, 1 << 70)],
+        ("A", None, "B"),
+        [],
+        1 << 80,
+    ])
+    def test_should_read_back_packed_value(self, value):
+        # WHEN
+        res = unpack(pack(value))
+
+        # THEN
+        assert_that(res, equal_to(value))
+        assert_that(res, instance_of(type(value)))
+
+    def test_should_keep_named_tuples(self):
+        # GIVEN
+        scanners = [[Coordinate(404, -588, -901)]]
+
+        # WHEN
+        res = unpack(pack(scanners))
+
+        # THEN
+        assert_that(res[0][0], instance_of(Coordinate))
+        assert_that(res[0][0].z, equal_to(-901))
+
+    def test_should_store_small_ints_in_bytes(self):
+        # GIVEN
+        matrix = [[i % 10 for i in range(100)] for _ in range(100)]
+
+        # WHEN
+        packed = pack(matrix)
+
+        # THEN
+        assert_that(len(packed), less_than(100 * 100 + 200 * 1 + 16))
+        assert_that(unpack(memoryview(packed)), equal_to(matrix))
+
+    def test_should_store_arrays_little_endian(self):
+        # WHEN
+        packed = pack([1000, -2])
+
+        # THEN
+        assert_that(packed[-4:], equal_to(b"\xe8\x03\xfe\xff"))
+
+    def test_should_read_back_arrays_swapped_on_big_endian_hosts(self, monkeypatch):
+        # GIVEN
+        monkeypatch.setattr(packed_module, "_BIG_ENDIAN", True)
+        value = [[1000, -2, 1 << 40], [Coordinate(404, -588, -901)]]
+
+        # WHEN
+        res = unpack(pack(value))
+
+        # THEN
+        assert_that(res, equal_to(value))
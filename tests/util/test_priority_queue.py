@@ -0,0 +1,131 @@
+import random
+
+import pytest
+from hamcrest import assert_that, equal_to
+
+from aoc.util.priority_queue import BucketQueue, IndexedPriorityQueue, PriorityQueue
+
+
+class TestIndexedPriorityQueue:
+    def test_should_update_priority_in_place(self):
+        # GIVEN
+        queue = IndexedPriorityQueue()
+        queue.push("a", 5)
+        queue.push("b", 3)
+        queue.push("c", 4)
+
+        # WHEN
+        queue.push("a", 1)
+        queue.push("b", 9)
+
+        # THEN
+        assert_that(queue.length(), equal_to(3))
+        assert_that([queue.pop() for _ in range(3)], equal_to(["a", "c", "b"]))
+
+    @pytest.mark.parametrize("arity", [2, 3, 4, 8])
+    def test_should_pop_in_same_order_as_priority_queue(self, arity):
+        # GIVEN
+        rnd = random.Random(arity)
+        indexed = IndexedPriorityQueue(arity)
+        reference = PriorityQueue()
+        popped, expected = [], []
+
+        # WHEN
+        for _ in range(2000):
+            if rnd.random() < 0.3 and reference.length() > 0:
+                popped.append(indexed.pop())
+                expected.append(reference.pop())
+            else:
+                value, priority = rnd.randrange(200), rnd.randrange(50)
+                indexed.push(value, priority)
+                reference.push(value, priority)
+            assert_that(indexed.length(), equal_to(reference.length()))
+
+        # THEN
+        assert_that(popped, equal_to(expected))
+
+    def test_should_fail_to_pop_empty_queue(self):
+        # GIVEN
+        queue = IndexedPriorityQueue()
+
+        # WHEN / THEN
+        with pytest.raises(KeyError):
+            queue.pop()
+
+
+class TestBucketQueue:
+    def test_should_pop_by_increasing_priority(self):
+        # GIVEN
+        queue = BucketQueue(max_increment=9)
+        queue.push("c", 9)
+        queue.push("a", 1)
+        queue.push("b", 4)
+
+        # WHEN
+        popped = [queue.pop() for _ in range(queue.length())]
+
+        # THEN
+        assert_that(popped, equal_to(["a", "b", "c"]))
+        assert_that(queue.length(), equal_to(0))
+
+    def test_should_move_value_when_priority_changes(self):
+        # GIVEN
+        queue = BucketQueue(max_increment=9)
+        queue.push("a", 8)
+        queue.push("b", 5)
+
+        # WHEN
+        queue.push("a", 2)
+
+        # THEN
+        assert_that(queue.length(), equal_to(2))
+        assert_that([queue.pop(), queue.pop()], equal_to(["a", "b"]))
+
+    def test_should_reuse_buckets_past_the_window(self):
+        # GIVEN
+        queue = BucketQueue(max_increment=3)
+        popped = []
+        queue.push(0, 0)
+
+        # WHEN
+        for value in range(1, 10):
+            popped.append(queue.pop())
+            queue.push(value, value * 2)
+            queue.push(-value, value * 2 + 1)
+            popped.append(queue.pop())
+
+        # THEN
+        assert_that(popped[:4], equal_to([0, 1, -1, 2]))
+        assert_that(queue.length(), equal_to(1))
+
+    def test_should_refuse_priority_out_of_window(self):
+        # GIVEN
+        queue = BucketQueue(max_increment=9, start=10)
+
+        # WHEN / THEN
+        with pytest.raises(ValueError):
+            queue.push("a", 9)
+        with pytest.raises(ValueError):
+            queue.push("a", 20)
+
+    def test_should_fail_to_pop_empty_queue(self):
+        # GIVEN
+        queue = BucketQueue(max_increment=1)
+
+        # WHEN / THEN
+        with pytest.raises(KeyError):
+            queue.pop()
+
+    def test_should_pop_in_same_order_as_priority_queue(self):
+        # GIVEN
+        bucket_queue = BucketQueue(max_increment=9)
+        priority_queue = PriorityQueue()
+        for value, priority in enumerate([5, 1, 9, 3, 7, 2]):
+            bucket_queue.push(value, priority)
+            priority_queue.push(value, priority)
+
+        # WHEN
+        popped = [bucket_queue.pop() for _ in range(bucket_queue.length())]
+
+        # THEN
+        assert_that(popped, equal_to([priority_queue.pop() for _ in range(priority_queue.length())]))
@@ -0,0 +1,86 @@
+from hamcrest import assert_that, equal_to
+
+from aoc.util.priority_queue import BucketQueue, IndexedPriorityQueue
+from aoc.util.search import breadth_first, shortest_path
+
+# a -> b -> d costs 2, a -> c -> d costs 9 and a -> c -> b -> d costs 6
+GRAPH = {
+    "a": [("b", 1), ("c", 4)],
+    "b": [("d", 1)],
+    "c": [("b", 1), ("d", 5)],
+    "d": [],
+}
+
+
+class TestShortestPath:
+    def test_should_find_cheapest_path(self):
+        # GIVEN
+        neighbours = GRAPH.__getitem__
+
+        # WHEN
+        result = shortest_path("a", "d".__eq__, neighbours, with_path=True)
+
+        # THEN
+        assert_that(result.cost, equal_to(2))
+        assert_that(result.target, equal_to("d"))
+        assert_that(result.path, equal_to(["a", "b", "d"]))
+        assert_that(result.expanded, equal_to(3))
+
+    def test_should_find_same_cost_with_any_frontier(self):
+        # GIVEN
+        frontiers = [IndexedPriorityQueue(), BucketQueue(max_increment=5)]
+
+        # WHEN
+        costs = [shortest_path("a", "d".__eq__, GRAPH.__getitem__, frontier=frontier).cost for frontier in frontiers]
+
+        # THEN
+        assert_that(costs, equal_to([2, 2]))
+
+    def test_should_expand_less_with_heuristic(self):
+        # GIVEN
+        size = 10
+        start = (size // 2, 0)
+        target = (size - 1, 0)
+
+        def neighbours(node):
+            x, y = node
+            return [((x + dx, y + dy), 1) for dx, dy in ((1, 0), (0, 1), (-1, 0), (0, -1))
+                    if 0 <= x + dx < size and 0 <= y + dy < size]
+
+        def manhattan(node):
+            return abs(target[0] - node[0]) + abs(target[1] - node[1])
+
+        # WHEN
+        dijkstra = shortest_path(start, target.__eq__, neighbours)
+        a_star = shortest_path(start, target.__eq__, neighbours, heuristic=manhattan)
+
+        # THEN
+        assert_that(dijkstra.cost, equal_to(4))
+        assert_that(a_star.cost, equal_to(4))
+        assert_that(a_star.expanded < dijkstra.expanded, equal_to(True))
+
+    def test_should_not_find_unreachable_target(self):
+        # GIVEN
+        neighbours = GRAPH.__getitem__
+
+        # WHEN
+        result = shortest_path("b", "a".__eq__, neighbours, with_path=True)
+
+        # THEN
+        assert_that(result.cost, equal_to(None))
+        assert_that(result.path, equal_to(None))
+        assert_that(result.expanded, equal_to(2))
+
+
+class TestBreadthFirst:
+    def test_should_visit_nodes_by_level(self):
+        # GIVEN
+        successors = {1: [2, 3], 2: [4], 3: [4], 4: []}.__getitem__
+
+        # WHEN
+        visited = list(breadth_first([1], successors))
+        unique = list(breadth_first([1], successors, unique=True))
+
+        # THEN
+        assert_that(visited, equal_to([1, 2, 3, 4, 4]))
+        assert_that(unique, equal_to([1, 2, 3, 4]))
@@ -0,0 +1,30 @@
+import importlib
+
+from hamcrest import assert_that, equal_to, has_item, is_not
+
+from aoc.runner.registry import load_solver
+from aoc.util.source import hash_sources, module_dependencies
+
+
+class TestSource:
+    def test_should_find_transitive_dependencies(self):
+        # GIVEN
+        solver = load_solver(23)
+
+        # WHEN
+        dependencies = [module.__name__ for module in module_dependencies(solver.module)]
+
+        # THEN
+        assert_that(dependencies, has_item("aoc.util.search"))
+        assert_that(dependencies, has_item("aoc.util.priority_queue"))
+
+    def test_should_change_hash_when_second_level_dependency_changes(self, source_package):
+        # GIVEN
+        solver = importlib.import_module("sourcepkg.solver")
+        before = hash_sources(solver)
+
+        # WHEN
+        (source_package / "heap.py").write_text("def push():\n    return 2\n")
+
+        # THEN
+        assert_that(hash_sources(solver), is_not(equal_to(before)))
@@ -0,0 +1,40 @@
+from hamcrest import assert_that, equal_to
+
+from aoc.util.text import generate_paragraph_views, generate_paragraphs
+
+
+class TestGenerateParagraphs:
+    def test_should_split_lines_on_blank_lines(self):
+        # GIVEN
+        lines = ["a\n", "b \n", "\n", "\n", "c\n"]
+
+        # WHEN
+        res = list(generate_paragraphs(lines))
+
+        # THEN
+        assert_that(res, equal_to([["a", "b"], ["c"]]))
+
+
+class TestGenerateParagraphViews:
+    def test_should_split_buffer_on_blank_lines(self):
+        # GIVEN
+        buffer = b"\n--- scanner 0 ---\n1,2,3\n  \n--- scanner 1 ---\r\n4,5,6\r\n\r\n"
+
+        # WHEN
+        res = [str(view, "utf-8").splitlines() for view in generate_paragraph_views(buffer)]
+
+        # THEN
+        assert_that(res, equal_to([["--- scanner 0 ---", "1,2,3"], ["--- scanner 1 ---", "4,5,6"]]))
+
+    def test_should_not_copy_the_buffer(self):
+        # GIVEN
+        buffer = bytearray(b"ab\n\ncd")
+
+        # WHEN
+        first, second = generate_paragraph_views(buffer)
+        buffer[0:1] = b"x"
+
+        # THEN
+        assert_that(first.obj, equal_to(buffer))
+        assert_that(bytes(first), equal_to(b"xb"))
+        assert_that(bytes(second), equal_to(b"cd"))